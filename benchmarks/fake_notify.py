@@ -0,0 +1,71 @@
+"""In-process stand-in for the Companion App notify services.
+
+Registriert `notify.mobile_app_<gerät>` in einer echten Home-Assistant-Instanz,
+ohne dass ein Telefon oder Push-Server beteiligt ist:
+- Latenz und Jitter pro Aufruf (normalverteilt, nie negativ)
+- Fehlerrate: Aufrufe schlagen zufällig mit `HomeAssistantError` fehl
+- zählt Aufrufe und Fehler pro Gerät
+"""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+import random
+
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError
+
+
+@dataclass
+class FakeNotifyStats:
+    """Calls and failures of one fake device."""
+
+    calls: int = 0
+    failures: int = 0
+
+
+@dataclass
+class FakeNotify:
+    """Fake `notify.mobile_app_*` services with configurable behaviour."""
+
+    latency: float = 0.05
+    jitter: float = 0.01
+    failure_rate: float = 0.0
+    seed: int | None = None
+    stats: dict[str, FakeNotifyStats] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        """Create the random generator (seeded for reproducible runs)."""
+        self._random = random.Random(self.seed)
+
+    def register(self, hass: HomeAssistant, devices: list[str]) -> None:
+        """Register one fake notify service per device."""
+        for device in devices:
+            self.stats[device] = FakeNotifyStats()
+            hass.services.async_register(
+                "notify", f"mobile_app_{device}", self._handler(device)
+            )
+
+    def _handler(self, device: str):
+        """Return the service handler of one device."""
+
+        async def _async_notify(call: ServiceCall) -> None:
+            stats = self.stats[device]
+            stats.calls += 1
+            delay = max(self._random.gauss(self.latency, self.jitter), 0)
+            await asyncio.sleep(delay)
+            if self._random.random() < self.failure_rate:
+                stats.failures += 1
+                raise HomeAssistantError(f"Simulated failure of {device}")
+
+        return _async_notify
+
+    @property
+    def calls(self) -> int:
+        """Return the calls over all devices."""
+        return sum(stats.calls for stats in self.stats.values())
+
+    @property
+    def failures(self) -> int:
+        """Return the failures over all devices."""
+        return sum(stats.failures for stats in self.stats.values())
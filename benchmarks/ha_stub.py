@@ -0,0 +1,146 @@
+"""Minimal stand-in for the `homeassistant` package used by the benchmarks.
+
+Every module under `homeassistant` is created on demand and answers any
+attribute with a harmless placeholder, so the integration modules can be
+imported (and their import cost measured) without Home Assistant installed.
+The stub itself is tiny, so the numbers are dominated by the integration.
+
+`voluptuous` is a dependency of Home Assistant and always loaded before an
+integration: it is imported up front if installed, otherwise stubbed the
+same way (schemas then become placeholders).
+"""
+from __future__ import annotations
+
+import importlib
+import importlib.abc
+import importlib.machinery
+import importlib.util
+import sys
+import types
+from typing import Any
+
+STUB_ROOT = "homeassistant"
+# Loaded by Home Assistant itself, stubbed only if not installed
+OPTIONAL_ROOTS = ("voluptuous",)
+
+
+def _passthrough(*args: Any, **kwargs: Any) -> Any:
+    """Act as decorator (return the decorated object) or as factory."""
+    if len(args) == 1 and not kwargs and callable(args[0]):
+        return args[0]
+    return _Placeholder()
+
+
+class _Placeholder:
+    """Value that supports attribute access, calls, indexing and operators."""
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _Placeholder()
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return _passthrough(*args, **kwargs)
+
+    def __getitem__(self, key: Any) -> Any:
+        return _Placeholder()
+
+    def __or__(self, other: Any) -> Any:
+        return self
+
+    __ror__ = __or__
+
+    def __iter__(self):
+        return iter(())
+
+
+class _StubMeta(type):
+    """Metaclass so that class attributes like `Platform.SENSOR` resolve."""
+
+    def __getattr__(cls, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return name.lower()
+
+    def __getitem__(cls, key: Any) -> Any:
+        return cls
+
+
+def _stub_class(name: str) -> type:
+    """Return a subclassable placeholder class."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        # e.g. `class Flow(ConfigFlow, domain=DOMAIN)`
+        pass
+
+    return _StubMeta(
+        name,
+        (),
+        {
+            "__init__": __init__,
+            "__init_subclass__": classmethod(__init_subclass__),
+            "__module__": STUB_ROOT,
+        },
+    )
+
+
+class _StubModule(types.ModuleType):
+    """Module that creates placeholders for every missing attribute.
+
+    Lower-case names become submodules, which are callable as well, so both
+    `from homeassistant.helpers import storage` and `@callback` work.
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        if name[0].isupper() and not name.isupper():
+            value: Any = _stub_class(name)
+        elif name.isupper():
+            value = _Placeholder()
+        else:
+            value = importlib.import_module(f"{self.__name__}.{name}")
+        setattr(self, name, value)
+        return value
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return _passthrough(*args, **kwargs)
+
+
+class _StubFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """Serve every `homeassistant.*` (and missing dependency) import from a `_StubModule`."""
+
+    def __init__(self, roots: tuple[str, ...]) -> None:
+        self.roots = roots
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname.split(".", 1)[0] in self.roots:
+            return importlib.machinery.ModuleSpec(fullname, self, is_package=True)
+        return None
+
+    def create_module(self, spec):
+        module = _StubModule(spec.name)
+        module.__path__ = []
+        return module
+
+    def exec_module(self, module):
+        pass
+
+
+def stubbed_dependencies() -> list[str]:
+    """Return the optional dependencies that are not installed."""
+    return [root for root in OPTIONAL_ROOTS if importlib.util.find_spec(root) is None]
+
+
+def install() -> None:
+    """Install the stub package (idempotent)."""
+    if any(isinstance(finder, _StubFinder) for finder in sys.meta_path):
+        return
+    missing = stubbed_dependencies()
+    for root in OPTIONAL_ROOTS:
+        if root not in missing:
+            importlib.import_module(root)
+    sys.meta_path.insert(0, _StubFinder((STUB_ROOT, *missing)))
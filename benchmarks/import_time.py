@@ -0,0 +1,154 @@
+"""Import-time benchmark for Notify Manager.
+
+Importiert die Integration in frischen Interpretern gegen ein Stub-Paket
+`homeassistant` (siehe ha_stub.py) und misst die Ladezeit per `-X importtime`.
+Gemessen wird nur der Anteil der Integration, nicht Home Assistant selbst.
+
+Usage:
+  python3 benchmarks/import_time.py
+  python3 benchmarks/import_time.py --runs 20 --json results.json
+  python3 benchmarks/import_time.py --module sensor --module select
+"""
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import ha_stub  # noqa: E402
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+BENCH_DIR = Path(__file__).resolve().parent
+PACKAGE = "custom_components.notify_manager"
+
+# What Home Assistant imports for a config entry: the package and its platforms
+DEFAULT_MODULES = ["", "sensor", "switch", "select", "button"]
+
+# Standard library modules Home Assistant has always loaded before an
+# integration; importing them up front keeps them out of the measurement
+PRELOADED = "asyncio, collections, dataclasses, datetime, enum, functools, json, logging, pathlib, re, typing"
+
+_RUNNER = """
+import sys
+sys.path[:0] = [{bench!r}, {root!r}]
+import {preloaded}
+import ha_stub
+ha_stub.install()
+import {module}
+"""
+
+
+def _module_name(name: str) -> str:
+    """Return the full module name for a short name ('' = package)."""
+    return f"{PACKAGE}.{name}" if name else PACKAGE
+
+
+def measure_once(module: str) -> dict[str, int]:
+    """Import a module in a fresh interpreter and return cumulative µs per module."""
+    code = _RUNNER.format(
+        bench=str(BENCH_DIR), root=str(REPO_ROOT), preloaded=PRELOADED, module=module
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if proc.returncode != 0:
+        last_line = proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else ""
+        raise RuntimeError(last_line or f"exit code {proc.returncode}")
+
+    cumulative: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        # "import time:      self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        if name.startswith(PACKAGE):
+            cumulative[name] = int(cumulative_us)
+    return cumulative
+
+
+def run(modules: list[str], runs: int) -> dict:
+    """Run the benchmark and return the results."""
+    results: dict = {
+        "python": sys.version.split()[0],
+        "runs": runs,
+        # Not installed here: stubbed, their schemas are not built
+        "stubbed": ha_stub.stubbed_dependencies(),
+        "modules": {},
+    }
+
+    for short_name in modules:
+        module = _module_name(short_name)
+        samples: list[int] = []
+        breakdown: dict[str, list[int]] = {}
+        try:
+            for _ in range(runs):
+                cumulative = measure_once(module)
+                samples.append(cumulative.get(module, 0))
+                for name, value in cumulative.items():
+                    breakdown.setdefault(name, []).append(value)
+        except RuntimeError as err:
+            # e.g. aiohttp not installed
+            results["modules"][module] = {"skipped": str(err)}
+            continue
+
+        results["modules"][module] = {
+            "median_us": int(statistics.median(samples)),
+            "min_us": min(samples),
+            "max_us": max(samples),
+            "loaded": {
+                name: int(statistics.median(values))
+                for name, values in sorted(
+                    breakdown.items(), key=lambda item: -statistics.median(item[1])
+                )
+            },
+        }
+    return results
+
+
+def _print(results: dict) -> None:
+    """Print a short human readable summary."""
+    print(f"Python {results['python']}, {results['runs']} runs per module")
+    if results["stubbed"]:
+        print(f"Stubbed (not installed): {', '.join(results['stubbed'])}")
+    print()
+    for module, data in results["modules"].items():
+        if "skipped" in data:
+            print(f"{module}: skipped ({data['skipped']})")
+            continue
+        print(
+            f"{module}: median {data['median_us'] / 1000:.2f} ms "
+            f"(min {data['min_us'] / 1000:.2f}, max {data['max_us'] / 1000:.2f})"
+        )
+        for name, value in data["loaded"].items():
+            if name != module:
+                print(f"    {name}: {value / 1000:.2f} ms")
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="imports per module")
+    parser.add_argument(
+        "--module",
+        action="append",
+        help="module below the package, e.g. 'sensor' ('' = package); repeatable",
+    )
+    parser.add_argument("--json", type=Path, help="write results as JSON to this file")
+    args = parser.parse_args()
+
+    results = run(args.module if args.module is not None else DEFAULT_MODULES, args.runs)
+    _print(results)
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,443 @@
+"""Runtime benchmark for Notify Manager.
+
+Startet eine echte Home-Assistant-Instanz im Prozess (ohne Bootstrap, ohne
+Telefone) und ersetzt die Companion-App-Dienste durch `FakeNotify`
+(siehe fake_notify.py). Gemessen werden Durchsatz und Latenz-Perzentile von:
+- `send_from_template` an N Geräte (Vorlage mit Jinja im Text)
+- Versand an eine Gruppe (Vorlage mit `group`) und `send_batch`
+- Verteilung von Button-Events an N angehängte Geräte-Trigger
+- Auswertung der Geräte-Bedingung `last_action_was`
+
+Benötigt `pip install homeassistant`.
+
+Usage:
+  python3 benchmarks/runtime.py
+  python3 benchmarks/runtime.py --devices 20 --latency 0.08 --jitter 0.02 --failure-rate 0.05
+  python3 benchmarks/runtime.py --json after.json --compare before.json
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+import inspect
+import json
+from pathlib import Path
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any
+
+from fake_notify import FakeNotify
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from homeassistant.config_entries import (  # noqa: E402
+    ConfigEntries,
+    ConfigEntry,
+    ConfigEntryState,
+)
+from homeassistant.const import __version__ as HA_VERSION  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.helpers import device_registry as dr  # noqa: E402
+
+from custom_components.notify_manager import (  # noqa: E402
+    _async_register_shared,
+    _async_setup_lifecycle,
+    _async_setup_sending,
+)
+from custom_components.notify_manager import device_condition, device_trigger  # noqa: E402
+from custom_components.notify_manager.const import (  # noqa: E402
+    CONF_DEVICES,
+    DEFAULT_CATEGORIES,
+    DOMAIN,
+    EVENT_NOTIFICATION_ACTION,
+)
+from custom_components.notify_manager.data import NotifyManagerData  # noqa: E402
+from custom_components.notify_manager.health import HealthTracker  # noqa: E402
+from custom_components.notify_manager.metrics import Metrics  # noqa: E402
+from custom_components.notify_manager.registry import TemplateRegistry  # noqa: E402
+from custom_components.notify_manager.tracing import TraceRecorder  # noqa: E402
+
+BENCH_ENTRY_ID = "benchmark"
+BENCH_SENSOR = "sensor.bench_temperature"
+
+
+async def _async_add_loaded_entry(hass: HomeAssistant, data: dict[str, Any]) -> ConfigEntry:
+    """Add a config entry that counts as set up, without running the integration setup.
+
+    Conditions look up their entry through the device registry and the config
+    entries, so both have to know the benchmark entry.
+    """
+    hass.config_entries = ConfigEntries(hass, {})
+    await hass.config_entries.async_initialize()
+    await dr.async_load(hass)
+
+    # The constructor arguments differ between Home Assistant versions
+    arguments = {
+        "version": 1,
+        "minor_version": 1,
+        "domain": DOMAIN,
+        "title": "Notify Manager (benchmark)",
+        "data": data,
+        "source": "user",
+        "options": {},
+        "unique_id": None,
+        "entry_id": BENCH_ENTRY_ID,
+        "state": ConfigEntryState.LOADED,
+        "discovery_keys": {},
+        "subentries_data": None,
+    }
+    parameters = inspect.signature(ConfigEntry).parameters
+    entry = ConfigEntry(**{key: value for key, value in arguments.items() if key in parameters})
+    # Benchmark only: there is no public API to add an entry without setting it up
+    hass.config_entries._entries[entry.entry_id] = entry  # noqa: SLF001
+    dr.async_get(hass).async_get_or_create(
+        config_entry_id=entry.entry_id,
+        identifiers={(DOMAIN, entry.entry_id)},
+        name="Notify Manager",
+    )
+    return entry
+
+
+def _bench_device_id(hass: HomeAssistant) -> str:
+    """Return the registry id of the benchmark device."""
+    device = dr.async_get(hass).async_get_device(identifiers={(DOMAIN, BENCH_ENTRY_ID)})
+    return device.id
+
+
+def _percentile(sorted_values: list[float], percent: float) -> float:
+    """Return a percentile of sorted values (nearest rank)."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(percent / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def _latency_summary(seconds: list[float]) -> dict[str, float]:
+    """Return mean and tail latency in milliseconds."""
+    values = sorted(value * 1000 for value in seconds)
+    if not values:
+        return {}
+    return {
+        "mean": round(statistics.fmean(values), 3),
+        "p50": round(_percentile(values, 50), 3),
+        "p90": round(_percentile(values, 90), 3),
+        "p99": round(_percentile(values, 99), 3),
+        "max": round(values[-1], 3),
+    }
+
+
+async def _async_measure(
+    count: int, concurrency: int, run_one: Callable[[int], Awaitable[Any]]
+) -> tuple[dict[str, Any], list[Any]]:
+    """Run `run_one` `count` times, at most `concurrency` at once."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def _one(index: int) -> Any:
+        async with semaphore:
+            start = time.perf_counter()
+            result = await run_one(index)
+            latencies.append(time.perf_counter() - start)
+            return result
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(_one(index) for index in range(count)))
+    elapsed = time.perf_counter() - start
+
+    summary = {
+        "count": count,
+        "concurrency": concurrency,
+        "elapsed_s": round(elapsed, 4),
+        "throughput_per_s": round(count / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": _latency_summary(latencies),
+    }
+    return summary, results
+
+
+def _delivery_summary(responses: list[dict[str, Any]]) -> dict[str, Any]:
+    """Aggregate the per-device outcomes of service responses."""
+    outcomes = [
+        outcome
+        for response in responses
+        for result in response.get("results", [response])
+        for outcome in result.get("devices", [])
+    ]
+    statuses: dict[str, int] = {}
+    for outcome in outcomes:
+        statuses[outcome["status"]] = statuses.get(outcome["status"], 0) + 1
+    return {
+        "device_calls": len(outcomes),
+        "device_status": statuses,
+        "device_latency_ms": _latency_summary(
+            [outcome["latency_ms"] / 1000 for outcome in outcomes]
+        ),
+    }
+
+
+async def async_setup(hass: HomeAssistant, args: argparse.Namespace) -> tuple[ConfigEntry, FakeNotify]:
+    """Register fake devices, templates, a group and the integration's services."""
+    devices = [f"bench_phone_{index}" for index in range(args.devices)]
+    fake = FakeNotify(args.latency, args.jitter, args.failure_rate, seed=args.seed)
+    fake.register(hass, devices)
+    hass.states.async_set(BENCH_SENSOR, "21.5")
+
+    templates = [
+        {
+            "id": "bench_template",
+            "name": "Bench",
+            "title": "Benchmark",
+            "message": f"Temperatur {{{{ states('{BENCH_SENSOR}') }}}} °C",
+            "devices": devices,
+        },
+        {
+            "id": "bench_group_template",
+            "name": "Bench Gruppe",
+            "title": "Benchmark",
+            "message": "Gruppe",
+            "group": "bench_group",
+        },
+    ]
+    groups = [{"id": "bench_group", "name": "bench_group", "devices": devices}]
+
+    entry = await _async_add_loaded_entry(hass, {CONF_DEVICES: devices})
+    # Templates and groups are never saved, no store needed
+    entry.runtime_data = NotifyManagerData(
+        config=entry.data,
+        store=None,
+        devices=devices,
+        categories=DEFAULT_CATEGORIES,
+        user_templates=templates,
+        user_groups=groups,
+        template_registry=TemplateRegistry(templates),
+        metrics=Metrics(),
+        tracer=TraceRecorder(),
+        health=HealthTracker(),
+    )
+    await _async_setup_sending(hass, entry)
+    _async_setup_lifecycle(hass, entry)
+    _async_register_shared(hass)
+    return entry, fake
+
+
+async def async_bench_send(
+    hass: HomeAssistant, args: argparse.Namespace, template_name: str
+) -> dict[str, Any]:
+    """Measure send_from_template with one template."""
+    service_data = {"template_name": template_name}
+    # Warm up: compiles the Jinja fields
+    await hass.services.async_call(
+        DOMAIN, "send_from_template", service_data, blocking=True, return_response=True
+    )
+
+    async def _send(_index: int) -> Any:
+        return await hass.services.async_call(
+            DOMAIN, "send_from_template", service_data, blocking=True, return_response=True
+        )
+
+    summary, responses = await _async_measure(args.sends, args.concurrency, _send)
+    return {**summary, **_delivery_summary(responses)}
+
+
+async def async_bench_batch(hass: HomeAssistant, args: argparse.Namespace) -> dict[str, Any]:
+    """Measure send_batch with a mix of template and plain items."""
+    notifications = [
+        {"template": "Bench"} if index % 2 else {"title": "Batch", "message": f"Eintrag {index}"}
+        for index in range(args.batch_size)
+    ]
+
+    async def _send(_index: int) -> Any:
+        return await hass.services.async_call(
+            DOMAIN,
+            "send_batch",
+            {"notifications": notifications},
+            blocking=True,
+            return_response=True,
+        )
+
+    count = max(args.sends // args.batch_size, 1)
+    summary, responses = await _async_measure(count, args.concurrency, _send)
+    return {**summary, "batch_size": args.batch_size, **_delivery_summary(responses)}
+
+
+async def async_bench_action_dispatch(
+    hass: HomeAssistant, args: argparse.Namespace
+) -> dict[str, Any]:
+    """Measure button events dispatched to N attached device triggers."""
+    device_id = _bench_device_id(hass)
+    latencies: list[float] = []
+
+    async def _action(run_variables: dict[str, Any], context: Any = None) -> None:
+        latencies.append(time.perf_counter() - run_variables["trigger"]["event"].data["bench_sent"])
+
+    unsubs = []
+    for index in range(args.triggers):
+        config = await device_trigger.async_validate_trigger_config(
+            hass,
+            {
+                "platform": "device",
+                "domain": DOMAIN,
+                "device_id": device_id,
+                "type": "action_received",
+                "action": f"BENCH_{index}",
+            },
+        )
+        trigger_info = {
+            "domain": DOMAIN,
+            "name": f"benchmark {index}",
+            "home_assistant_start": False,
+            "variables": {},
+            "trigger_data": {"id": str(index), "idx": str(index), "alias": None},
+        }
+        unsubs.append(
+            await device_trigger.async_attach_trigger(hass, config, _action, trigger_info)
+        )
+
+    start = time.perf_counter()
+    for index in range(args.events):
+        hass.bus.async_fire(
+            EVENT_NOTIFICATION_ACTION,
+            {"action": f"BENCH_{index % args.triggers}", "bench_sent": time.perf_counter()},
+        )
+    await hass.async_block_till_done()
+    elapsed = time.perf_counter() - start
+
+    for unsub in unsubs:
+        unsub()
+
+    return {
+        "triggers": args.triggers,
+        "count": args.events,
+        "actions_run": len(latencies),
+        "elapsed_s": round(elapsed, 4),
+        "throughput_per_s": round(args.events / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": _latency_summary(latencies),
+    }
+
+
+async def async_bench_condition(hass: HomeAssistant, args: argparse.Namespace) -> dict[str, Any]:
+    """Measure evaluation of the last_action_was device condition."""
+    device_id = _bench_device_id(hass)
+    entry_data = hass.config_entries.async_get_entry(BENCH_ENTRY_ID).runtime_data
+    entry_data.pending_actions["BENCH_0"] = {
+        "data": {"action": "BENCH_0"},
+        "timestamp": datetime.now().isoformat(),
+    }
+    config = await device_condition.async_validate_condition_config(
+        hass,
+        {
+            "condition": "device",
+            "domain": DOMAIN,
+            "device_id": device_id,
+            "type": "last_action_was",
+            "action": "BENCH_0",
+        },
+    )
+    check = device_condition.async_condition_from_config(hass, config)
+
+    latencies: list[float] = []
+    matched = 0
+    start = time.perf_counter()
+    for _ in range(args.evaluations):
+        eval_start = time.perf_counter()
+        matched += bool(check(hass, {}))
+        latencies.append(time.perf_counter() - eval_start)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "count": args.evaluations,
+        "matched": matched,
+        "elapsed_s": round(elapsed, 4),
+        "throughput_per_s": round(args.evaluations / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": _latency_summary(latencies),
+    }
+
+
+async def async_run(args: argparse.Namespace) -> dict[str, Any]:
+    """Run all scenarios against a fresh Home Assistant instance."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        await hass.async_start()
+        entry, fake = await async_setup(hass, args)
+        try:
+            scenarios = {
+                "send_from_template": await async_bench_send(hass, args, "Bench"),
+                "send_to_group": await async_bench_send(hass, args, "Bench Gruppe"),
+                "send_batch": await async_bench_batch(hass, args),
+                "action_dispatch": await async_bench_action_dispatch(hass, args),
+                "condition": await async_bench_condition(hass, args),
+            }
+        finally:
+            # Remove the listeners the services registered on the entry
+            while entry._on_unload:  # noqa: SLF001
+                entry._on_unload.pop()()  # noqa: SLF001
+            await hass.async_stop(force=True)
+
+    return {
+        "python": sys.version.split()[0],
+        "homeassistant": HA_VERSION,
+        "notify_manager": json.loads(
+            (REPO_ROOT / "custom_components" / DOMAIN / "manifest.json").read_text()
+        )["version"],
+        "config": {
+            key: value for key, value in vars(args).items() if key not in ("json", "compare")
+        },
+        "fake_notify": {"calls": fake.calls, "failures": fake.failures},
+        "scenarios": scenarios,
+    }
+
+
+def _print(results: dict[str, Any], baseline: dict[str, Any] | None) -> None:
+    """Print a short summary, with the change against a baseline if given."""
+    print(
+        f"Notify Manager {results['notify_manager']}, Home Assistant "
+        f"{results['homeassistant']}, Python {results['python']}\n"
+    )
+    for name, data in results["scenarios"].items():
+        latency = data.get("latency_ms", {})
+        line = (
+            f"{name}: {data['throughput_per_s']:.1f}/s, "
+            f"p50 {latency.get('p50', 0):.2f} ms, p99 {latency.get('p99', 0):.2f} ms"
+        )
+        old = (baseline or {}).get("scenarios", {}).get(name)
+        if old and old.get("throughput_per_s"):
+            change = data["throughput_per_s"] / old["throughput_per_s"] * 100 - 100
+            old_p99 = old.get("latency_ms", {}).get("p99")
+            line += f"  (throughput {change:+.1f} %"
+            if old_p99:
+                line += f", p99 {latency.get('p99', 0) / old_p99 * 100 - 100:+.1f} %"
+            line += ")"
+        print(line)
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=5, help="fake devices per send")
+    parser.add_argument("--sends", type=int, default=200, help="send calls per scenario")
+    parser.add_argument("--concurrency", type=int, default=20, help="parallel send calls")
+    parser.add_argument("--batch-size", type=int, default=10, help="items per send_batch call")
+    parser.add_argument("--triggers", type=int, default=50, help="attached device triggers")
+    parser.add_argument("--events", type=int, default=2000, help="fired button events")
+    parser.add_argument("--evaluations", type=int, default=10000, help="condition checks")
+    parser.add_argument("--latency", type=float, default=0.05, help="fake notify latency (s)")
+    parser.add_argument("--jitter", type=float, default=0.01, help="fake notify jitter (s)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="0..1")
+    parser.add_argument("--seed", type=int, default=1, help="random seed of the fake devices")
+    parser.add_argument("--json", type=Path, help="write results as JSON to this file")
+    parser.add_argument("--compare", type=Path, help="JSON results of an earlier run")
+    args = parser.parse_args()
+
+    results = asyncio.run(async_run(args))
+    baseline = json.loads(args.compare.read_text(encoding="utf-8")) if args.compare else None
+    _print(results, baseline)
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
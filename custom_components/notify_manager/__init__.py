@@ -10,69 +10,76 @@ Diese Integration bietet eine vollständige Verwaltung für Mobile App Benachric
 """
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable
 import logging
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any
-
-import voluptuous as vol
-
-from homeassistant.components import frontend
-from homeassistant.components.http import StaticPathConfig
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, ServiceCall, callback, Event
-from homeassistant.helpers import config_validation as cv
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.const import ATTR_DEVICE_ID, ATTR_ENTITY_ID, Platform
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Context,
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+    Event,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv, entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.typing import ConfigType
-from homeassistant.helpers.storage import Store
 
 from .const import (
     DOMAIN,
     CONF_DEVICES,
     CONF_CATEGORIES,
-    CONF_DEFAULT_PRIORITY,
     CONF_SHOW_SIDEBAR,
-    SERVICE_SEND_NOTIFICATION,
-    SERVICE_SEND_ACTIONABLE,
-    SERVICE_CLEAR_NOTIFICATIONS,
-    SERVICE_SEND_ALARM_CONFIRMATION,
-    SERVICE_SEND_WITH_IMAGE,
-    SERVICE_SEND_TEXT_INPUT,
+    CONF_DIGEST_INTERVAL,
+    CONF_DIGEST_MAX_ITEMS,
+    CONF_RESIZE_ATTACHMENTS,
+    CONF_ENABLE_METRICS,
+    CONF_PROMETHEUS,
+    CONF_TRACE_SAMPLE_RATE,
+    CONF_FAILOVER_ROUTES,
+    ATTR_CONFIG_ENTRY_ID,
     ATTR_TITLE,
     ATTR_MESSAGE,
     ATTR_TARGET,
     ATTR_CATEGORY,
     ATTR_PRIORITY,
     ATTR_DATA,
-    ATTR_ACTIONS,
     ATTR_TAG,
-    ATTR_IMAGE,
-    ATTR_CAMERA,
-    ATTR_GROUP,
-    ATTR_CHANNEL,
-    ATTR_CLICKACTION,
-    ATTR_PERSISTENT,
-    ATTR_STICKY,
-    ATTR_TIMEOUT,
-    ATTR_COLOR,
-    ATTR_SUBTITLE,
-    ATTR_SUBJECT,
-    ATTR_BADGE,
-    ATTR_ICON,
-    ATTR_VISIBILITY,
-    ATTR_VIBRATION,
-    ATTR_LED_COLOR,
-    ATTR_ALERT_ONCE,
-    ATTR_NOTIFICATION_ICON,
-    ATTR_CAR_UI,
-    ATTR_VIDEO,
-    ATTR_AUDIO,
+    ATTR_PROGRESS,
+    ATTR_PROGRESS_MAX,
+    ATTR_PROGRESS_INDETERMINATE,
     EVENT_NOTIFICATION_ACTION,
+    EVENT_NOTIFICATION_CLEARED,
     DEFAULT_CATEGORIES,
     PRIORITY_LEVELS,
-    ACTION_TEMPLATES,
 )
+from .brand import async_schedule_brand_icons
+from .data import (
+    NotifyManagerConfigEntry,
+    NotifyManagerData,
+    async_entries_data,
+    async_load_stored_data,
+    async_resolve_entry,
+    entry_store,
+)
+from .options import classify_option_changes, signal_options_updated
+from .registry import TemplateRegistry, signal_templates_updated
 # Additional services are no longer registered - all features available through templates
+# The send path modules (batch, delivery, digest, ...) are imported by the
+# setup functions that use them, not when the package is loaded
+
+if TYPE_CHECKING:
+    from .tracing import Trace
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -80,129 +87,6 @@ PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.SWITCH, Platform.SELECT,
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
-# Storage for user templates
-STORAGE_VERSION = 1
-STORAGE_KEY = f"{DOMAIN}.templates"
-
-# ============================================================================
-# SERVICE SCHEMAS
-# ============================================================================
-
-# Schema für einzelne Aktion (Button)
-ACTION_SCHEMA = vol.Schema(
-    {
-        vol.Required("action"): cv.string,
-        vol.Required("title"): cv.string,
-        vol.Optional("uri"): cv.string,
-        vol.Optional("icon"): cv.string,
-        vol.Optional("destructive"): cv.boolean,
-        vol.Optional("authenticationRequired"): cv.boolean,
-        vol.Optional("behavior"): cv.string,
-        vol.Optional("textInputButtonTitle"): cv.string,
-        vol.Optional("textInputPlaceholder"): cv.string,
-    }
-)
-
-# Basis-Benachrichtigung
-SEND_NOTIFICATION_SCHEMA = vol.Schema(
-    {
-        vol.Required(ATTR_TITLE): cv.string,
-        vol.Required(ATTR_MESSAGE): cv.string,
-        vol.Optional(ATTR_TARGET): vol.All(cv.ensure_list, [cv.string]),
-        vol.Optional("group_name"): cv.string,
-        vol.Optional(ATTR_CATEGORY): cv.string,
-        vol.Optional(ATTR_PRIORITY, default="normal"): vol.In(["low", "normal", "high", "critical"]),
-        vol.Optional(ATTR_TAG): cv.string,
-        vol.Optional(ATTR_GROUP): cv.string,
-        vol.Optional(ATTR_CHANNEL): cv.string,
-        vol.Optional(ATTR_CLICKACTION): cv.string,
-        vol.Optional(ATTR_DATA): dict,
-    }
-)
-
-# Actionable Notification (mit Buttons)
-SEND_ACTIONABLE_SCHEMA = vol.Schema(
-    {
-        vol.Required(ATTR_TITLE): cv.string,
-        vol.Required(ATTR_MESSAGE): cv.string,
-        # Button template or custom actions
-        vol.Optional("button_template"): cv.string,
-        vol.Optional(ATTR_ACTIONS): vol.All(cv.ensure_list, [ACTION_SCHEMA]),
-        # Individual button fields (alternative to actions list)
-        vol.Optional("button1_action"): cv.string,
-        vol.Optional("button1_title"): cv.string,
-        vol.Optional("button2_action"): cv.string,
-        vol.Optional("button2_title"): cv.string,
-        vol.Optional("button3_action"): cv.string,
-        vol.Optional("button3_title"): cv.string,
-        vol.Optional(ATTR_TARGET): vol.All(cv.ensure_list, [cv.string]),
-        vol.Optional("group_name"): cv.string,
-        vol.Optional(ATTR_CATEGORY): cv.string,
-        vol.Optional(ATTR_PRIORITY, default="high"): vol.In(["low", "normal", "high", "critical"]),
-        vol.Optional(ATTR_TAG): cv.string,
-        vol.Optional(ATTR_GROUP): cv.string,
-        vol.Optional(ATTR_PERSISTENT): cv.boolean,
-        vol.Optional(ATTR_STICKY): cv.boolean,
-        vol.Optional(ATTR_TIMEOUT): cv.positive_int,
-        vol.Optional(ATTR_CLICKACTION): cv.string,
-        vol.Optional(ATTR_DATA): dict,
-    }
-)
-
-# Benachrichtigung mit Bild oder Kamera
-SEND_WITH_IMAGE_SCHEMA = vol.Schema(
-    {
-        vol.Required(ATTR_TITLE): cv.string,
-        vol.Required(ATTR_MESSAGE): cv.string,
-        vol.Exclusive(ATTR_IMAGE, "image_source"): cv.string,
-        vol.Exclusive(ATTR_CAMERA, "image_source"): cv.entity_id,
-        vol.Optional(ATTR_ACTIONS): vol.All(cv.ensure_list, [ACTION_SCHEMA]),
-        vol.Optional(ATTR_TARGET): vol.All(cv.ensure_list, [cv.string]),
-        vol.Optional("group_name"): cv.string,
-        vol.Optional(ATTR_CATEGORY): cv.string,
-        vol.Optional(ATTR_PRIORITY, default="normal"): vol.In(["low", "normal", "high", "critical"]),
-        vol.Optional(ATTR_TAG): cv.string,
-        vol.Optional(ATTR_DATA): dict,
-    }
-)
-
-# Alarm-Bestätigung (vorgefertigte Buttons)
-SEND_ALARM_CONFIRMATION_SCHEMA = vol.Schema(
-    {
-        vol.Required(ATTR_TITLE): cv.string,
-        vol.Required(ATTR_MESSAGE): cv.string,
-        vol.Optional(ATTR_TARGET): vol.All(cv.ensure_list, [cv.string]),
-        vol.Optional("group_name"): cv.string,
-        vol.Optional("alarm_entity"): cv.entity_id,
-        vol.Optional("template"): vol.In(["alarm_response", "confirm_dismiss", "door_response", "yes_no"]),
-        vol.Optional(ATTR_TAG, default="alarm_confirmation"): cv.string,
-        vol.Optional(ATTR_DATA): dict,
-    }
-)
-
-# Text-Input Benachrichtigung
-SEND_TEXT_INPUT_SCHEMA = vol.Schema(
-    {
-        vol.Required(ATTR_TITLE): cv.string,
-        vol.Required(ATTR_MESSAGE): cv.string,
-        vol.Optional("input_title", default="Antworten"): cv.string,
-        vol.Optional("placeholder", default="Nachricht eingeben..."): cv.string,
-        vol.Optional(ATTR_TARGET): vol.All(cv.ensure_list, [cv.string]),
-        vol.Optional("group_name"): cv.string,
-        vol.Optional(ATTR_TAG): cv.string,
-        vol.Optional(ATTR_DATA): dict,
-    }
-)
-
-# Benachrichtigungen löschen
-CLEAR_NOTIFICATIONS_SCHEMA = vol.Schema(
-    {
-        vol.Optional(ATTR_TARGET): vol.All(cv.ensure_list, [cv.string]),
-        vol.Optional(ATTR_TAG): cv.string,
-    }
-)
-
-
 # ============================================================================
 # SETUP FUNCTIONS
 # ============================================================================
@@ -211,87 +95,176 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Notify Manager component."""
     hass.data.setdefault(DOMAIN, {})
     
-    # Setup brand icons for UI display
-    await _async_setup_brand_icons(hass)
+    # Brand icons are installed in the background after startup
+    async_schedule_brand_icons(hass)
     
     return True
 
 
-async def _async_setup_brand_icons(hass: HomeAssistant) -> None:
-    """Copy integration icons to www/brands for UI display."""
-    import shutil
-    
-    try:
-        component_dir = Path(__file__).parent
-        brands_dir = Path(hass.config.path("www")) / "brands" / DOMAIN
-        
-        # Create brands directory
-        brands_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Copy icons if they don't exist or are different
-        for icon_name in ["icon.png", "icon@2x.png", "logo.png"]:
-            src = component_dir / icon_name
-            dst = brands_dir / icon_name
-            if src.exists() and (not dst.exists() or src.stat().st_size != dst.stat().st_size):
-                await hass.async_add_executor_job(shutil.copy2, src, dst)
-                _LOGGER.debug("Copied brand icon: %s", icon_name)
-        
-        _LOGGER.info("Brand icons setup complete: %s", brands_dir)
-    except Exception as err:
-        _LOGGER.warning("Could not setup brand icons: %s", err)
+async def async_setup_entry(hass: HomeAssistant, entry: NotifyManagerConfigEntry) -> bool:
+    """Set up Notify Manager from a config entry.
 
+    Panel-Registrierung und Store laufen parallel; Services, Listener und
+    Plattformen warten nie auf das Frontend.
+    """
+    from .health import HealthTracker, signal_health_updated
+    from .metrics import Metrics
+    from .tracing import TraceRecorder
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Set up Notify Manager from a config entry."""
     hass.data.setdefault(DOMAIN, {})
+    timings: dict[str, float] = {}
+    setup_start = time.perf_counter()
     
-    # Initialize template storage
-    store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
-    stored_data = await store.async_load() or {"templates": [], "groups": []}
-    
-    # Store config entry data
-    hass.data[DOMAIN][entry.entry_id] = {
-        "config": entry.data,
-        "devices": entry.data.get(CONF_DEVICES, []),
-        "categories": entry.data.get(CONF_CATEGORIES, DEFAULT_CATEGORIES),
-        "notification_history": [],
-        "pending_actions": {},
-        "user_templates": stored_data.get("templates", []),
-        "user_groups": stored_data.get("groups", []),
-    }
-    
-    # Store reference for saving
-    hass.data[DOMAIN]["_store"] = store
-    
-    # Register frontend panel (with sidebar option)
+    # Register frontend panel (with sidebar option) in the background
     show_sidebar = entry.data.get(CONF_SHOW_SIDEBAR, True)
-    await _async_register_panel(hass, show_sidebar)
+    panel_task = hass.async_create_task(
+        _async_timed(timings, "panel", _async_setup_panel(hass, show_sidebar))
+    )
     
-    # Register services (only send_from_template + internal services)
-    await _async_register_services(hass, entry)
+    # Initialize template storage (one store per entry)
+    store = entry_store(hass, entry.entry_id)
+    stored_data = await _async_timed(
+        timings, "storage", async_load_stored_data(hass, store)
+    )
     
-    # Register event listener for notification actions
-    await _async_register_action_listener(hass, entry)
+    # Runtime data of this entry
+    entry.runtime_data = NotifyManagerData(
+        config=entry.data,
+        store=store,
+        devices=entry.data.get(CONF_DEVICES, []),
+        categories=entry.data.get(CONF_CATEGORIES, DEFAULT_CATEGORIES),
+        user_templates=stored_data.get("templates", []),
+        user_groups=stored_data.get("groups", []),
+        template_registry=TemplateRegistry(stored_data.get("templates", [])),
+        # Timing of the send phases (see metrics.py), shared with the diagnostics
+        metrics=Metrics(entry.data.get(CONF_ENABLE_METRICS, True)),
+        # Sampled per-notification traces (see tracing.py)
+        tracer=TraceRecorder(_trace_sample_rate(entry)),
+        # Per-device health with circuit breaker (see health.py)
+        health=HealthTracker(
+            on_change=lambda: async_dispatcher_send(
+                hass, signal_health_updated(entry.entry_id)
+            )
+        ),
+    )
     
-    # Set up platforms
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # Send path and shown notifications of this entry; services, the event
+    # listeners for notification actions and WebSocket commands exist once
+    phase_start = time.perf_counter()
+    await _async_setup_sending(hass, entry)
+    _async_setup_lifecycle(hass, entry)
+    _async_register_shared(hass)
+    if entry.data.get(CONF_PROMETHEUS, False):
+        from .prometheus import async_register_metrics_view
+
+        async_register_metrics_view(hass)
+    timings["services"] = time.perf_counter() - phase_start
     
-    # Register WebSocket commands
-    await _async_register_websocket_commands(hass, entry)
+    # Set up platforms while the panel registration finishes
+    await asyncio.gather(
+        _async_timed(
+            timings, "platforms",
+            hass.config_entries.async_forward_entry_setups(entry, PLATFORMS),
+        ),
+        panel_task,
+    )
     
-    # Register update listener
-    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    # Register update listener (applies most changes without a reload)
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
     
+    _LOGGER.debug(
+        "Setup of %s finished in %.1f ms (%s)",
+        entry.title,
+        (time.perf_counter() - setup_start) * 1000,
+        ", ".join(f"{phase} {duration * 1000:.1f} ms" for phase, duration in timings.items()),
+    )
     return True
 
 
-async def _async_register_websocket_commands(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Register WebSocket commands for frontend communication."""
+@callback
+def _async_register_shared(hass: HomeAssistant) -> None:
+    """Register services, event listeners and WebSocket commands for all entries."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if "_shared_listeners" in domain_data:
+        return
+    _async_register_services(hass)
+    domain_data["_shared_listeners"] = _async_register_event_listeners(hass)
+    # WebSocket commands cannot be removed, they stay for the whole HA run
+    if not domain_data.get("_websocket_registered"):
+        _async_register_websocket_commands(hass)
+        domain_data["_websocket_registered"] = True
+
+
+@callback
+def _async_unregister_shared(hass: HomeAssistant) -> None:
+    """Remove the services and event listeners after the last entry."""
+    for service in SERVICES:
+        hass.services.async_remove(DOMAIN, service)
+    domain_data = hass.data[DOMAIN]
+    for unsub in domain_data.pop("_shared_listeners", ()):
+        unsub()
+    # Its invalidation listeners were among the shared listeners
+    domain_data.pop("_notify_device_fields", None)
+
+
+async def _async_timed(timings: dict[str, float], phase: str, awaitable: Awaitable[Any]) -> Any:
+    """Await a setup phase and record its duration."""
+    start = time.perf_counter()
+    try:
+        return await awaitable
+    finally:
+        timings[phase] = time.perf_counter() - start
+
+
+async def _async_setup_panel(hass: HomeAssistant, show_sidebar: bool) -> None:
+    """Register the panel; a failure must not block sending notifications."""
+    try:
+        await _async_register_panel(hass, show_sidebar)
+    except Exception as err:
+        _LOGGER.error("Could not register the Notify Manager panel: %s", err)
+
+
+@callback
+def _async_register_websocket_commands(hass: HomeAssistant) -> None:
+    """Register WebSocket commands for frontend communication.
+
+    Registered once; every command picks its entry (`config_entry_id`,
+    default: the only loaded entry).
+    """
+    import voluptuous as vol
+
     from homeassistant.components import websocket_api
+    from .batch import ATTR_NOTIFICATIONS, SEND_BATCH_FIELDS
     from .const import DEFAULT_NOTIFICATION_TEMPLATES
+
+    entry_field = {vol.Optional(ATTR_CONFIG_ENTRY_ID): str}
+
+    @callback
+    def _entry(
+        connection: websocket_api.ActiveConnection, msg: dict
+    ) -> NotifyManagerConfigEntry | None:
+        """Return the requested entry or send an error.
+
+        Without `config_entry_id` the first set up entry is used; the panel
+        reads its id from get_templates/get_groups and passes it to services.
+        """
+        try:
+            return async_resolve_entry(hass, msg.get(ATTR_CONFIG_ENTRY_ID), first=True)
+        except ServiceValidationError as err:
+            connection.send_error(msg["id"], "not_found", str(err))
+            return None
+
+    @callback
+    def _entry_data(
+        connection: websocket_api.ActiveConnection, msg: dict
+    ) -> NotifyManagerData | None:
+        """Return the data of the requested entry or send an error."""
+        entry = _entry(connection, msg)
+        return entry.runtime_data if entry else None
     
     @websocket_api.websocket_command({
-        "type": "notify_manager/get_templates"
+        vol.Required("type"): "notify_manager/get_templates",
+        **entry_field,
     })
     @websocket_api.async_response
     async def websocket_get_templates(
@@ -300,16 +273,17 @@ async def _async_register_websocket_commands(hass: HomeAssistant, entry: ConfigE
         msg: dict,
     ) -> None:
         """Return all templates (default + user)."""
-        config_data = hass.data[DOMAIN].get(entry.entry_id, {})
-        user_templates = config_data.get("user_templates", [])
-        
+        if (entry := _entry(connection, msg)) is None:
+            return
         connection.send_result(msg["id"], {
-            "templates": user_templates,
+            ATTR_CONFIG_ENTRY_ID: entry.entry_id,
+            "templates": entry.runtime_data.user_templates,
             "default_templates": list(DEFAULT_NOTIFICATION_TEMPLATES.keys()),
         })
     
     @websocket_api.websocket_command({
-        "type": "notify_manager/get_template_names"
+        vol.Required("type"): "notify_manager/get_template_names",
+        **entry_field,
     })
     @websocket_api.async_response
     async def websocket_get_template_names(
@@ -318,12 +292,11 @@ async def _async_register_websocket_commands(hass: HomeAssistant, entry: ConfigE
         msg: dict,
     ) -> None:
         """Return all template names for dropdowns."""
-        config_data = hass.data[DOMAIN].get(entry.entry_id, {})
-        user_templates = config_data.get("user_templates", [])
-        
+        if (entry_data := _entry_data(connection, msg)) is None:
+            return
         # Combine default and user template names
         names = list(DEFAULT_NOTIFICATION_TEMPLATES.keys())
-        for t in user_templates:
+        for t in entry_data.user_templates:
             name = t.get("name", "")
             if name and name not in names:
                 names.append(name)
@@ -331,7 +304,8 @@ async def _async_register_websocket_commands(hass: HomeAssistant, entry: ConfigE
         connection.send_result(msg["id"], {"names": names})
     
     @websocket_api.websocket_command({
-        "type": "notify_manager/get_groups"
+        vol.Required("type"): "notify_manager/get_groups",
+        **entry_field,
     })
     @websocket_api.async_response
     async def websocket_get_groups(
@@ -340,39 +314,145 @@ async def _async_register_websocket_commands(hass: HomeAssistant, entry: ConfigE
         msg: dict,
     ) -> None:
         """Return all user groups."""
-        config_data = hass.data[DOMAIN].get(entry.entry_id, {})
-        user_groups = config_data.get("user_groups", [])
-        connection.send_result(msg["id"], {"groups": user_groups})
+        if (entry := _entry(connection, msg)) is None:
+            return
+        connection.send_result(msg["id"], {
+            ATTR_CONFIG_ENTRY_ID: entry.entry_id,
+            "groups": entry.runtime_data.user_groups,
+        })
+
+    @websocket_api.websocket_command({
+        vol.Required("type"): "notify_manager/get_select_options",
+        **entry_field,
+    })
+    @websocket_api.async_response
+    async def websocket_get_select_options(
+        hass: HomeAssistant,
+        connection: websocket_api.ActiveConnection,
+        msg: dict,
+    ) -> None:
+        """Return the full option lists that are not kept in entity attributes."""
+        from .const import KNOWN_BUTTON_ACTIONS
+        from .registry import template_action_ids
+
+        if (entry_data := _entry_data(connection, msg)) is None:
+            return
+        templates = entry_data.template_registry.templates
+
+        action_ids: dict[str, str] = {}
+        for template in templates:
+            for action_id in template_action_ids(template):
+                action_ids[action_id] = template.get("name", "")
+
+        connection.send_result(msg["id"], {
+            "templates": [t.get("name") for t in templates if t.get("name")],
+            "action_ids": action_ids,
+            "known_actions": KNOWN_BUTTON_ACTIONS,
+        })
+
+    @websocket_api.websocket_command({
+        vol.Required("type"): "notify_manager/send_batch",
+        **SEND_BATCH_FIELDS,
+    })
+    @websocket_api.require_admin
+    @websocket_api.async_response
+    async def websocket_send_batch(
+        hass: HomeAssistant,
+        connection: websocket_api.ActiveConnection,
+        msg: dict,
+    ) -> None:
+        """Send many notifications and return the outcome of each."""
+        if (entry_data := _entry_data(connection, msg)) is None:
+            return
+        send_batch = entry_data.send_batch
+        if send_batch is None:
+            connection.send_error(msg["id"], "not_ready", "Notify Manager is not set up")
+            return
+        connection.send_result(msg["id"], await send_batch(msg[ATTR_NOTIFICATIONS]))
+
+    @websocket_api.websocket_command({
+        vol.Required("type"): "notify_manager/metrics",
+        **entry_field,
+        vol.Optional("reset", default=False): bool,
+    })
+    @websocket_api.require_admin
+    @websocket_api.async_response
+    async def websocket_metrics(
+        hass: HomeAssistant,
+        connection: websocket_api.ActiveConnection,
+        msg: dict,
+    ) -> None:
+        """Return the send path histograms, optionally resetting them."""
+        if (entry_data := _entry_data(connection, msg)) is None:
+            return
+        metrics = entry_data.metrics
+        result = metrics.as_dict()
+        if msg["reset"]:
+            metrics.reset()
+        connection.send_result(msg["id"], result)
+
+    @websocket_api.websocket_command({
+        vol.Required("type"): "notify_manager/traces",
+        **entry_field,
+        vol.Optional("tag"): str,
+        vol.Optional("correlation_id"): str,
+        vol.Optional("limit", default=20): vol.All(int, vol.Range(min=1, max=200)),
+    })
+    @websocket_api.require_admin
+    @websocket_api.async_response
+    async def websocket_traces(
+        hass: HomeAssistant,
+        connection: websocket_api.ActiveConnection,
+        msg: dict,
+    ) -> None:
+        """Return recorded notification traces."""
+        if (entry_data := _entry_data(connection, msg)) is None:
+            return
+        tracer = entry_data.tracer
+        connection.send_result(msg["id"], {
+            "sample_rate": tracer.sample_rate,
+            "traces": tracer.find(msg.get("tag"), msg.get("correlation_id"), msg["limit"]),
+        })
 
     # Register WebSocket commands
     websocket_api.async_register_command(hass, websocket_get_templates)
     websocket_api.async_register_command(hass, websocket_get_template_names)
     websocket_api.async_register_command(hass, websocket_get_groups)
+    websocket_api.async_register_command(hass, websocket_get_select_options)
+    websocket_api.async_register_command(hass, websocket_send_batch)
+    websocket_api.async_register_command(hass, websocket_metrics)
+    websocket_api.async_register_command(hass, websocket_traces)
 
 
 async def _async_register_panel(hass: HomeAssistant, show_sidebar: bool = True) -> None:
     """Register the frontend panel and static assets."""
+    from homeassistant.components import frontend
+    from homeassistant.components.http import StaticPathConfig
+
+    from .panel import NotifyManagerPanelView, async_get_panel_assets
+
     frontend_path = Path(__file__).parent / "frontend"
     component_path = Path(__file__).parent
-    brands_path = Path(hass.config.path("www")) / "brands" / DOMAIN
     
-    # Build static paths list
-    static_paths = [
-        StaticPathConfig("/notify_manager_static", str(frontend_path), cache_headers=False),
-        StaticPathConfig("/notify_manager_icons", str(component_path), cache_headers=True),
-    ]
-    
-    # Add brands path if it exists (for integration icon)
-    if brands_path.exists():
-        static_paths.append(
-            StaticPathConfig(f"/local/brands/{DOMAIN}", str(brands_path), cache_headers=True)
-        )
+    # Panel assets: hashed and pre-compressed once per HA run
+    panel_assets = await async_get_panel_assets(hass, frontend_path)
     
-    # Register static paths for frontend and icons
-    await hass.http.async_register_static_paths(static_paths)
-    
-    # Version for cache busting
-    VERSION = "1.2.7.5"
+    # Static paths and views can only be registered once per HA run
+    if not hass.data[DOMAIN].get("_static_registered"):
+        # Build static paths list (images etc.)
+        static_paths = [
+            StaticPathConfig("/notify_manager_static", str(frontend_path), cache_headers=True),
+            StaticPathConfig("/notify_manager_icons", str(component_path), cache_headers=True),
+        ]
+        # /local/brands (integration icon) follows once the icons are
+        # installed, see brand.py
+        
+        # Register static paths for frontend and icons
+        await hass.http.async_register_static_paths(static_paths)
+        
+        # Panel module and chunks, served under their content hash
+        hass.http.register_view(NotifyManagerPanelView(panel_assets))
+        hass.data[DOMAIN]["_static_registered"] = True
     
     frontend.async_register_built_in_panel(
         hass,
@@ -385,30 +465,119 @@ async def _async_register_panel(hass: HomeAssistant, show_sidebar: bool = True)
                 "name": "notify-manager-panel",
                 "embed_iframe": False,
                 "trust_external": False,
-                "module_url": f"/notify_manager_static/notify-manager-panel.js?v={VERSION}",
+                "module_url": panel_assets.module_url,
             }
         },
         require_admin=False,
+        # Also used to show/hide the sidebar entry without a reload
+        update=True,
     )
 
 
-async def _async_register_action_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Register listener for mobile_app_notification_action events."""
+@callback
+def _async_setup_lifecycle(hass: HomeAssistant, entry: NotifyManagerConfigEntry) -> None:
+    """Track the shown notifications of an entry (see lifecycle.py)."""
+    from .action_dispatch import async_get_action_dispatcher
+    from .lifecycle import ActiveNotifications
+
+    dispatcher = async_get_action_dispatcher(hass)
+    
+    @callback
+    def handle_lifecycle(kind: str, event_data: dict[str, Any], context: Context | None) -> None:
+        """Report a cleared or expired notification."""
+        config_data = entry.runtime_data
+        config_data.metrics.increment(f"notifications_{kind}")
+        # Deferred progress updates and digest items would show the
+        # notification again
+        if config_data.progress_stream:
+            config_data.progress_stream.async_discard(event_data["tag"])
+        if config_data.digest:
+            config_data.digest.async_discard(event_data["tag"])
+
+        event_type = f"{DOMAIN}_notification_{kind}"
+        hass.bus.async_fire(event_type, event_data, context=context)
+        dispatcher.async_dispatch(
+            entry.entry_id,
+            kind,
+            event_data.get("category"),
+            Event(event_type, event_data, context=context),
+        )
+        config_data.add_history({
+            "type": f"notification_{kind}",
+            **event_data,
+            "timestamp": datetime.now().isoformat(),
+        })
+    
+    # Tags currently shown on the devices
+    active = entry.runtime_data.active_notifications = ActiveNotifications(
+        hass, handle_lifecycle
+    )
+    entry.async_on_unload(active.async_cancel)
+
+
+@callback
+def _async_event_entries(
+    hass: HomeAssistant, tag: str | None
+) -> list[tuple[str, NotifyManagerData]]:
+    """Return the entries an app event belongs to.
+
+    The entry that sent the tag; all entries if no entry knows it.
+    """
+    entries = async_entries_data(hass)
+    owners = [
+        (entry_id, entry_data)
+        for entry_id, entry_data in entries
+        if tag
+        and entry_data.active_notifications is not None
+        and entry_data.active_notifications.get(tag) is not None
+    ]
+    return owners or entries
+
+
+@callback
+def _async_register_event_listeners(hass: HomeAssistant) -> list[CALLBACK_TYPE]:
+    """Listen to mobile_app notification action/cleared events, once for all entries."""
+    from .action_dispatch import KIND_ACTION, async_get_action_dispatcher
+    from .lifecycle import async_event_device
+
+    dispatcher = async_get_action_dispatcher(hass)
     
     @callback
     def handle_notification_action(event: Event) -> None:
         """Handle notification action events from Companion App."""
         action = event.data.get("action")
         action_data = event.data
+        tag = action_data.get("tag")
         
         _LOGGER.debug("Received notification action: %s with data: %s", action, action_data)
         
-        # Store action in pending actions for processing
-        config_data = hass.data[DOMAIN].get(entry.entry_id, {})
-        config_data.setdefault("pending_actions", {})[action] = {
-            "data": action_data,
-            "timestamp": datetime.now().isoformat(),
-        }
+        for entry_id, config_data in _async_event_entries(hass, tag):
+            # Store action in pending actions for processing
+            config_data.metrics.observe_ack(tag)
+            config_data.tracer.record_ack(
+                tag,
+                action=action,
+                source_device=action_data.get("sourceDeviceID"),
+            )
+            config_data.pending_actions[action] = {
+                "data": action_data,
+                "timestamp": datetime.now().isoformat(),
+            }
+            # Answered, the notification no longer expires
+            if tag and config_data.active_notifications is not None:
+                config_data.active_notifications.async_acknowledge(tag)
+            
+            # Device triggers of this entry (one lookup instead of a bus listener each)
+            dispatcher.async_dispatch(entry_id, KIND_ACTION, action, event)
+            
+            # Add to history
+            history_entry = {
+                "type": "action_received",
+                "action": action,
+                "data": action_data,
+                "timestamp": datetime.now().isoformat(),
+            }
+            config_data.add_history(history_entry)
         
         # Fire a custom event that automations can listen to
         hass.bus.async_fire(
@@ -417,31 +586,62 @@ async def _async_register_action_listener(hass: HomeAssistant, entry: ConfigEntr
                 "action": action,
                 "reply_text": action_data.get("reply_text"),
                 "source_device": action_data.get("sourceDeviceID"),
-                "tag": action_data.get("tag"),
+                "tag": tag,
                 **action_data,
             },
         )
-        
-        # Add to history
-        history_entry = {
-            "type": "action_received",
-            "action": action,
-            "data": action_data,
-            "timestamp": datetime.now().isoformat(),
-        }
-        config_data.setdefault("notification_history", []).append(history_entry)
-        config_data["notification_history"] = config_data["notification_history"][-100:]
     
-    # Listen for mobile app notification actions
-    hass.bus.async_listen(EVENT_NOTIFICATION_ACTION, handle_notification_action)
+    @callback
+    def handle_notification_cleared(event: Event) -> None:
+        """Handle a notification dismissed in the Companion App."""
+        tag = event.data.get("tag")
+        if not tag:
+            return
+        for _entry_id, config_data in async_entries_data(hass):
+            active = config_data.active_notifications
+            if active is not None and (notification := active.get(tag)) is not None:
+                active.async_clear(
+                    tag, async_event_device(hass, event.data, notification), event.context
+                )
+    
+    return [
+        hass.bus.async_listen(EVENT_NOTIFICATION_ACTION, handle_notification_action),
+        hass.bus.async_listen(EVENT_NOTIFICATION_CLEARED, handle_notification_cleared),
+    ]
 
 
 # ============================================================================
 # SERVICE HANDLERS
 # ============================================================================
 
-async def _async_register_services(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Register Notify Manager services."""
+async def _async_setup_sending(
+    hass: HomeAssistant, entry: NotifyManagerConfigEntry
+) -> None:
+    """Build the send path of an entry; the services call it (see below)."""
+    from .batch import ATTR_GROUP_NAME, ATTR_TEMPLATE, async_send_batch
+    from .delivery import (
+        STATUS_QUEUED,
+        STATUS_SENT,
+        STATUS_SKIPPED,
+        async_notify_device,
+        delivery_result,
+        new_correlation_id,
+    )
+    from .digest import NotificationDigest, digest_enabled
+    from .failover import FailoverRouter, is_critical
+    from .progress import ProgressStream
+
+    config_data = entry.runtime_data
+    metrics = config_data.metrics
+    tracer = config_data.tracer
+    health = config_data.health
+    # Fallback routes for critical notifications (see failover.py)
+    failover = config_data.failover = FailoverRouter(
+        hass,
+        entry.data.get(CONF_FAILOVER_ROUTES),
+        config_data.devices,
+        config_data.categories,
+    )
     
     def _build_notification_data(
         priority: str,
@@ -494,8 +694,7 @@ async def _async_register_services(hass: HomeAssistant, entry: ConfigEntry) -> N
         - Both: actions, images, video, audio, tags, groups
         """
         data = {}
-        config_data = hass.data[DOMAIN].get(entry.entry_id, {})
-        categories = config_data.get("categories", DEFAULT_CATEGORIES)
+        categories = config_data.categories
         
         # Get priority settings
         priority_config = PRIORITY_LEVELS.get(priority, PRIORITY_LEVELS["normal"])
@@ -708,8 +907,7 @@ async def _async_register_services(hass: HomeAssistant, entry: ConfigEntry) -> N
     
     def _resolve_group_to_devices(group_name: str) -> list[str]:
         """Resolve a group name to list of device names."""
-        config_data = hass.data[DOMAIN].get(entry.entry_id, {})
-        user_groups = config_data.get("user_groups", [])
+        user_groups = config_data.user_groups
 
         for group in user_groups:
             if group.get("name") == group_name:
@@ -735,10 +933,16 @@ async def _async_register_services(hass: HomeAssistant, entry: ConfigEntry) -> N
         data: dict,
         category: str | None = None,
         group_name: str | None = None,
-    ) -> None:
-        """Send notification to specified devices or group."""
-        config_data = hass.data[DOMAIN].get(entry.entry_id, {})
-        categories = config_data.get("categories", DEFAULT_CATEGORIES)
+        correlation_id: str | None = None,
+        trace: Trace | None = None,
+    ) -> dict[str, Any]:
+        """Send notification to specified devices or group and return the outcome."""
+        send_start = time.perf_counter()
+        categories = config_data.categories
+        correlation_id = correlation_id or new_correlation_id()
+        if trace is None:
+            trace = tracer.start(correlation_id, "send", category=category)
+        tag = data.get("tag")
 
         # Resolve group_name to devices if provided
         if group_name and not targets:
@@ -767,405 +971,159 @@ async def _async_register_services(hass: HomeAssistant, entry: ConfigEntry) -> N
                         # Already a device name
                         processed_targets.append(target)
         
-        devices = processed_targets if processed_targets else config_data.get("devices", [])
+        devices = processed_targets if processed_targets else config_data.devices
+        metrics.observe_since("targets", send_start)
+        if trace:
+            trace.tag = tag
+            trace.stage("resolution", targets=list(devices), group=group_name)
         
         # Check if category is enabled
         if category and category in categories:
             if not categories[category].get("enabled", True):
                 _LOGGER.debug("Category %s is disabled, skipping notification", category)
-                return
-        
-        for device in devices:
-            service_name = f"mobile_app_{device}"
-            try:
-                await hass.services.async_call(
-                    "notify",
-                    service_name,
-                    {
-                        "title": title,
-                        "message": message,
-                        "data": data,
-                    },
-                    blocking=True,
+                metrics.increment("sends_skipped")
+                trace.stage("skipped", reason="category_disabled")
+                return delivery_result(
+                    devices, tag=tag, correlation_id=correlation_id,
+                    status=STATUS_SKIPPED, reason="category_disabled",
                 )
-                _LOGGER.debug("Sent notification to %s", device)
-            except Exception as err:
-                _LOGGER.error("Failed to send notification to %s: %s", device, err)
-        
-        # Store in history
-        history_entry = {
-            "type": "notification_sent",
-            "title": title,
-            "message": message,
-            "targets": devices,
-            "category": category,
-            "data": data,
-            "timestamp": datetime.now().isoformat(),
-        }
-        config_data.setdefault("notification_history", []).append(history_entry)
-        config_data["notification_history"] = config_data["notification_history"][-100:]
-    
-    # ========== SERVICE: send_notification ==========
-    async def handle_send_notification(call: ServiceCall) -> None:
-        """Handle send_notification service call."""
-        data = _build_notification_data(
-            priority=call.data.get(ATTR_PRIORITY, "normal"),
-            category=call.data.get(ATTR_CATEGORY),
-            tag=call.data.get(ATTR_TAG),
-            extra_data=call.data.get(ATTR_DATA),
-            group=call.data.get(ATTR_GROUP),
-            channel=call.data.get(ATTR_CHANNEL),
-            clickaction=call.data.get(ATTR_CLICKACTION),
-        )
 
-        await _send_to_devices(
-            title=call.data[ATTR_TITLE],
-            message=call.data[ATTR_MESSAGE],
-            targets=call.data.get(ATTR_TARGET, []),
-            data=data,
-            category=call.data.get(ATTR_CATEGORY),
-            group_name=call.data.get("group_name"),
-        )
-    
-    # ========== SERVICE: send_actionable ==========
-    async def handle_send_actionable(call: ServiceCall) -> None:
-        """Handle send_actionable service call - notification with buttons."""
-        # Build actions from various sources
-        actions = []
-        
-        # 1. Check for button_template
-        button_template = call.data.get("button_template")
-        if button_template and button_template != "custom":
-            actions = ACTION_TEMPLATES.get(button_template, [])
-        
-        # 2. Check for individual button fields (override template)
-        button1_action = call.data.get("button1_action")
-        button1_title = call.data.get("button1_title")
-        if button1_action and button1_title:
-            actions = []  # Clear template if custom buttons provided
-            actions.append({"action": button1_action, "title": button1_title})
-            
-            button2_action = call.data.get("button2_action")
-            button2_title = call.data.get("button2_title")
-            if button2_action and button2_title:
-                actions.append({"action": button2_action, "title": button2_title})
-                
-                button3_action = call.data.get("button3_action")
-                button3_title = call.data.get("button3_title")
-                if button3_action and button3_title:
-                    actions.append({"action": button3_action, "title": button3_title})
-        
-        # 3. Check for actions list (highest priority - direct override)
-        if ATTR_ACTIONS in call.data:
-            actions = call.data[ATTR_ACTIONS]
-        
-        # Fallback to confirm_dismiss if no buttons defined
-        if not actions:
-            actions = ACTION_TEMPLATES.get("confirm_dismiss", [])
-        
-        data = _build_notification_data(
-            priority=call.data.get(ATTR_PRIORITY, "high"),
-            category=call.data.get(ATTR_CATEGORY),
-            tag=call.data.get(ATTR_TAG),
-            extra_data=call.data.get(ATTR_DATA),
-            actions=actions,
-            persistent=call.data.get(ATTR_PERSISTENT, True),
-            sticky=call.data.get(ATTR_STICKY, True),
-            timeout=call.data.get(ATTR_TIMEOUT),
-            clickaction=call.data.get(ATTR_CLICKACTION),
-            group=call.data.get(ATTR_GROUP),
-        )
+            # Digest mode: collect and send combined later
+            if digest_enabled(categories[category]):
+                await digest.async_add(
+                    category, categories[category], title, message, list(devices), data
+                )
+                metrics.increment("sends_queued")
+                trace.stage("queued", reason="digest", category=category)
+                return delivery_result(
+                    devices, tag=tag, correlation_id=correlation_id,
+                    status=STATUS_QUEUED, reason="digest",
+                )
         
-        await _send_to_devices(
-            title=call.data[ATTR_TITLE],
-            message=call.data[ATTR_MESSAGE],
-            targets=call.data.get(ATTR_TARGET, []),
-            data=data,
-            category=call.data.get(ATTR_CATEGORY),
-            group_name=call.data.get("group_name"),
-        )
+        if not devices:
+            metrics.increment("sends_skipped")
+            trace.stage("skipped", reason="no_targets")
+            return delivery_result(
+                [], tag=tag, correlation_id=correlation_id, reason="no_targets"
+            )
 
-    # ========== SERVICE: send_with_image ==========
-    async def handle_send_with_image(call: ServiceCall) -> None:
-        """Handle send_with_image service call - notification with image or camera snapshot."""
-        data = _build_notification_data(
-            priority=call.data.get(ATTR_PRIORITY, "normal"),
-            category=call.data.get(ATTR_CATEGORY),
-            tag=call.data.get(ATTR_TAG),
-            extra_data=call.data.get(ATTR_DATA),
-            actions=call.data.get(ATTR_ACTIONS),
-            image=call.data.get(ATTR_IMAGE),
-            camera_entity=call.data.get(ATTR_CAMERA),
-        )
-        
-        await _send_to_devices(
-            title=call.data[ATTR_TITLE],
-            message=call.data[ATTR_MESSAGE],
-            targets=call.data.get(ATTR_TARGET, []),
-            data=data,
-            category=call.data.get(ATTR_CATEGORY),
-            group_name=call.data.get("group_name"),
+        outcomes = await _deliver(
+            title, message, devices, data, category,
+            correlation_id=correlation_id, trace=trace,
         )
+        metrics.observe_since("send", send_start)
+        metrics.mark_sent(tag)
+        result = delivery_result(devices, outcomes, tag=tag, correlation_id=correlation_id)
+        metrics.increment(f"sends_{result['status']}")
+        return result
 
-    # ========== SERVICE: send_alarm_confirmation ==========
-    async def handle_send_alarm_confirmation(call: ServiceCall) -> None:
-        """Handle send_alarm_confirmation - preconfigured alarm notification with buttons."""
-        # Build actions from template or custom buttons
-        actions = []
-        template = call.data.get("template", "alarm_response")
-        
-        # Check for custom buttons first
-        button1_action = call.data.get("button1_action")
-        button1_title = call.data.get("button1_title")
-        if button1_action and button1_title:
-            actions.append({"action": button1_action, "title": button1_title})
-            
-            button2_action = call.data.get("button2_action")
-            button2_title = call.data.get("button2_title")
-            if button2_action and button2_title:
-                actions.append({"action": button2_action, "title": button2_title})
-                
-                button3_action = call.data.get("button3_action")
-                button3_title = call.data.get("button3_title")
-                if button3_action and button3_title:
-                    actions.append({"action": button3_action, "title": button3_title})
-        
-        # Use template if no custom buttons or template not "custom"
-        if not actions and template != "custom":
-            actions = ACTION_TEMPLATES.get(template, ACTION_TEMPLATES["alarm_response"])
-        
-        # Fallback
-        if not actions:
-            actions = ACTION_TEMPLATES["alarm_simple"]
-        
-        data = _build_notification_data(
-            priority="critical",
-            category="alarm",
-            tag=call.data.get(ATTR_TAG, "alarm_confirmation"),
-            extra_data=call.data.get(ATTR_DATA),
-            actions=actions,
-            persistent=True,
-            sticky=True,
-        )
-        
-        # Add alarm entity if specified
-        alarm_entity = call.data.get("alarm_entity")
-        if alarm_entity:
-            data["entity_id"] = alarm_entity
-            data["clickAction"] = f"entityId:{alarm_entity}"
-        
-        await _send_to_devices(
-            title=call.data[ATTR_TITLE],
-            message=call.data[ATTR_MESSAGE],
-            targets=call.data.get(ATTR_TARGET, []),
-            data=data,
-            category="alarm",
-            group_name=call.data.get("group_name"),
-        )
+    async def _deliver(
+        title: str,
+        message: str,
+        devices: list[str],
+        data: dict,
+        category: str | None = None,
+        history_type: str = "notification_sent",
+        correlation_id: str | None = None,
+        trace: Trace | None = None,
+    ) -> list[dict[str, Any]]:
+        """Call the mobile_app notify service for each device and record history.
 
-    # ========== SERVICE: send_text_input ==========
-    async def handle_send_text_input(call: ServiceCall) -> None:
-        """Handle send_text_input - notification with text reply option."""
-        actions = [
-            {
-                "action": "REPLY",
-                "title": call.data.get("input_title", "Antworten"),
-                "behavior": "textInput",
-                "textInputButtonTitle": "Senden",
-                "textInputPlaceholder": call.data.get("placeholder", "Nachricht eingeben..."),
-            }
-        ]
-        
-        data = _build_notification_data(
-            priority="normal",
-            category=call.data.get(ATTR_CATEGORY, "info"),
-            tag=call.data.get(ATTR_TAG),
-            extra_data=call.data.get(ATTR_DATA),
-            actions=actions,
-            persistent=True,
-        )
-        
-        await _send_to_devices(
-            title=call.data[ATTR_TITLE],
-            message=call.data[ATTR_MESSAGE],
-            targets=call.data.get(ATTR_TARGET, []),
-            data=data,
-            category=call.data.get(ATTR_CATEGORY),
-            group_name=call.data.get("group_name"),
-        )
+        Returns the outcome (status, latency) per device.
+        """
 
-    # ========== SERVICE: clear_notifications ==========
-    async def handle_clear_notifications(call: ServiceCall) -> None:
-        """Handle clear_notifications service call."""
-        targets = call.data.get(ATTR_TARGET, [])
-        tag = call.data.get(ATTR_TAG)
-        
-        config_data = hass.data[DOMAIN].get(entry.entry_id, {})
-        devices = targets if targets else config_data.get("devices", [])
-        
-        for device in devices:
-            service_name = f"mobile_app_{device}"
-            try:
-                clear_data = {}
-                if tag:
-                    clear_data["tag"] = tag
-                
-                await hass.services.async_call(
-                    "notify",
-                    service_name,
-                    {
-                        "message": "clear_notification",
-                        "data": clear_data,
-                    },
-                    blocking=True,
-                )
-                _LOGGER.debug("Cleared notifications for %s", device)
-            except Exception as err:
-                _LOGGER.error("Failed to clear notifications for %s: %s", device, err)
-    
-    # ========== SERVICE: save_templates ==========
-    async def handle_save_templates(call: ServiceCall) -> None:
-        """Save templates from frontend to persistent storage."""
-        templates = call.data.get("templates", [])
-        config_data = hass.data[DOMAIN].get(entry.entry_id, {})
-        config_data["user_templates"] = templates
-
-        # Persist to storage
-        store = hass.data[DOMAIN].get("_store")
-        if store:
-            await store.async_save({
-                "templates": templates,
-                "groups": config_data.get("user_groups", []),
-            })
-
-        # Fire event to notify entities that templates changed
-        hass.bus.async_fire(f"{DOMAIN}_templates_saved", {"templates": templates})
+        phase_start = time.perf_counter()
 
-        _LOGGER.info("Saved %d user templates to storage", len(templates))
-    
-    # ========== SERVICE: save_groups ==========
-    async def handle_save_groups(call: ServiceCall) -> None:
-        """Save groups from frontend to persistent storage."""
-        groups = call.data.get("groups", [])
-        config_data = hass.data[DOMAIN].get(entry.entry_id, {})
-        config_data["user_groups"] = groups
-        
-        # Persist to storage
-        store = hass.data[DOMAIN].get("_store")
-        if store:
-            await store.async_save({
-                "templates": config_data.get("user_templates", []),
-                "groups": groups,
-            })
-        
-        _LOGGER.info("Saved %d user groups to storage", len(groups))
-    
-    # ========== SERVICE: send_to_group ==========
-    async def handle_send_to_group(call: ServiceCall) -> None:
-        """Send notification to all devices in a group."""
-        group_name = call.data.get("group_name", "")
-        config_data = hass.data[DOMAIN].get(entry.entry_id, {})
-        user_groups = config_data.get("user_groups", [])
-        
-        # Find group by name
-        group = None
-        for g in user_groups:
-            if g.get("name") == group_name:
-                group = g
-                break
-        
-        if not group:
-            _LOGGER.error("Group not found: %s. Available: %s", 
-                         group_name, [g.get("name") for g in user_groups])
-            return
-        
-        # Get devices from group
-        devices = group.get("devices", [])
-        if not devices:
-            _LOGGER.warning("Group %s has no devices", group_name)
-            return
-        
-        # Build actions from button_template if specified
-        actions = []
-        button_template = call.data.get("button_template")
-        if button_template and button_template != "none":
-            actions = ACTION_TEMPLATES.get(button_template, [])
-        
-        # Build notification data
-        data = _build_notification_data(
-            priority=call.data.get("priority", "normal"),
-            tag=call.data.get("tag"),
-            actions=actions if actions else None,
-        )
+        # One camera snapshot for all recipients instead of one per device
+        if devices:
+            from .snapshot import async_attach_snapshot
+
+            data = await async_attach_snapshot(hass, data)
+
+        # Optional: smaller image derivatives per device type
+        device_data = {device: data for device in devices}
+        if devices and config_data.config.get(CONF_RESIZE_ATTACHMENTS, False):
+            from .attachments import async_prepare_attachments
+
+            device_data = await async_prepare_attachments(hass, data, devices)
+        metrics.observe_since("attachments", phase_start)
+
+        outcomes = []
+        for device in devices:
+            if trace:
+                trace.stage("send", device=device)
+            outcome = await async_notify_device(
+                hass,
+                device,
+                {"title": title, "message": message, "data": device_data[device]},
+                health,
+            )
+            if trace:
+                trace.stage("result", **outcome)
+            outcomes.append(outcome)
+
+        # Critical only: failed pushes go out over the fallback routes
+        if failover and is_critical(data):
+            failed = [outcome for outcome in outcomes if outcome["status"] != STATUS_SENT]
+            if failed:
+                await failover.async_route(failed, category, title, message, data.get("tag"))
+                for outcome in failed:
+                    metrics.increment(
+                        "failover_sent" if outcome["failover"]["route"] else "failover_failed"
+                    )
+                    if trace:
+                        trace.stage("failover", device=outcome["device"], **outcome["failover"])
+        for outcome in outcomes:
+            if outcome["status"] != STATUS_SKIPPED:
+                metrics.observe("device_call", outcome["latency_ms"] / 1000)
+            metrics.increment(f"device_calls_{outcome['status']}")
+
+        # Shown notifications, until cleared or expired (see lifecycle.py)
+        shown = [outcome["device"] for outcome in outcomes if outcome["status"] == STATUS_SENT]
+        if shown and data.get("tag") and config_data.active_notifications is not None:
+            config_data.active_notifications.async_track(
+                data["tag"], correlation_id, category, shown, data.get("timeout")
+            )
         
-        # Track for template association
-        tag = call.data.get("tag") or f"group_{group_name}_{datetime.now().timestamp()}"
-        config_data["last_sent_notification"] = {
-            "template_name": group_name,
-            "tag": tag,
+        # Store in history
+        phase_start = time.perf_counter()
+        history_entry = {
+            "type": history_type,
+            "title": title,
+            "message": message,
+            "targets": devices,
+            "category": category,
+            "data": data,
+            "correlation_id": correlation_id,
             "timestamp": datetime.now().isoformat(),
         }
-        
-        await _send_to_devices(
-            title=call.data.get("title", ""),
-            message=call.data.get("message", ""),
-            targets=devices,
-            data=data,
-        )
-        
-        _LOGGER.info("Sent notification to group %s (%d devices)", group_name, len(devices))
-    
-    # ========== SERVICE: get_templates ==========
-    async def handle_get_templates(call: ServiceCall) -> dict:
-        """Get all available templates (default + user)."""
-        from .const import DEFAULT_NOTIFICATION_TEMPLATES
-        
-        config_data = hass.data[DOMAIN].get(entry.entry_id, {})
-        user_templates = config_data.get("user_templates", [])
-        
-        # Combine default and user templates
-        all_templates = list(DEFAULT_NOTIFICATION_TEMPLATES.keys())
-        for t in user_templates:
-            name = t.get("name", "")
-            if name and name not in all_templates:
-                all_templates.append(name)
-        
-        return {"templates": all_templates}
+        config_data.add_history(history_entry)
+        metrics.observe_since("history", phase_start)
+        return outcomes
+
+    async def _deliver_digest(title: str, message: str, devices: list[str], data: dict) -> None:
+        """Send a combined digest notification."""
+        await _deliver(title, message, devices, data, history_type="digest_sent")
+
+    # Digest for categories with digest mode enabled
+    digest = NotificationDigest(hass, _deliver_digest, defaults=_digest_defaults(entry))
+    config_data.digest = digest
+    # Runs after async_unload_entry flushed the collected items
+    entry.async_on_unload(digest.async_cancel)
     
-    # ========== SERVICE: send_from_template ==========
-    async def handle_send_from_template(call: ServiceCall) -> None:
-        """Send notification using a saved template - ALL settings from template."""
+    # ========== SERVICE: send_from_template (see _async_register_services) ==========
+    async def _async_send_template(
+        template_name: str, overrides: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Send a template; `overrides` may replace title, message, targets, category and add data."""
         from .const import DEFAULT_NOTIFICATION_TEMPLATES
 
-        template_name = ""
-
-        # Get template from entity_id (new method - dropdown!)
-        entity_id = call.data.get("entity_id", "")
-        if entity_id:
-            select_entity = hass.states.get(entity_id)
-            if select_entity and select_entity.state not in ["Keine Auswahl", "unknown", "unavailable"]:
-                if not select_entity.state.startswith("──"):
-                    template_name = select_entity.state
-                    _LOGGER.info("Using template from entity %s: %s", entity_id, template_name)
-
-        # Fallback: direct template_name parameter
-        if not template_name:
-            template_name = call.data.get("template_name", "")
-
-        # Last fallback: default select entity
-        if not template_name:
-            select_entity = hass.states.get("select.notify_manager_active_notification")
-            if select_entity and select_entity.state not in ["Keine Auswahl", "unknown", "unavailable"]:
-                if not select_entity.state.startswith("──"):
-                    template_name = select_entity.state
-
-        if not template_name:
-            _LOGGER.error("No template specified! Set the entity to a template first.")
-            return
-
-        config_data = hass.data[DOMAIN].get(entry.entry_id, {})
-        user_templates = config_data.get("user_templates", [])
-        user_groups = config_data.get("user_groups", [])
+        overrides = overrides or {}
+        phase_start = time.perf_counter()
+        correlation_id = new_correlation_id()
+        trace = tracer.start(correlation_id, "send_from_template", template=template_name)
+        user_templates = config_data.user_templates
+        user_groups = config_data.user_groups
 
         # Find template by name or id - first in user templates
         template = None
@@ -1189,11 +1147,23 @@ async def _async_register_services(hass: HomeAssistant, entry: ConfigEntry) -> N
             _LOGGER.error("Template not found: %s. Available user templates: %s",
                          template_name,
                          [t.get("name") for t in user_templates])
-            return
+            trace.stage("template_lookup", found=False)
+            return {"status": "error", "error": f"Template not found: {template_name}"}
+
+        # Jinja in title/message, compiled once per template version
+        renderer = config_data.template_renderer
+        if renderer is None:
+            from .rendering import TemplateRenderer
+
+            renderer = config_data.template_renderer = TemplateRenderer(hass)
+        rendered = renderer.async_render_fields(template)
+        metrics.observe_since("template", phase_start)
+        trace.stage("template_lookup", found=True)
+        phase_start = time.perf_counter()
 
         # Get ALL settings from template
-        title = template.get("title", "")
-        message = template.get("message", "")
+        title = rendered["title"]
+        message = rendered["message"]
         priority = template.get("priority", "normal")
         notification_type = template.get("type", "simple")
         buttons = template.get("buttons", [])
@@ -1260,6 +1230,8 @@ async def _async_register_services(hass: HomeAssistant, entry: ConfigEntry) -> N
         if notification_type == "image":
             if template.get("camera"):
                 data["entity_id"] = template["camera"]
+                # Image URL naming the camera - replaced by one shared snapshot
+                data["image"] = f"/api/camera_proxy/{template['camera']}"
             elif template.get("image"):
                 data["image"] = template["image"]
 
@@ -1313,37 +1285,265 @@ async def _async_register_services(hass: HomeAssistant, entry: ConfigEntry) -> N
         if template.get("notificationGroup"):
             data["group"] = template["notificationGroup"]
 
+        # Category (for enable/disable and digest mode) - only when set explicitly
+        category = template.get("category") or None
+
+        # Batch items may override the template
+        title = overrides.get(ATTR_TITLE, title)
+        message = overrides.get(ATTR_MESSAGE, message)
+        targets = overrides.get(ATTR_TARGET) or targets
+        category = overrides.get(ATTR_CATEGORY, category)
+        if overrides.get(ATTR_DATA):
+            data.update(overrides[ATTR_DATA])
+
+        metrics.observe_since("payload", phase_start)
+        trace.stage("payload_build")
+
         _LOGGER.info("Sending from template '%s' to targets: %s", template_name, targets or "all devices")
 
-        await _send_to_devices(
+        result = await _send_to_devices(
             title=title,
             message=message,
             targets=targets,
             data=data,
-            category=None,
+            category=category,
+            group_name=overrides.get(ATTR_GROUP_NAME),
+            correlation_id=correlation_id,
+            trace=trace,
         )
 
+        tag = result["tag"]
+
         # Track template for button response association
-        config_data["last_sent_notification"] = {
+        config_data.last_sent_notification = {
             "template_name": template_name,
             "tag": tag,
             "timestamp": datetime.now().isoformat(),
         }
 
         # Fire event for tracking
+        phase_start = time.perf_counter()
         hass.bus.async_fire(f"{DOMAIN}_notification_sent", {
             "template_name": template_name,
             "targets": targets,
             "tag": tag,
+            "correlation_id": result["correlation_id"],
         })
+        metrics.observe_since("event", phase_start)
+
+        return result
+
+    # ========== SERVICE: send_batch ==========
+    async def _async_send_batch_item(item: dict[str, Any]) -> dict[str, Any]:
+        """Send one validated batch item."""
+        if item.get(ATTR_TEMPLATE):
+            return await _async_send_template(item[ATTR_TEMPLATE], item)
+
+        # Same payload as a single send
+        data = _build_notification_data(
+            priority=item.get(ATTR_PRIORITY, "normal"),
+            category=item.get(ATTR_CATEGORY),
+            tag=item.get(ATTR_TAG),
+            extra_data=item.get(ATTR_DATA),
+        )
+        return await _send_to_devices(
+            title=item.get(ATTR_TITLE, ""),
+            message=item[ATTR_MESSAGE],
+            targets=item.get(ATTR_TARGET, []),
+            data=data,
+            category=item.get(ATTR_CATEGORY),
+            group_name=item.get(ATTR_GROUP_NAME),
+        )
+
+    async def _async_send_batch(items: list[dict[str, Any]]) -> dict[str, Any]:
+        """Send validated batch items together."""
+        return await async_send_batch(items, _async_send_batch_item)
+
+    # ========== SERVICE: send_progress ==========
+    async def _send_progress_payload(payload: dict[str, Any]) -> dict[str, Any]:
+        """Send one update of a progress stream."""
+        return await _send_to_devices(**payload)
+
+    # One stream per tag: only meaningful changes are pushed
+    progress_stream = ProgressStream(hass, _send_progress_payload, metrics=metrics)
+    config_data.progress_stream = progress_stream
+    entry.async_on_unload(progress_stream.async_cancel)
+
+    async def _async_send_progress(options: dict[str, Any]) -> dict[str, Any]:
+        """Send a validated progress update, throttled per tag."""
+        tag = options[ATTR_TAG]
+        data = {
+            "tag": tag,
+            "progress": options[ATTR_PROGRESS],
+            "progress_max": options[ATTR_PROGRESS_MAX],
+        }
+        if options[ATTR_PROGRESS_INDETERMINATE]:
+            data["progress_indeterminate"] = True
+        payload = {
+            "title": options[ATTR_TITLE],
+            "message": options[ATTR_MESSAGE],
+            "targets": options.get(ATTR_TARGET, []),
+            "data": data,
+        }
+
+        if not options["throttle"]:
+            return await _send_progress_payload(payload)
+
+        result = await progress_stream.async_update(
+            tag,
+            options[ATTR_PROGRESS],
+            options[ATTR_PROGRESS_MAX],
+            options[ATTR_PROGRESS_INDETERMINATE],
+            payload,
+            min_delta=options.get("min_delta"),
+            min_interval=options.get("min_interval"),
+        )
+        if result is None:
+            # Held back: goes out with a later update or after min_interval
+            return delivery_result(
+                options.get(ATTR_TARGET, []), tag=tag,
+                status=STATUS_QUEUED, reason="throttled",
+            )
+        return result
+
+    # Called by the shared services and WebSocket commands
+    config_data.send_template = _async_send_template
+    config_data.send_batch = _async_send_batch
+    config_data.send_progress = _async_send_progress
+
+
+# Services shared by all entries; save_* are called by the frontend only
+# (not in services.yaml = hidden in UI)
+SERVICES = (
+    "send_from_template",
+    "send_batch",
+    "send_progress",
+    "save_templates",
+    "save_groups",
+)
+
+
+@callback
+def _async_register_services(hass: HomeAssistant) -> None:
+    """Register the services once; each call picks its entry."""
+    from .batch import ATTR_NOTIFICATIONS, SEND_BATCH_SCHEMA
+    from .progress import SEND_PROGRESS_SCHEMA
+
+    @callback
+    def _async_call_entry(call: ServiceCall) -> NotifyManagerConfigEntry:
+        """Return the entry a service call is meant for."""
+        return async_resolve_entry(
+            hass,
+            call.data.get(ATTR_CONFIG_ENTRY_ID),
+            call.data.get(ATTR_DEVICE_ID),
+            call.data.get(ATTR_ENTITY_ID),
+        )
+
+    # ========== SERVICE: send_from_template ==========
+    async def handle_send_from_template(call: ServiceCall) -> ServiceResponse:
+        """Send notification using a saved template - ALL settings from template."""
+        entry = _async_call_entry(call)
+        template_name = ""
+
+        # Get template from entity_id (new method - dropdown!)
+        entity_id = call.data.get("entity_id", "")
+        if entity_id:
+            select_entity = hass.states.get(entity_id)
+            if select_entity and select_entity.state not in ["Keine Auswahl", "unknown", "unavailable"]:
+                if not select_entity.state.startswith("──"):
+                    template_name = select_entity.state
+                    _LOGGER.info("Using template from entity %s: %s", entity_id, template_name)
+
+        # Fallback: direct template_name parameter
+        if not template_name:
+            template_name = call.data.get("template_name", "")
+
+        # Last fallback: the active notification select of this entry
+        if not template_name:
+            select_entity_id = er.async_get(hass).async_get_entity_id(
+                "select", DOMAIN, f"{entry.entry_id}_active_notification"
+            )
+            select_entity = hass.states.get(select_entity_id) if select_entity_id else None
+            if select_entity and select_entity.state not in ["Keine Auswahl", "unknown", "unavailable"]:
+                if not select_entity.state.startswith("──"):
+                    template_name = select_entity.state
+
+        if not template_name:
+            _LOGGER.error("No template specified! Set the entity to a template first.")
+            result = {"status": "error", "error": "No template specified"}
+        else:
+            result = await entry.runtime_data.send_template(template_name)
+
+        return result if call.return_response else None
+
+    # ========== SERVICE: send_batch ==========
+    async def handle_send_batch(call: ServiceCall) -> ServiceResponse:
+        """Handle send_batch service call - many notifications in one call."""
+        send_batch = _async_call_entry(call).runtime_data.send_batch
+        response = await send_batch(call.data[ATTR_NOTIFICATIONS])
+        _LOGGER.debug("Batch sent: %d of %d", response["sent"], response["total"])
+        return response if call.return_response else None
+
+    # ========== SERVICE: send_progress ==========
+    async def handle_send_progress(call: ServiceCall) -> ServiceResponse:
+        """Send notification with progress bar (Android), throttled per tag."""
+        send_progress = _async_call_entry(call).runtime_data.send_progress
+        result = await send_progress(call.data)
+        return result if call.return_response else None
+
+    # ========== SERVICE: save_templates ==========
+    async def handle_save_templates(call: ServiceCall) -> None:
+        """Save templates from frontend to persistent storage."""
+        entry = _async_call_entry(call)
+        config_data = entry.runtime_data
+        templates = call.data.get("templates", [])
+        config_data.user_templates = templates
+
+        # Compute what changed so entities only process the affected templates
+        diff = config_data.template_registry.async_update(templates)
+
+        # Persist to the store of this entry
+        await config_data.async_save()
+
+        # Notify entities of the changes, then fire the public event
+        if diff:
+            renderer = config_data.template_renderer
+            if renderer:
+                renderer.async_invalidate(diff)
+            async_dispatcher_send(hass, signal_templates_updated(entry.entry_id), diff)
+        hass.bus.async_fire(f"{DOMAIN}_templates_saved", {"templates": templates})
+
+        _LOGGER.info("Saved %d user templates to storage", len(templates))
     
-    # Register ONLY essential services
-    # Public service - shown in automations
+    # ========== SERVICE: save_groups ==========
+    async def handle_save_groups(call: ServiceCall) -> None:
+        """Save groups from frontend to persistent storage."""
+        config_data = _async_call_entry(call).runtime_data
+        groups = call.data.get("groups", [])
+        config_data.user_groups = groups
+        
+        # Persist to the store of this entry
+        await config_data.async_save()
+        
+        _LOGGER.info("Saved %d user groups to storage", len(groups))
+
+    # Public services - shown in automations
     hass.services.async_register(
-        DOMAIN, "send_from_template", handle_send_from_template
+        DOMAIN, "send_from_template", handle_send_from_template,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN, "send_batch", handle_send_batch,
+        schema=SEND_BATCH_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN, "send_progress", handle_send_progress,
+        schema=SEND_PROGRESS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
     )
 
-    # Internal services - called by frontend only (not in services.yaml = hidden in UI)
+    # Internal services - called by frontend only
     hass.services.async_register(
         DOMAIN, "save_templates", handle_save_templates
     )
@@ -1352,27 +1552,96 @@ async def _async_register_services(hass: HomeAssistant, entry: ConfigEntry) -> N
     )
 
 
+def _digest_defaults(entry: ConfigEntry) -> dict[str, Any]:
+    """Return the entry-wide digest settings."""
+    return {
+        CONF_DIGEST_INTERVAL: entry.data.get(CONF_DIGEST_INTERVAL),
+        CONF_DIGEST_MAX_ITEMS: entry.data.get(CONF_DIGEST_MAX_ITEMS),
+    }
+
+
+def _trace_sample_rate(entry: ConfigEntry) -> float:
+    """Return the share of notifications to trace (option is in percent)."""
+    return entry.data.get(CONF_TRACE_SAMPLE_RATE, 0) / 100
+
+
+
 # ============================================================================
 # UNLOAD / RELOAD
 # ============================================================================
 
-async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_unload_entry(hass: HomeAssistant, entry: NotifyManagerConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        entry_data = entry.runtime_data
+
+        # Send collected digests instead of dropping them
+        if entry_data.digest:
+            await entry_data.digest.async_flush_all()
+
+        if entry_data.template_renderer:
+            entry_data.template_renderer.async_clear()
 
-        if not hass.data[DOMAIN]:
-            # Remove only the services we registered
-            hass.services.async_remove(DOMAIN, "send_from_template")
-            hass.services.async_remove(DOMAIN, "save_templates")
-            hass.services.async_remove(DOMAIN, "save_groups")
+        # Services and listeners are shared by all entries
+        if not any(
+            other.state is ConfigEntryState.LOADED
+            for other in hass.config_entries.async_entries(DOMAIN)
+            if other.entry_id != entry.entry_id
+        ):
+            _async_unregister_shared(hass)
+
+            # Remove the sidebar entry, it is registered again on setup
+            from homeassistant.components import frontend
+
+            frontend.async_remove_panel(hass, "notify-manager")
 
     return unload_ok
 
 
-async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+async def async_remove_entry(hass: HomeAssistant, entry: NotifyManagerConfigEntry) -> None:
+    """Remove the stored templates and groups of a deleted entry."""
+    await entry_store(hass, entry.entry_id).async_remove()
+
+
+async def async_update_options(hass: HomeAssistant, entry: NotifyManagerConfigEntry) -> None:
+    """Apply changed entry data; reload only if a change requires it."""
+    if entry.state is not ConfigEntryState.LOADED:
+        return
+    entry_data = entry.runtime_data
+
+    changes = classify_option_changes(entry_data.config, entry.data)
+    if not changes:
+        return
+
+    if changes.reload:
+        _LOGGER.debug("Reloading %s, changed: %s", entry.title, sorted(changes.changed))
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    # Apply in place - history, pending actions and digest timers are kept
+    entry_data.config = entry.data
+    if changes.runtime:
+        entry_data.devices = entry.data.get(CONF_DEVICES, [])
+        entry_data.categories = entry.data.get(CONF_CATEGORIES, DEFAULT_CATEGORIES)
+        if entry_data.digest:
+            entry_data.digest.async_set_defaults(_digest_defaults(entry))
+        entry_data.metrics.enabled = entry.data.get(CONF_ENABLE_METRICS, True)
+        entry_data.tracer.sample_rate = _trace_sample_rate(entry)
+        if entry_data.failover is not None:
+            entry_data.failover.async_compile(
+                entry.data.get(CONF_FAILOVER_ROUTES),
+                entry_data.devices,
+                entry_data.categories,
+            )
+        if entry.data.get(CONF_PROMETHEUS, False):
+            from .prometheus import async_register_metrics_view
+
+            async_register_metrics_view(hass)
+
+    if changes.panel:
+        await _async_setup_panel(hass, entry.data.get(CONF_SHOW_SIDEBAR, True))
+
+    async_dispatcher_send(hass, signal_options_updated(entry.entry_id))
+    _LOGGER.debug("Applied option changes without reload: %s", sorted(changes.changed))
@@ -0,0 +1,85 @@
+"""Internal dispatch of notification events to device triggers.
+
+Statt dass jeder Geräte-Trigger einen eigenen Listener auf dem globalen
+Event-Bus anmeldet, hört jeder Eintrag genau einmal auf
+`mobile_app_notification_action` bzw. `_cleared` und verteilt hier:
+- Button-Aktionen (`action`) nach Action-ID
+- Lebenszyklus-Events (`cleared`, `expired`, siehe lifecycle.py) nach Kategorie
+- Trigger melden sich pro Eintrag, Art und Schlüssel an (Lookup per Dict)
+- Trigger ohne Schlüssel (beliebiger Button/Kategorie) stehen in einer eigenen Liste
+Der Dispatcher liegt unter `hass.data[DOMAIN]` und überlebt so ein Neuladen
+des Eintrags - angehängte Trigger bleiben gültig.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+
+from .const import DOMAIN
+
+ActionListener = Callable[[Event], None]
+
+KIND_ACTION = "action"
+
+
+class ActionDispatcher:
+    """Route notification events to the listeners of an entry, kind and key."""
+
+    def __init__(self) -> None:
+        """Initialize the dispatcher."""
+        # (entry id, kind, action/category or None for any) -> listeners
+        self._listeners: dict[
+            tuple[str | None, str, str | None], list[ActionListener]
+        ] = {}
+
+    def __len__(self) -> int:
+        """Return the number of attached listeners."""
+        return sum(len(listeners) for listeners in self._listeners.values())
+
+    @callback
+    def async_listen(
+        self,
+        entry_id: str | None,
+        kind: str,
+        key: str | None,
+        listener: ActionListener,
+    ) -> CALLBACK_TYPE:
+        """Call `listener` for events of a kind and key (any key if None)."""
+        index = (entry_id, kind, key)
+        listeners = self._listeners.setdefault(index, [])
+        listeners.append(listener)
+
+        @callback
+        def async_remove() -> None:
+            """Detach the listener."""
+            listeners.remove(listener)
+            if not listeners and self._listeners.get(index) is listeners:
+                del self._listeners[index]
+
+        return async_remove
+
+    @callback
+    def async_dispatch(
+        self, entry_id: str, kind: str, key: str | None, event: Event
+    ) -> None:
+        """Call the listeners of an event's kind and key."""
+        indexes = [(entry_id, kind, None)]
+        if key is not None:
+            indexes.insert(0, (entry_id, kind, key))
+        for index in indexes:
+            listeners = self._listeners.get(index)
+            if listeners:
+                # Copy: a listener may detach itself
+                for listener in listeners[:]:
+                    listener(event)
+
+
+@callback
+def async_get_action_dispatcher(hass: HomeAssistant) -> ActionDispatcher:
+    """Return the shared action dispatcher."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    dispatcher = domain_data.get("_action_dispatcher")
+    if dispatcher is None:
+        dispatcher = domain_data["_action_dispatcher"] = ActionDispatcher()
+    return dispatcher
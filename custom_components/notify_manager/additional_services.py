@@ -5,7 +5,6 @@ This module implements ALL remaining Companion App notification features:
 - Maps with pins (iOS)
 - Video/Audio attachments
 - Device Commands (Android)
-- Progress bars
 - Chronometer/Timer
 - Location requests
 - iOS-specific: Badge, Widgets, Complications
@@ -30,28 +29,28 @@ from .const import (
     ATTR_TAG,
     ATTR_DATA,
 )
+from .data import NotifyManagerConfigEntry
+from .delivery import async_notify_device
 
 _LOGGER = logging.getLogger(__name__)
 
 
-async def async_register_additional_services(hass: HomeAssistant, entry) -> None:
+async def async_register_additional_services(
+    hass: HomeAssistant, entry: NotifyManagerConfigEntry
+) -> None:
     """Register all additional Companion App services."""
     
     async def _send_to_devices(message: str, data: dict, targets: list[str] | None = None, title: str | None = None) -> None:
         """Send notification/command to specified devices."""
-        config_data = hass.data[DOMAIN].get(entry.entry_id, {})
-        devices = targets if targets else config_data.get("devices", [])
+        config_data = entry.runtime_data
+        devices = targets if targets else config_data.devices
         
+        payload = {"message": message, "data": data}
+        if title:
+            payload["title"] = title
         for device in devices:
-            service_name = f"mobile_app_{device}"
-            try:
-                payload = {"message": message, "data": data}
-                if title:
-                    payload["title"] = title
-                await hass.services.async_call("notify", service_name, payload, blocking=True)
-                _LOGGER.debug("Sent to %s: %s", device, message[:50])
-            except Exception as err:
-                _LOGGER.error("Failed to send to %s: %s", device, err)
+            await async_notify_device(hass, device, payload, config_data.health)
+
     
     # =========================================================================
     # TEXT-TO-SPEECH (Android)
@@ -186,39 +185,6 @@ async def async_register_additional_services(hass: HomeAssistant, entry) -> None
         })
     )
     
-    # =========================================================================
-    # PROGRESS BAR (Android)
-    # =========================================================================
-    async def handle_send_progress(call: ServiceCall) -> None:
-        """Send notification with progress bar (Android)."""
-        data = {
-            "tag": call.data[ATTR_TAG],
-            "progress": call.data["progress"],
-            "progress_max": call.data.get("progress_max", 100),
-        }
-        if call.data.get("progress_indeterminate"):
-            data["progress_indeterminate"] = True
-        
-        await _send_to_devices(
-            call.data[ATTR_MESSAGE], data,
-            call.data.get(ATTR_TARGET),
-            call.data.get(ATTR_TITLE)
-        )
-    
-    hass.services.async_register(
-        DOMAIN, "send_progress",
-        handle_send_progress,
-        schema=vol.Schema({
-            vol.Required(ATTR_TITLE): cv.string,
-            vol.Required(ATTR_MESSAGE): cv.string,
-            vol.Required("progress"): vol.All(vol.Coerce(int), vol.Range(min=-1, max=100)),
-            vol.Optional("progress_max", default=100): vol.Coerce(int),
-            vol.Optional("progress_indeterminate"): cv.boolean,
-            vol.Required(ATTR_TAG): cv.string,
-            vol.Optional(ATTR_TARGET): vol.All(cv.ensure_list, [cv.string]),
-        })
-    )
-    
     # =========================================================================
     # CHRONOMETER / TIMER (Android)
     # =========================================================================
@@ -518,7 +484,7 @@ async def async_register_additional_services(hass: HomeAssistant, entry) -> None
 async def async_unregister_additional_services(hass: HomeAssistant) -> None:
     """Unregister additional services."""
     services = [
-        "send_tts", "send_map", "send_media", "send_progress", "send_chronometer",
+        "send_tts", "send_map", "send_media", "send_chronometer",
         "device_command", "request_location_update", "update_widgets",
         "update_complications", "clear_badge", "set_badge", "send_advanced",
     ]
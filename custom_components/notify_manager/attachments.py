@@ -0,0 +1,228 @@
+"""Attachment pipeline for Notify Manager.
+
+Optional (Einstellung `resize_attachments`): Kamera-Snapshots und lokale
+Bilder (`/local/...`) werden pro Gerätetyp verkleinert und neu komprimiert,
+bevor sie an die Geräte gehen:
+- Profile mit maximaler Größe und JPEG-Qualität pro Gerätetyp (iOS/Android)
+- Verarbeitung im Executor, nie im Event-Loop
+- Ergebnisse werden nach (Quell-Hash, Profil) gecacht: Ableitungen von
+  Snapshots im Snapshot-Cache, von lokalen Bildern dauerhaft unter
+  `www/notify_manager/resized/` (kein Ablauf, die Quelle ist stabil)
+Benötigt Pillow; ohne Pillow bleiben die Bilder unverändert.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import io
+import logging
+from pathlib import Path
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .snapshot import SNAPSHOT_URL_BASE, async_get_snapshot_cache, content_hash
+
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover - Pillow is optional
+    Image = None
+
+_LOGGER = logging.getLogger(__name__)
+
+LOCAL_URL_PREFIX = "/local/"
+# Derivatives of local images, below www so they stay valid like their source
+DERIVED_DIR = f"{DOMAIN}/resized"
+
+# Remembered derivatives; the images live in the snapshot cache or DERIVED_DIR
+MAX_DERIVED_ENTRIES = 256
+
+
+@dataclass(frozen=True)
+class AttachmentProfile:
+    """Target size and quality of an image derivative."""
+
+    name: str
+    max_width: int
+    max_height: int
+    quality: int
+
+
+# iOS shows attachments up to the screen width, Android's big picture style
+# is scaled to about 2:1 and benefits from smaller files over cellular
+ATTACHMENT_PROFILES: dict[str, AttachmentProfile] = {
+    "ios": AttachmentProfile("ios", 1280, 1280, 80),
+    "android": AttachmentProfile("android", 1024, 512, 75),
+    "default": AttachmentProfile("default", 1024, 1024, 80),
+}
+
+
+def device_profile(device: str) -> AttachmentProfile:
+    """Return the profile for a device (detected from its name like the panel)."""
+    lower = device.lower()
+    if any(name in lower for name in ("iphone", "ipad", "mac")):
+        return ATTACHMENT_PROFILES["ios"]
+    if any(name in lower for name in ("pixel", "samsung", "android")):
+        return ATTACHMENT_PROFILES["android"]
+    return ATTACHMENT_PROFILES["default"]
+
+
+def resize_image(content: bytes, profile: AttachmentProfile) -> bytes | None:
+    """Return a resized JPEG, or None if it would not be smaller (blocking)."""
+    with Image.open(io.BytesIO(content)) as image:
+        image.thumbnail((profile.max_width, profile.max_height))
+        if image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        output = io.BytesIO()
+        image.save(output, format="JPEG", quality=profile.quality, optimize=True)
+
+    result = output.getvalue()
+    return result if len(result) < len(content) else None
+
+
+def _read_local_file(path: Path) -> bytes | None:
+    """Read a file below www (blocking)."""
+    return path.read_bytes() if path.is_file() else None
+
+
+def _local_derived_url(source_hash: str, profile: AttachmentProfile) -> str:
+    """Return the /local/ URL of the derivative of a local image."""
+    return f"{LOCAL_URL_PREFIX}{DERIVED_DIR}/{source_hash}_{profile.name}.jpg"
+
+
+def _write_local_file(path: Path, content: bytes) -> None:
+    """Write a derivative below www (blocking)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+
+
+class AttachmentPipeline:
+    """Create and cache device-specific image derivatives."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the pipeline."""
+        self.hass = hass
+        # (source hash, profile name) -> derivative url (None = keep original)
+        self._derived: dict[tuple[str, str], str | None] = {}
+
+    def _local_path(self, url: str) -> Path | None:
+        """Return the file of a /local/ URL, None if it leaves www."""
+        www = Path(self.hass.config.path("www")).resolve()
+        path = (www / url[len(LOCAL_URL_PREFIX):].split("?", 1)[0]).resolve()
+        return path if www in path.parents else None
+
+    async def _async_load_source(self, url: str) -> bytes | None:
+        """Return the bytes of a snapshot or local image."""
+        if url.startswith(SNAPSHOT_URL_BASE + "/"):
+            snapshot = async_get_snapshot_cache(self.hass).get(url.rsplit("/", 1)[1])
+            return snapshot.content if snapshot else None
+
+        if url.startswith(LOCAL_URL_PREFIX):
+            if (path := self._local_path(url)) is None:
+                return None
+            return await self.hass.async_add_executor_job(_read_local_file, path)
+
+        return None
+
+    async def _async_exists(self, url: str) -> bool:
+        """Return True if a derivative is still served."""
+        if url.startswith(SNAPSHOT_URL_BASE + "/"):
+            return async_get_snapshot_cache(self.hass).get(url.rsplit("/", 1)[1]) is not None
+        path = self._local_path(url)
+        return path is not None and await self.hass.async_add_executor_job(path.is_file)
+
+    async def _async_store(
+        self, url: str, source_hash: str, profile: AttachmentProfile, content: bytes
+    ) -> str:
+        """Store a derivative next to its source and return its URL."""
+        if url.startswith(SNAPSHOT_URL_BASE + "/"):
+            # Lives (and expires) with the snapshot it was made from
+            return await async_get_snapshot_cache(self.hass).async_put("image/jpeg", content)
+
+        derived = _local_derived_url(source_hash, profile)
+        await self.hass.async_add_executor_job(
+            _write_local_file, self._local_path(derived), content
+        )
+        return derived
+
+    async def async_derive(self, url: str, profile: AttachmentProfile) -> str:
+        """Return the URL of the derivative of an image for a profile."""
+        content = await self._async_load_source(url)
+        if content is None:
+            return url
+
+        if url.startswith(SNAPSHOT_URL_BASE + "/"):
+            # Snapshot URLs are content-addressed already
+            source_hash = url.rsplit("/", 1)[1].split(".", 1)[0]
+        else:
+            source_hash = await self.hass.async_add_executor_job(content_hash, content)
+
+        key = (source_hash, profile.name)
+        if key in self._derived and self._derived[key] is None:
+            return url
+        derived = self._derived.get(key)
+        if derived is None and not url.startswith(SNAPSHOT_URL_BASE + "/"):
+            # Written before a restart
+            derived = _local_derived_url(source_hash, profile)
+        if derived is not None and await self._async_exists(derived):
+            self._derived[key] = derived
+            return derived
+
+        try:
+            resized = await self.hass.async_add_executor_job(resize_image, content, profile)
+        except Exception as err:
+            _LOGGER.warning("Could not resize %s: %s", url, err)
+            resized = None
+
+        if len(self._derived) >= MAX_DERIVED_ENTRIES:
+            self._derived.pop(next(iter(self._derived)))
+
+        if resized is None:
+            self._derived[key] = None
+            return url
+
+        try:
+            derived = await self._async_store(url, source_hash, profile, resized)
+        except OSError as err:
+            _LOGGER.warning("Could not store the resized %s: %s", url, err)
+            return url
+        self._derived[key] = derived
+        _LOGGER.debug(
+            "Resized %s for %s: %d -> %d bytes", url, profile.name, len(content), len(resized)
+        )
+        return derived
+
+
+def is_resizable(url: object) -> bool:
+    """Return True if the pipeline can process an image URL."""
+    return isinstance(url, str) and (
+        url.startswith(SNAPSHOT_URL_BASE + "/")
+        or (
+            url.startswith(LOCAL_URL_PREFIX)
+            and not url.startswith(f"{LOCAL_URL_PREFIX}{DERIVED_DIR}/")
+        )
+    )
+
+
+async def async_prepare_attachments(
+    hass: HomeAssistant, data: dict, devices: list[str]
+) -> dict[str, dict]:
+    """Return the notification data per device, with resized images."""
+    per_device = {device: data for device in devices}
+    image = data.get("image")
+    if Image is None or not is_resizable(image):
+        return per_device
+
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    pipeline = domain_data.get("_attachments")
+    if pipeline is None:
+        pipeline = domain_data["_attachments"] = AttachmentPipeline(hass)
+
+    # One derivative per profile, shared by all devices of that type
+    by_profile: dict[str, dict] = {}
+    for device in devices:
+        profile = device_profile(device)
+        if profile.name not in by_profile:
+            derived = await pipeline.async_derive(image, profile)
+            by_profile[profile.name] = data if derived == image else {**data, "image": derived}
+        per_device[device] = by_profile[profile.name]
+    return per_device
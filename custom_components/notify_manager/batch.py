@@ -0,0 +1,103 @@
+"""Batch sending for Notify Manager.
+
+Mehrere Benachrichtigungen in EINEM Service-Aufruf (`send_batch`) bzw. einem
+WebSocket-Befehl (`notify_manager/send_batch`):
+- das Schema wird einmal beim Import aufgebaut und prüft die ganze Liste
+- alle Einträge laufen gemeinsam durch den Versandweg
+- Ergebnis pro Eintrag (Index, Status, Fehler)
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import logging
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.helpers import config_validation as cv
+
+from .const import (
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_TITLE,
+    ATTR_MESSAGE,
+    ATTR_TARGET,
+    ATTR_CATEGORY,
+    ATTR_PRIORITY,
+    ATTR_TAG,
+    ATTR_DATA,
+    PRIORITY_LEVELS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+ATTR_NOTIFICATIONS = "notifications"
+ATTR_TEMPLATE = "template"
+ATTR_GROUP_NAME = "group_name"
+
+MAX_BATCH_SIZE = 100
+
+
+def _require_content(item: dict[str, Any]) -> dict[str, Any]:
+    """Require either a template or a message."""
+    if not item.get(ATTR_TEMPLATE) and not item.get(ATTR_MESSAGE):
+        raise vol.Invalid("either 'template' or 'message' is required")
+    return item
+
+
+BATCH_ITEM_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(ATTR_TEMPLATE): cv.string,
+            vol.Optional(ATTR_TITLE): cv.string,
+            vol.Optional(ATTR_MESSAGE): cv.string,
+            vol.Optional(ATTR_TARGET): vol.All(cv.ensure_list, [cv.string]),
+            vol.Optional(ATTR_GROUP_NAME): cv.string,
+            vol.Optional(ATTR_CATEGORY): cv.string,
+            vol.Optional(ATTR_PRIORITY): vol.In(list(PRIORITY_LEVELS)),
+            vol.Optional(ATTR_TAG): cv.string,
+            vol.Optional(ATTR_DATA): dict,
+        }
+    ),
+    _require_content,
+)
+
+# Shared by the service and the WebSocket command
+SEND_BATCH_FIELDS = {
+    # Only needed with several entries
+    vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    vol.Required(ATTR_NOTIFICATIONS): vol.All(
+        cv.ensure_list, vol.Length(min=1, max=MAX_BATCH_SIZE), [BATCH_ITEM_SCHEMA]
+    ),
+}
+
+SEND_BATCH_SCHEMA = vol.Schema(SEND_BATCH_FIELDS)
+
+SendItemCallback = Callable[[dict[str, Any]], Awaitable[dict[str, Any]]]
+
+
+async def async_send_batch(
+    items: list[dict[str, Any]], send_item: SendItemCallback
+) -> dict[str, Any]:
+    """Send all items together and return the outcome per item.
+
+    `send_item` sends one validated item and returns its result dict
+    (at least a `status`). Exceptions are reported per item; a cancelled
+    item cancels the batch.
+    """
+    outcomes = await asyncio.gather(
+        *(send_item(item) for item in items), return_exceptions=True
+    )
+
+    results: list[dict[str, Any]] = []
+    for index, outcome in enumerate(outcomes):
+        if isinstance(outcome, asyncio.CancelledError):
+            raise outcome
+        if isinstance(outcome, BaseException):
+            _LOGGER.error("Batch item %d failed: %s", index, outcome)
+            results.append({"index": index, "status": "error", "error": str(outcome)})
+        else:
+            results.append({"index": index, **outcome})
+
+    sent = sum(1 for result in results if result["status"] == "sent")
+    return {"total": len(results), "sent": sent, "results": results}
@@ -0,0 +1,138 @@
+"""Brand icon installation for Notify Manager.
+
+Kopiert die Integrations-Icons nach `www/brands/notify_manager`, damit Home
+Assistant sie in der UI anzeigen kann. Läuft als Hintergrund-Task NACH dem
+Start von Home Assistant, alle Dateizugriffe im Executor:
+- Größe und Änderungszeit der Icons werden mit dem Store verglichen, gehasht
+  wird nur, wenn sie sich geändert haben
+- ein Content-Hash im Store sorgt dafür, dass nur nach einem Update der
+  Integration kopiert wird
+- erst danach wird `/local/brands/notify_manager` registriert (einmal pro
+  Lauf), damit der Pfad auch bei der ersten Installation existiert
+"""
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+BRAND_ICONS = ("icon.png", "icon@2x.png", "logo.png")
+
+BRAND_STORAGE_VERSION = 1
+BRAND_STORAGE_KEY = f"{DOMAIN}.brand"
+
+
+def brands_path(hass: HomeAssistant) -> Path:
+    """Return the target directory of the brand icons."""
+    return Path(hass.config.path("www")) / "brands" / DOMAIN
+
+
+def brand_icons_stat(component_dir: Path) -> list[list]:
+    """Return name, size and mtime of the bundled icons (blocking, use executor)."""
+    stats = []
+    for icon_name in BRAND_ICONS:
+        src = component_dir / icon_name
+        if src.is_file():
+            stat = src.stat()
+            stats.append([icon_name, stat.st_size, stat.st_mtime_ns])
+    return stats
+
+
+def hash_brand_icons(component_dir: Path) -> str:
+    """Return a content hash of the bundled icons (blocking, use executor)."""
+    import hashlib
+
+    digest = hashlib.sha256()
+    for icon_name in BRAND_ICONS:
+        src = component_dir / icon_name
+        if src.is_file():
+            digest.update(icon_name.encode())
+            digest.update(src.read_bytes())
+    return digest.hexdigest()
+
+
+def brand_icons_installed(brands_dir: Path) -> bool:
+    """Return True if all icons exist in the brands directory (blocking)."""
+    return all((brands_dir / icon_name).is_file() for icon_name in BRAND_ICONS)
+
+
+def install_brand_icons(component_dir: Path, brands_dir: Path) -> int:
+    """Copy the icons to the brands directory (blocking, use executor)."""
+    import shutil
+
+    brands_dir.mkdir(parents=True, exist_ok=True)
+    copied = 0
+    for icon_name in BRAND_ICONS:
+        src = component_dir / icon_name
+        if src.is_file():
+            shutil.copy2(src, brands_dir / icon_name)
+            copied += 1
+    return copied
+
+
+async def async_install_brand_icons(hass: HomeAssistant) -> None:
+    """Install the brand icons if the bundled icons changed."""
+    component_dir = Path(__file__).parent
+    brands_dir = brands_path(hass)
+    store: Store = Store(hass, BRAND_STORAGE_VERSION, BRAND_STORAGE_KEY)
+
+    try:
+        stored = await store.async_load() or {}
+        icons_stat, installed = await hass.async_add_executor_job(
+            _stat_and_check, component_dir, brands_dir
+        )
+
+        if installed and stored.get("stat") == icons_stat:
+            _LOGGER.debug("Brand icons up to date")
+        else:
+            # Size or mtime changed (or first run): compare the content
+            icons_hash = await hass.async_add_executor_job(hash_brand_icons, component_dir)
+            if not installed or stored.get("hash") != icons_hash:
+                copied = await hass.async_add_executor_job(
+                    install_brand_icons, component_dir, brands_dir
+                )
+                _LOGGER.info("Installed %d brand icons to %s", copied, brands_dir)
+            await store.async_save({"hash": icons_hash, "stat": icons_stat})
+
+        await async_register_brands_path(hass, brands_dir)
+    except Exception as err:
+        _LOGGER.warning("Could not setup brand icons: %s", err)
+
+
+def _stat_and_check(component_dir: Path, brands_dir: Path) -> tuple[list[list], bool]:
+    """Return the icon stats and whether they are installed (blocking)."""
+    return brand_icons_stat(component_dir), brand_icons_installed(brands_dir)
+
+
+async def async_register_brands_path(hass: HomeAssistant, brands_dir: Path) -> None:
+    """Serve the installed icons under /local/brands (once per HA run)."""
+    from homeassistant.components.http import StaticPathConfig
+
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if domain_data.get("_brands_registered"):
+        return
+    domain_data["_brands_registered"] = True
+    await hass.http.async_register_static_paths(
+        [StaticPathConfig(f"/local/brands/{DOMAIN}", str(brands_dir), cache_headers=True)]
+    )
+
+
+@callback
+def async_schedule_brand_icons(hass: HomeAssistant) -> None:
+    """Install the brand icons in the background once Home Assistant has started."""
+
+    @callback
+    def _started(hass: HomeAssistant) -> None:
+        """Start the installation as background task."""
+        hass.async_create_background_task(
+            async_install_brand_icons(hass), f"{DOMAIN}_brand_icons"
+        )
+
+    async_at_started(hass, _started)
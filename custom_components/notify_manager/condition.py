@@ -4,6 +4,7 @@ Ermöglicht die Verwendung von Notify Manager Zuständen als Bedingungen in Auto
 """
 from __future__ import annotations
 
+from datetime import datetime, timedelta
 import logging
 from typing import Any
 
@@ -16,6 +17,7 @@ from homeassistant.helpers.condition import ConditionCheckerType
 from homeassistant.helpers.typing import ConfigType
 
 from .const import DOMAIN, DEFAULT_CATEGORIES
+from .data import async_entries_data, async_get_entry_data
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,6 +31,7 @@ CONF_CATEGORY = "category"
 CONF_DEVICE = "device"
 CONF_ACTION = "action"
 CONF_WITHIN_SECONDS = "within_seconds"
+CONF_ENTRY_ID = "config_entry_id"
 
 
 CONDITION_SCHEMA = vol.Schema(
@@ -43,6 +46,7 @@ CONDITION_SCHEMA = vol.Schema(
         vol.Optional(CONF_DEVICE): cv.string,
         vol.Optional(CONF_ACTION): cv.string,
         vol.Optional(CONF_WITHIN_SECONDS, default=300): cv.positive_int,
+        vol.Optional(CONF_ENTRY_ID): cv.string,
     }
 )
 
@@ -84,25 +88,28 @@ def async_condition_from_config(
 ) -> ConditionCheckerType:
     """Create a condition from config."""
     condition_type = config["type"]
+    entry_id = config.get(CONF_ENTRY_ID)
     
     @callback
     def check_condition(hass: HomeAssistant, variables: dict[str, Any] | None = None) -> bool:
         """Check the condition."""
-        domain_data = hass.data.get(DOMAIN, {})
+        # One entry if configured, otherwise all set up entries
+        if entry_id:
+            entry_data = async_get_entry_data(hass, entry_id)
+            entries = [entry_data] if entry_data else []
+        else:
+            entries = [entry_data for _entry_id, entry_data in async_entries_data(hass)]
         
         if condition_type == CONDITION_CATEGORY_ENABLED:
             category = config.get(CONF_CATEGORY)
             if not category:
                 return False
             
-            # Find config entry data
-            for entry_data in domain_data.values():
-                if isinstance(entry_data, dict) and "categories" in entry_data:
-                    categories = entry_data.get("categories", {})
-                    cat_config = categories.get(category, {})
-                    return cat_config.get("enabled", True)
-            
-            return True  # Default to enabled if not found
+            # Disabled in any of the entries means disabled
+            return all(
+                entry_data.categories.get(category, {}).get("enabled", True)
+                for entry_data in entries
+            )
         
         elif condition_type == CONDITION_DEVICE_AVAILABLE:
             device = config.get(CONF_DEVICE)
@@ -110,9 +117,11 @@ def async_condition_from_config(
                 return False
             
             # Check if notify service exists
-            notify_services = hass.services.async_services().get("notify", {})
-            service_name = f"mobile_app_{device}"
-            return service_name in notify_services
+            if not hass.services.has_service("notify", f"mobile_app_{device}"):
+                return False
+
+            # Known dead devices (open circuit in any entry) are not available
+            return all(entry_data.health.available(device) for entry_data in entries)
         
         elif condition_type == CONDITION_LAST_ACTION:
             action = config.get(CONF_ACTION)
@@ -121,21 +130,17 @@ def async_condition_from_config(
             if not action:
                 return False
             
-            # Check last action in domain data
-            for entry_data in domain_data.values():
-                if isinstance(entry_data, dict) and "pending_actions" in entry_data:
-                    pending = entry_data.get("pending_actions", {})
-                    if action in pending:
-                        from datetime import datetime, timedelta
-                        action_data = pending[action]
-                        timestamp_str = action_data.get("timestamp")
-                        if timestamp_str:
-                            try:
-                                timestamp = datetime.fromisoformat(timestamp_str)
-                                if datetime.now() - timestamp < timedelta(seconds=within_seconds):
-                                    return True
-                            except (ValueError, TypeError):
-                                pass
+            # Check pending actions of the entries
+            cutoff = datetime.now() - timedelta(seconds=within_seconds)
+            for entry_data in entries:
+                action_data = entry_data.pending_actions.get(action)
+                timestamp_str = action_data.get("timestamp") if action_data else None
+                if timestamp_str:
+                    try:
+                        if datetime.fromisoformat(timestamp_str) >= cutoff:
+                            return True
+                    except (ValueError, TypeError):
+                        pass
             
             return False
         
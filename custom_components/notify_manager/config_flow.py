@@ -18,7 +18,18 @@ from .const import (
     CONF_DEFAULT_PRIORITY,
     CONF_ENABLE_HISTORY,
     CONF_SHOW_SIDEBAR,
+    CONF_DIGEST,
+    CONF_DIGEST_INTERVAL,
+    CONF_DIGEST_MAX_ITEMS,
+    CONF_COMPACT_ATTRIBUTES,
+    CONF_RESIZE_ATTACHMENTS,
+    CONF_ENABLE_METRICS,
+    CONF_PROMETHEUS,
+    CONF_TRACE_SAMPLE_RATE,
+    CONF_FAILOVER_ROUTES,
     DEFAULT_CATEGORIES,
+    DEFAULT_DIGEST_INTERVAL,
+    DEFAULT_DIGEST_MAX_ITEMS,
     PRIORITY_LEVELS,
 )
 
@@ -263,6 +274,7 @@ class NotifyManagerOptionsFlow(config_entries.OptionsFlow):
                     **current_cat,
                     "enabled": user_input.get(f"cat_{cat_id}", True),
                     "priority": user_input.get(f"priority_{cat_id}", current_cat.get("priority", "normal")),
+                    CONF_DIGEST: user_input.get(f"digest_{cat_id}", current_cat.get(CONF_DIGEST, False)),
                 }
 
             new_data = {**self._config_entry.data, CONF_CATEGORIES: categories}
@@ -286,6 +298,7 @@ class NotifyManagerOptionsFlow(config_entries.OptionsFlow):
                     mode=selector.SelectSelectorMode.DROPDOWN,
                 )
             )
+            schema_dict[vol.Optional(f"digest_{cat_id}", default=current_cat.get(CONF_DIGEST, False))] = selector.BooleanSelector()
 
         return self.async_show_form(
             step_id="categories",
@@ -299,6 +312,14 @@ class NotifyManagerOptionsFlow(config_entries.OptionsFlow):
         current_show_sidebar = self._config_entry.data.get(CONF_SHOW_SIDEBAR, True)
         current_history = self._config_entry.data.get(CONF_ENABLE_HISTORY, True)
         current_priority = self._config_entry.data.get(CONF_DEFAULT_PRIORITY, "normal")
+        current_digest_interval = self._config_entry.data.get(CONF_DIGEST_INTERVAL, DEFAULT_DIGEST_INTERVAL)
+        current_digest_max_items = self._config_entry.data.get(CONF_DIGEST_MAX_ITEMS, DEFAULT_DIGEST_MAX_ITEMS)
+        current_compact = self._config_entry.data.get(CONF_COMPACT_ATTRIBUTES, False)
+        current_resize = self._config_entry.data.get(CONF_RESIZE_ATTACHMENTS, False)
+        current_metrics = self._config_entry.data.get(CONF_ENABLE_METRICS, True)
+        current_prometheus = self._config_entry.data.get(CONF_PROMETHEUS, False)
+        current_trace_rate = self._config_entry.data.get(CONF_TRACE_SAMPLE_RATE, 0)
+        current_failover = self._config_entry.data.get(CONF_FAILOVER_ROUTES, [])
 
         if user_input is not None:
             new_data = {
@@ -306,12 +327,19 @@ class NotifyManagerOptionsFlow(config_entries.OptionsFlow):
                 CONF_SHOW_SIDEBAR: user_input.get(CONF_SHOW_SIDEBAR, True),
                 CONF_ENABLE_HISTORY: user_input.get(CONF_ENABLE_HISTORY, True),
                 CONF_DEFAULT_PRIORITY: user_input.get(CONF_DEFAULT_PRIORITY, "normal"),
+                CONF_DIGEST_INTERVAL: int(user_input.get(CONF_DIGEST_INTERVAL, DEFAULT_DIGEST_INTERVAL)),
+                CONF_DIGEST_MAX_ITEMS: int(user_input.get(CONF_DIGEST_MAX_ITEMS, DEFAULT_DIGEST_MAX_ITEMS)),
+                CONF_COMPACT_ATTRIBUTES: user_input.get(CONF_COMPACT_ATTRIBUTES, False),
+                CONF_RESIZE_ATTACHMENTS: user_input.get(CONF_RESIZE_ATTACHMENTS, False),
+                CONF_ENABLE_METRICS: user_input.get(CONF_ENABLE_METRICS, True),
+                CONF_PROMETHEUS: user_input.get(CONF_PROMETHEUS, False),
+                CONF_TRACE_SAMPLE_RATE: int(user_input.get(CONF_TRACE_SAMPLE_RATE, 0)),
+                CONF_FAILOVER_ROUTES: _as_route_list(user_input.get(CONF_FAILOVER_ROUTES)),
             }
+            # Applied by the update listener (reloads only if required)
             self.hass.config_entries.async_update_entry(
                 self._config_entry, data=new_data
             )
-            # Trigger reload to apply sidebar change
-            await self.hass.config_entries.async_reload(self._config_entry.entry_id)
             return self.async_create_entry(title="", data={})
 
         priority_options = [
@@ -329,6 +357,37 @@ class NotifyManagerOptionsFlow(config_entries.OptionsFlow):
                         mode=selector.SelectSelectorMode.DROPDOWN,
                     )
                 ),
+                vol.Optional(CONF_DIGEST_INTERVAL, default=current_digest_interval): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=30,
+                        max=86400,
+                        step=30,
+                        unit_of_measurement="s",
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
+                vol.Optional(CONF_DIGEST_MAX_ITEMS, default=current_digest_max_items): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=2,
+                        max=100,
+                        step=1,
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
+                vol.Optional(CONF_COMPACT_ATTRIBUTES, default=current_compact): selector.BooleanSelector(),
+                vol.Optional(CONF_RESIZE_ATTACHMENTS, default=current_resize): selector.BooleanSelector(),
+                vol.Optional(CONF_ENABLE_METRICS, default=current_metrics): selector.BooleanSelector(),
+                vol.Optional(CONF_PROMETHEUS, default=current_prometheus): selector.BooleanSelector(),
+                vol.Optional(CONF_TRACE_SAMPLE_RATE, default=current_trace_rate): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0,
+                        max=100,
+                        step=1,
+                        unit_of_measurement="%",
+                        mode=selector.NumberSelectorMode.SLIDER,
+                    )
+                ),
+                vol.Optional(CONF_FAILOVER_ROUTES, default=current_failover): selector.ObjectSelector(),
             }
         )
 
@@ -336,3 +395,12 @@ class NotifyManagerOptionsFlow(config_entries.OptionsFlow):
             step_id="settings",
             data_schema=data_schema,
         )
+
+
+def _as_route_list(value: Any) -> list[dict[str, Any]]:
+    """Return the failover routes from the object selector as list."""
+    if isinstance(value, dict):
+        return [value]
+    if isinstance(value, list):
+        return [route for route in value if isinstance(route, dict)]
+    return []
@@ -17,6 +17,32 @@ CONF_DEFAULT_PRIORITY = "default_priority"
 CONF_ENABLE_HISTORY = "enable_history"
 CONF_CALLBACK_AUTOMATIONS = "callback_automations"
 CONF_SHOW_SIDEBAR = "show_sidebar"
+CONF_DIGEST = "digest"
+CONF_DIGEST_INTERVAL = "digest_interval"
+CONF_DIGEST_MAX_ITEMS = "digest_max_items"
+CONF_COMPACT_ATTRIBUTES = "compact_attributes"
+CONF_RESIZE_ATTACHMENTS = "resize_attachments"
+CONF_ENABLE_METRICS = "enable_metrics"
+CONF_PROMETHEUS = "prometheus_metrics"
+CONF_TRACE_SAMPLE_RATE = "trace_sample_rate"
+CONF_FAILOVER_ROUTES = "failover_routes"
+
+# Digest defaults (collect low-priority notifications and send them combined)
+DEFAULT_DIGEST_INTERVAL = 300  # seconds
+DEFAULT_DIGEST_MAX_ITEMS = 10
+
+# Camera snapshots (one capture per send, shared by all recipients)
+SNAPSHOT_TTL = 600  # seconds
+SNAPSHOT_MAX_BYTES = 20 * 1024 * 1024
+
+# Progress streams (per tag): send on this change in percent or after the interval
+DEFAULT_PROGRESS_MIN_DELTA = 5  # percent
+DEFAULT_PROGRESS_MIN_INTERVAL = 2  # seconds
+DEFAULT_PROGRESS_IDLE_TIMEOUT = 900  # seconds without update, then forgotten
+
+# Device health: skip a device after this many failures in a row, probe again after the cool-down
+DEFAULT_FAILURE_THRESHOLD = 3
+DEFAULT_CIRCUIT_COOLDOWN = 300  # seconds
 
 # Service names
 SERVICE_SEND_NOTIFICATION = "send_notification"
@@ -33,6 +59,7 @@ SERVICE_DEVICE_COMMAND = "device_command"
 SERVICE_REQUEST_LOCATION = "request_location_update"
 
 # Attribute names - Basic
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
 ATTR_TITLE = "title"
 ATTR_MESSAGE = "message"
 ATTR_TARGET = "target"
@@ -83,6 +110,7 @@ ATTR_SHOWS_SCALE = "shows_scale"
 # Progress/Chronometer (Android)
 ATTR_PROGRESS = "progress"
 ATTR_PROGRESS_MAX = "progress_max"
+ATTR_PROGRESS_INDETERMINATE = "progress_indeterminate"
 ATTR_CHRONOMETER = "chronometer"
 ATTR_WHEN = "when"
 
@@ -184,6 +212,7 @@ DEFAULT_CATEGORIES = {
         "channel": "system",
         "color": "#9E9E9E",
         "interruption_level": "passive",
+        "digest": False,
     },
     "info": {
         "name": "Information",
@@ -195,6 +224,7 @@ DEFAULT_CATEGORIES = {
         "channel": "info",
         "color": "#4CAF50",
         "interruption_level": "passive",
+        "digest": False,
     },
 }
 
@@ -252,83 +282,33 @@ ACTION_TEMPLATES = {
     ],
 }
 
-# Default notification templates (synced with frontend)
-DEFAULT_NOTIFICATION_TEMPLATES = {
-    "🚪 Türklingel": {
-        "id": "doorbell",
-        "name": "🚪 Türklingel",
-        "title": "Türklingel",
-        "message": "Jemand ist an der Tür!",
-        "type": "image",
-        "priority": "high",
-        "buttons": [
-            {"action": "DOOR_UNLOCK", "title": "🔓 Öffnen"},
-            {"action": "DOOR_IGNORE", "title": "Ignorieren"},
-        ],
-    },
-    "🚨 Alarm": {
-        "id": "alarm",
-        "name": "🚨 Alarm",
-        "title": "Alarm!",
-        "message": "Bewegung erkannt",
-        "type": "buttons",
-        "priority": "critical",
-        "buttons": [
-            {"action": "ALARM_CONFIRM", "title": "✅ OK"},
-            {"action": "ALARM_EMERGENCY", "title": "🆘 Notfall"},
-        ],
-    },
-    "⏰ Erinnerung": {
-        "id": "reminder",
-        "name": "⏰ Erinnerung",
-        "title": "Erinnerung",
-        "message": "",
-        "type": "simple",
-        "priority": "normal",
-        "buttons": [],
-    },
-    "📦 Paket": {
-        "id": "package",
-        "name": "📦 Paket",
-        "title": "Paket angekommen",
-        "message": "Ein Paket wurde geliefert!",
-        "type": "buttons",
-        "priority": "normal",
-        "buttons": [
-            {"action": "CONFIRM", "title": "✅ Gesehen"},
-        ],
-    },
-    "🔔 Standard": {
-        "id": "default",
-        "name": "🔔 Standard",
-        "title": "Benachrichtigung",
-        "message": "",
-        "type": "simple",
-        "priority": "normal",
-        "buttons": [],
-    },
-}
-
-# Sound options for iOS
-IOS_SOUNDS = [
-    "default",
-    "none",
-    "US-EN-Alexa-Motion-Detected-Generic.wav",
-    "US-EN-Alexa-Motion-At-Back-Door.wav",
-    "US-EN-Alexa-Motion-At-Front-Door.wav",
-    "US-EN-Daisy-Back-Door-Motion.wav",
-    "US-EN-Daisy-Front-Door-Motion.wav",
-    "US-EN-Morgan-Freeman-Back-Door-Motion.wav",
-    "US-EN-Morgan-Freeman-Front-Door-Motion.wav",
+# All known button actions (from ACTION_TEMPLATES)
+KNOWN_BUTTON_ACTIONS = [
+    "CONFIRM",
+    "DISMISS",
+    "YES",
+    "NO",
+    "ALARM_CONFIRM",
+    "ALARM_SNOOZE",
+    "ALARM_EMERGENCY",
+    "DOOR_UNLOCK",
+    "DOOR_IGNORE",
+    "DOOR_SPEAK",
+    "REPLY",
 ]
 
-# Android notification channels (created automatically)
-ANDROID_CHANNELS = {
-    "alarm": {"name": "Alarm", "importance": "high", "vibration": True, "sound": True},
-    "security": {"name": "Sicherheit", "importance": "high", "vibration": True, "sound": True},
-    "doorbell": {"name": "Türklingel", "importance": "high", "vibration": True, "sound": True},
-    "motion": {"name": "Bewegung", "importance": "default", "vibration": False, "sound": True},
-    "climate": {"name": "Klima", "importance": "default", "vibration": False, "sound": False},
-    "system": {"name": "System", "importance": "low", "vibration": False, "sound": False},
-    "info": {"name": "Information", "importance": "low", "vibration": False, "sound": False},
-}
+
+# Große Vorgabe-Daten liegen in default_templates.py und werden erst beim
+# ersten Zugriff importiert (z.B. `from .const import DEFAULT_NOTIFICATION_TEMPLATES`)
+_LAZY_CONSTANTS = ("DEFAULT_NOTIFICATION_TEMPLATES", "IOS_SOUNDS", "ANDROID_CHANNELS")
+
+
+def __getattr__(name: str):
+    """Import rarely used default data on first access."""
+    if name in _LAZY_CONSTANTS:
+        from . import default_templates
+
+        value = getattr(default_templates, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,188 @@
+"""Runtime data of Notify Manager config entries.
+
+Alles, was ein Config Entry zur Laufzeit braucht, liegt typisiert in
+`entry.runtime_data` statt in einem gemeinsamen Dict unter `hass.data`:
+- mehrere Einträge (z.B. Haushalt und Personal) überschreiben sich nicht
+- jeder Eintrag hat seinen eigenen Store (`notify_manager.templates.<entry_id>`)
+- Bedingungen und Aktionen finden ihren Eintrag direkt über die Geräte-ID
+- Services und WebSocket-Befehle gibt es nur einmal; sie bestimmen den
+  Eintrag bei jedem Aufruf (`config_entry_id`, Gerät, Entity oder der
+  einzige geladene Eintrag)
+`hass.data[DOMAIN]` enthält nur noch eintragsübergreifende Helfer (`_xxx`).
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .digest import NotificationDigest
+    from .failover import FailoverRouter
+    from .health import HealthTracker
+    from .lifecycle import ActiveNotifications
+    from .metrics import Metrics
+    from .progress import ProgressStream
+    from .registry import TemplateRegistry
+    from .rendering import TemplateRenderer
+    from .tracing import TraceRecorder
+
+STORAGE_VERSION = 1
+# Shared store of older versions, taken over by the first entry
+LEGACY_STORAGE_KEY = f"{DOMAIN}.templates"
+
+# Entities and conditions may run while the platforms are still set up
+_ACTIVE_STATES = (ConfigEntryState.SETUP_IN_PROGRESS, ConfigEntryState.LOADED)
+
+HISTORY_SIZE = 100
+
+
+@dataclass(slots=True)
+class NotifyManagerData:
+    """Runtime state of one config entry."""
+
+    config: Mapping[str, Any]
+    store: Store
+    devices: list[str]
+    categories: dict[str, dict[str, Any]]
+    user_templates: list[dict[str, Any]]
+    user_groups: list[dict[str, Any]]
+    template_registry: TemplateRegistry
+    metrics: Metrics
+    tracer: TraceRecorder
+    health: HealthTracker
+    notification_history: list[dict[str, Any]] = field(default_factory=list)
+    pending_actions: dict[str, dict[str, Any]] = field(default_factory=dict)
+    last_action: dict[str, Any] | None = None
+    last_sent_notification: dict[str, Any] | None = None
+    failover: FailoverRouter | None = None
+    active_notifications: ActiveNotifications | None = None
+    digest: NotificationDigest | None = None
+    template_renderer: TemplateRenderer | None = None
+    progress_stream: ProgressStream | None = None
+    send_template: Callable[..., Awaitable[dict[str, Any]]] | None = None
+    send_batch: Callable[[list[dict[str, Any]]], Awaitable[dict[str, Any]]] | None = None
+    send_progress: Callable[[dict[str, Any]], Awaitable[dict[str, Any]]] | None = None
+    # Option lists of the automation editor: key -> (template version, value)
+    capability_cache: dict[str, tuple[int, Any]] = field(default_factory=dict)
+
+    def add_history(self, history_entry: dict[str, Any]) -> None:
+        """Append to the history, keeping the newest entries."""
+        self.notification_history.append(history_entry)
+        if len(self.notification_history) > HISTORY_SIZE:
+            del self.notification_history[:-HISTORY_SIZE]
+
+    async def async_save(self) -> None:
+        """Persist templates and groups of this entry."""
+        await self.store.async_save({
+            "templates": self.user_templates,
+            "groups": self.user_groups,
+        })
+
+
+NotifyManagerConfigEntry = ConfigEntry[NotifyManagerData]
+
+
+def entry_store(hass: HomeAssistant, entry_id: str) -> Store:
+    """Return the template/group store of an entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.templates.{entry_id}")
+
+
+async def async_load_stored_data(hass: HomeAssistant, store: Store) -> dict[str, Any]:
+    """Load the stored templates and groups of an entry.
+
+    The first entry without own data takes over the old shared store.
+    """
+    stored_data = await store.async_load()
+    if stored_data is None:
+        # Entries are set up concurrently, only one may take over
+        lock = hass.data.setdefault(DOMAIN, {}).setdefault("_storage_lock", asyncio.Lock())
+        async with lock:
+            legacy = Store(hass, STORAGE_VERSION, LEGACY_STORAGE_KEY)
+            stored_data = await legacy.async_load()
+            if stored_data is not None:
+                await store.async_save(stored_data)
+                await legacy.async_remove()
+    return stored_data or {"templates": [], "groups": []}
+
+
+@callback
+def async_get_entry_data(hass: HomeAssistant, entry_id: str | None) -> NotifyManagerData | None:
+    """Return the runtime data of a set up entry."""
+    entry = hass.config_entries.async_get_entry(entry_id) if entry_id else None
+    if entry is None or entry.domain != DOMAIN or entry.state not in _ACTIVE_STATES:
+        return None
+    return getattr(entry, "runtime_data", None)
+
+
+@callback
+def async_get_device_entry_id(hass: HomeAssistant, device_id: str) -> str | None:
+    """Return the Notify Manager entry a device belongs to."""
+    device = dr.async_get(hass).async_get(device_id)
+    if device is None:
+        return None
+    for identifier_domain, entry_id in device.identifiers:
+        if identifier_domain == DOMAIN:
+            return entry_id
+    return None
+
+
+@callback
+def async_entries_data(hass: HomeAssistant) -> list[tuple[str, NotifyManagerData]]:
+    """Return (entry id, runtime data) of all set up entries."""
+    return [
+        (entry.entry_id, data)
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if (data := async_get_entry_data(hass, entry.entry_id)) is not None
+    ]
+
+
+@callback
+def async_resolve_entry(
+    hass: HomeAssistant,
+    config_entry_id: str | None = None,
+    device_id: str | None = None,
+    entity_id: str | None = None,
+    *,
+    first: bool = False,
+) -> NotifyManagerConfigEntry:
+    """Return the set up entry a service call or command is meant for.
+
+    Without an entry, device or entity of ours, the only set up entry is used
+    (with `first`, the first of several). Raises ServiceValidationError if
+    there is none or it is ambiguous.
+    """
+    if not config_entry_id and device_id:
+        config_entry_id = async_get_device_entry_id(hass, device_id)
+    if not config_entry_id and entity_id:
+        entity = er.async_get(hass).async_get(entity_id)
+        if entity is not None and entity.platform == DOMAIN:
+            config_entry_id = entity.config_entry_id
+
+    if config_entry_id:
+        entry = hass.config_entries.async_get_entry(config_entry_id)
+        if entry is None or entry.domain != DOMAIN or entry.state not in _ACTIVE_STATES:
+            raise ServiceValidationError(f"Notify Manager entry {config_entry_id} is not loaded")
+        return entry
+
+    entries = [
+        entry
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.state in _ACTIVE_STATES
+    ]
+    if len(entries) == 1 or (entries and first):
+        return entries[0]
+    if not entries:
+        raise ServiceValidationError("Notify Manager is not set up")
+    raise ServiceValidationError(
+        "Several Notify Manager entries are set up, set config_entry_id"
+    )
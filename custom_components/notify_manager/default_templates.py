@@ -0,0 +1,86 @@
+"""Default notification templates and reference data for Notify Manager.
+
+Wird nur bei Bedarf geladen (WebSocket-Abfragen, send_from_template).
+"""
+from __future__ import annotations
+
+# Default notification templates (synced with frontend)
+DEFAULT_NOTIFICATION_TEMPLATES = {
+    "🚪 Türklingel": {
+        "id": "doorbell",
+        "name": "🚪 Türklingel",
+        "title": "Türklingel",
+        "message": "Jemand ist an der Tür!",
+        "type": "image",
+        "priority": "high",
+        "buttons": [
+            {"action": "DOOR_UNLOCK", "title": "🔓 Öffnen"},
+            {"action": "DOOR_IGNORE", "title": "Ignorieren"},
+        ],
+    },
+    "🚨 Alarm": {
+        "id": "alarm",
+        "name": "🚨 Alarm",
+        "title": "Alarm!",
+        "message": "Bewegung erkannt",
+        "type": "buttons",
+        "priority": "critical",
+        "buttons": [
+            {"action": "ALARM_CONFIRM", "title": "✅ OK"},
+            {"action": "ALARM_EMERGENCY", "title": "🆘 Notfall"},
+        ],
+    },
+    "⏰ Erinnerung": {
+        "id": "reminder",
+        "name": "⏰ Erinnerung",
+        "title": "Erinnerung",
+        "message": "",
+        "type": "simple",
+        "priority": "normal",
+        "buttons": [],
+    },
+    "📦 Paket": {
+        "id": "package",
+        "name": "📦 Paket",
+        "title": "Paket angekommen",
+        "message": "Ein Paket wurde geliefert!",
+        "type": "buttons",
+        "priority": "normal",
+        "buttons": [
+            {"action": "CONFIRM", "title": "✅ Gesehen"},
+        ],
+    },
+    "🔔 Standard": {
+        "id": "default",
+        "name": "🔔 Standard",
+        "title": "Benachrichtigung",
+        "message": "",
+        "type": "simple",
+        "priority": "normal",
+        "buttons": [],
+    },
+}
+
+# Sound options for iOS
+IOS_SOUNDS = [
+    "default",
+    "none",
+    "US-EN-Alexa-Motion-Detected-Generic.wav",
+    "US-EN-Alexa-Motion-At-Back-Door.wav",
+    "US-EN-Alexa-Motion-At-Front-Door.wav",
+    "US-EN-Daisy-Back-Door-Motion.wav",
+    "US-EN-Daisy-Front-Door-Motion.wav",
+    "US-EN-Morgan-Freeman-Back-Door-Motion.wav",
+    "US-EN-Morgan-Freeman-Front-Door-Motion.wav",
+]
+
+# Android notification channels (created automatically)
+ANDROID_CHANNELS = {
+    "alarm": {"name": "Alarm", "importance": "high", "vibration": True, "sound": True},
+    "security": {"name": "Sicherheit", "importance": "high", "vibration": True, "sound": True},
+    "doorbell": {"name": "Türklingel", "importance": "high", "vibration": True, "sound": True},
+    "motion": {"name": "Bewegung", "importance": "default", "vibration": False, "sound": True},
+    "climate": {"name": "Klima", "importance": "default", "vibration": False, "sound": False},
+    "system": {"name": "System", "importance": "low", "vibration": False, "sound": False},
+    "info": {"name": "Information", "importance": "low", "vibration": False, "sound": False},
+}
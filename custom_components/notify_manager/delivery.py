@@ -0,0 +1,114 @@
+"""Delivery results for Notify Manager.
+
+Jeder Versand liefert ein Ergebnis, das Services als Antwort zurückgeben
+können (`SupportsResponse.OPTIONAL`):
+- aufgelöste Ziele sowie Status und Latenz pro Gerät
+- Geräte mit offenem Circuit Breaker (siehe health.py) werden übersprungen
+- `tag` und eine Korrelations-ID (steht auch im Event und im Verlauf)
+- Gesamtstatus: sent, partial, failed, skipped oder queued
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util.ulid import ulid_now
+
+from .health import HealthTracker
+
+_LOGGER = logging.getLogger(__name__)
+
+STATUS_SENT = "sent"
+STATUS_PARTIAL = "partial"
+STATUS_FAILED = "failed"
+STATUS_SKIPPED = "skipped"
+STATUS_QUEUED = "queued"
+
+
+def new_correlation_id() -> str:
+    """Return a new id that links a send call to its event and history entry."""
+    return ulid_now()
+
+
+async def async_notify_device(
+    hass: HomeAssistant,
+    device: str,
+    payload: dict[str, Any],
+    health: HealthTracker | None = None,
+) -> dict[str, Any]:
+    """Call the mobile_app notify service of one device and time it."""
+    if health is not None and not health.allow(device):
+        _LOGGER.debug("Skipping %s, circuit is open", device)
+        return {
+            "device": device,
+            "status": STATUS_SKIPPED,
+            "latency_ms": 0.0,
+            "reason": "circuit_open",
+        }
+
+    start = time.monotonic()
+    outcome: dict[str, Any] | None = None
+    try:
+        await hass.services.async_call(
+            "notify", f"mobile_app_{device}", payload, blocking=True
+        )
+    except Exception as err:
+        _LOGGER.error("Failed to send notification to %s: %s", device, err)
+        outcome = {
+            "device": device,
+            "status": STATUS_FAILED,
+            "latency_ms": _elapsed_ms(start),
+            "error": str(err),
+        }
+    else:
+        _LOGGER.debug("Sent notification to %s", device)
+        outcome = {"device": device, "status": STATUS_SENT, "latency_ms": _elapsed_ms(start)}
+    finally:
+        # A cancelled call must not keep the half-open probe taken
+        if health is not None:
+            if outcome is None:
+                health.release(device)
+            else:
+                health.record(device, outcome)
+    return outcome
+
+
+def _elapsed_ms(start: float) -> float:
+    """Return the milliseconds since `start`."""
+    return round((time.monotonic() - start) * 1000, 1)
+
+
+def overall_status(outcomes: list[dict[str, Any]]) -> str:
+    """Return the combined status of the device outcomes."""
+    sent = sum(1 for outcome in outcomes if outcome["status"] == STATUS_SENT)
+    if all(outcome["status"] == STATUS_SKIPPED for outcome in outcomes):
+        return STATUS_SKIPPED
+    if sent == len(outcomes):
+        return STATUS_SENT
+    return STATUS_PARTIAL if sent else STATUS_FAILED
+
+
+def delivery_result(
+    targets: Iterable[str],
+    outcomes: list[dict[str, Any]] | None = None,
+    *,
+    tag: str | None = None,
+    correlation_id: str | None = None,
+    status: str | None = None,
+    reason: str | None = None,
+) -> dict[str, Any]:
+    """Build the response of one send call."""
+    outcomes = outcomes or []
+    result: dict[str, Any] = {
+        "status": status or overall_status(outcomes),
+        "targets": list(targets),
+        "devices": outcomes,
+        "tag": tag,
+        "correlation_id": correlation_id,
+    }
+    if reason:
+        result["reason"] = reason
+    return result
@@ -19,6 +19,7 @@ from homeassistant.core import Context, HomeAssistant
 from homeassistant.helpers import config_validation as cv, device_registry as dr
 
 from .const import DOMAIN
+from .data import async_get_device_entry_id, async_get_entry_data
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -98,8 +99,10 @@ async def async_call_action_from_config(
         )
         
     elif action_type == "clear_history":
-        # Clear notification history
-        for entry_id, entry_data in hass.data.get(DOMAIN, {}).items():
-            if isinstance(entry_data, dict) and "notification_history" in entry_data:
-                entry_data["notification_history"] = []
-        _LOGGER.info("Notification history cleared")
+        # Clear the history of the entry this device belongs to
+        entry_data = async_get_entry_data(
+            hass, async_get_device_entry_id(hass, config[CONF_DEVICE_ID])
+        )
+        if entry_data is not None:
+            entry_data.notification_history.clear()
+            _LOGGER.info("Notification history cleared")
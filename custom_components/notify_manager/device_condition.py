@@ -4,6 +4,7 @@ Provides dynamic conditions based on user-created templates and their actions.
 """
 from __future__ import annotations
 
+from datetime import datetime, timedelta
 import logging
 from typing import Any
 
@@ -11,32 +12,29 @@ import voluptuous as vol
 
 from homeassistant.components.device_automation import DEVICE_CONDITION_BASE_SCHEMA
 from homeassistant.const import (
+    ATTR_DOMAIN,
     CONF_CONDITION,
     CONF_DEVICE_ID,
     CONF_DOMAIN,
     CONF_TYPE,
+    EVENT_SERVICE_REGISTERED,
+    EVENT_SERVICE_REMOVED,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers import condition, config_validation as cv, device_registry as dr
 from homeassistant.helpers.typing import ConfigType, TemplateVarsType
 
 from .const import DOMAIN
+from .data import async_get_device_entry_id, async_get_entry_data
 
 _LOGGER = logging.getLogger(__name__)
 
+# Marks the device field cache as outdated (None means: no devices)
+_NOT_CACHED = object()
 
-def _get_user_templates(hass: HomeAssistant) -> list[dict]:
-    """Get user templates from HA storage."""
-    domain_data = hass.data.get(DOMAIN, {})
-    for entry_data in domain_data.values():
-        if isinstance(entry_data, dict) and "user_templates" in entry_data:
-            return entry_data.get("user_templates", [])
-    return []
 
-
-def _get_all_action_ids(hass: HomeAssistant) -> dict[str, str]:
+def _get_all_action_ids(templates: list[dict]) -> dict[str, str]:
     """Extract all action IDs from user templates."""
-    templates = _get_user_templates(hass)
     actions = {}
 
     for template in templates:
@@ -55,9 +53,8 @@ def _get_all_action_ids(hass: HomeAssistant) -> dict[str, str]:
     return actions
 
 
-def _get_all_template_names(hass: HomeAssistant) -> dict[str, str]:
+def _get_all_template_names(templates: list[dict]) -> dict[str, str]:
     """Get all template names for filtering."""
-    templates = _get_user_templates(hass)
     names = {"any": "Any Template"}
 
     for template in templates:
@@ -128,83 +125,71 @@ def async_condition_from_config(
 ) -> condition.ConditionCheckerType:
     """Create a condition from config."""
     condition_type = config[CONF_TYPE]
+    # The entry of the device is resolved once, its data on every test
+    entry_id = async_get_device_entry_id(hass, config[CONF_DEVICE_ID])
 
     @callback
     def test_condition(
         hass: HomeAssistant, variables: TemplateVarsType = None
     ) -> bool:
         """Test the condition."""
-        domain_data = hass.data.get(DOMAIN, {})
+        entry_data = async_get_entry_data(hass, entry_id)
+        if entry_data is None:
+            return False
 
         if condition_type == "device_available":
             device = config.get("device")
             if not device:
                 return False
 
-            notify_services = hass.services.async_services().get("notify", {})
-            service_name = f"mobile_app_{device}"
-            return service_name in notify_services
+            if not hass.services.has_service("notify", f"mobile_app_{device}"):
+                return False
+
+            # Known dead devices (open circuit) are not available
+            return entry_data.health.available(device)
 
-        elif condition_type == "last_action_was":
+        if condition_type == "last_action_was":
             action = config.get("action")
             template_name = config.get("template_name")
-            within_seconds = config.get("within_seconds", 300)
-
             if not action:
                 return False
-
-            for entry_data in domain_data.values():
-                if isinstance(entry_data, dict):
-                    # Check last_button_action (from select entity)
-                    last_action = entry_data.get("last_button_action")
-                    last_template = entry_data.get("last_button_template")
-                    last_time = entry_data.get("last_button_time")
-
-                    if last_action == action:
-                        # Check template filter if specified
-                        if template_name and template_name != "any":
-                            if last_template != template_name:
-                                continue
-
-                        # Check time window
-                        if last_time:
-                            from datetime import datetime, timedelta
-                            try:
-                                timestamp = datetime.fromisoformat(last_time)
-                                if datetime.now() - timestamp < timedelta(seconds=within_seconds):
-                                    return True
-                            except (ValueError, TypeError):
-                                pass
-                        else:
-                            # No timestamp, but action matches
-                            return True
-
-                    # Fallback: check pending_actions
-                    pending = entry_data.get("pending_actions", {})
-                    if action in pending:
-                        from datetime import datetime, timedelta
-                        action_data = pending[action]
-
-                        # Check template filter
-                        if template_name and template_name != "any":
-                            if action_data.get("template_name") != template_name:
-                                continue
-
-                        timestamp_str = action_data.get("timestamp")
-                        if timestamp_str:
-                            try:
-                                timestamp = datetime.fromisoformat(timestamp_str)
-                                if datetime.now() - timestamp < timedelta(seconds=within_seconds):
-                                    return True
-                            except (ValueError, TypeError):
-                                pass
-            return False
+            if template_name == "any":
+                template_name = None
+            cutoff = datetime.now() - timedelta(seconds=config.get("within_seconds", 300))
+
+            # Last button press (from the sensor) - it does not know the template
+            last_action = entry_data.last_action
+            if (
+                not template_name
+                and last_action
+                and last_action.get("action") == action
+                and _is_recent(last_action.get("timestamp"), cutoff)
+            ):
+                return True
+
+            # Fallback: pending actions
+            action_data = entry_data.pending_actions.get(action)
+            if action_data is None:
+                return False
+            if template_name and action_data.get("template_name") != template_name:
+                return False
+            return _is_recent(action_data.get("timestamp"), cutoff)
 
         return False
 
     return test_condition
 
 
+def _is_recent(timestamp: str | None, cutoff: datetime) -> bool:
+    """Return True if an ISO timestamp is newer than the cutoff."""
+    if not timestamp:
+        return False
+    try:
+        return datetime.fromisoformat(timestamp) >= cutoff
+    except (ValueError, TypeError):
+        return False
+
+
 async def async_get_condition_capabilities(
     hass: HomeAssistant, config: ConfigType
 ) -> dict[str, vol.Schema]:
@@ -212,35 +197,83 @@ async def async_get_condition_capabilities(
     condition_type = config.get(CONF_TYPE)
 
     if condition_type == "device_available":
-        # Get available devices dynamically
-        devices = []
-        for service in hass.services.async_services().get("notify", {}):
-            if service.startswith("mobile_app_"):
-                devices.append(service.replace("mobile_app_", ""))
-
-        if devices:
-            return {
-                "extra_fields": vol.Schema(
-                    {
-                        vol.Required("device"): vol.In(devices),
-                    }
-                )
-            }
-        return {}
+        fields = _async_device_available_fields(hass)
+        return {"extra_fields": fields} if fields is not None else {}
 
     elif condition_type == "last_action_was":
-        # Get actions dynamically from user templates
-        action_options = _get_all_action_ids(hass)
-        template_options = _get_all_template_names(hass)
-
-        return {
-            "extra_fields": vol.Schema(
-                {
-                    vol.Required("action"): vol.In(list(action_options.keys())),
-                    vol.Optional("template_name", default="any"): vol.In(list(template_options.keys())),
-                    vol.Optional("within_seconds", default=300): cv.positive_int,
-                }
-            )
-        }
+        return {"extra_fields": _async_last_action_fields(hass, config[CONF_DEVICE_ID])}
 
     return {}
+
+
+@callback
+def _async_device_available_fields(hass: HomeAssistant) -> vol.Schema | None:
+    """Return the device field, cached until a notify service is added or removed."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    shared_listeners = domain_data.get("_shared_listeners")
+    if shared_listeners is None:
+        # No entry loaded: nothing would keep a cache up to date
+        return _build_device_available_fields(hass)
+
+    if "_notify_device_fields" not in domain_data:
+
+        @callback
+        def _async_services_changed(event: Event) -> None:
+            """Drop the cached devices when the notify services change."""
+            if event.data.get(ATTR_DOMAIN) == "notify":
+                domain_data["_notify_device_fields"] = _NOT_CACHED
+
+        # Removed with the shared listeners after the last entry
+        shared_listeners.extend(
+            (
+                hass.bus.async_listen(EVENT_SERVICE_REGISTERED, _async_services_changed),
+                hass.bus.async_listen(EVENT_SERVICE_REMOVED, _async_services_changed),
+            )
+        )
+        domain_data["_notify_device_fields"] = _NOT_CACHED
+
+    fields = domain_data["_notify_device_fields"]
+    if fields is _NOT_CACHED:
+        fields = domain_data["_notify_device_fields"] = _build_device_available_fields(hass)
+    return fields
+
+
+@callback
+def _build_device_available_fields(hass: HomeAssistant) -> vol.Schema | None:
+    """Build the device field from the mobile_app notify services."""
+    devices = sorted(
+        service.removeprefix("mobile_app_")
+        for service in hass.services.async_services_for_domain("notify")
+        if service.startswith("mobile_app_")
+    )
+    return vol.Schema({vol.Required("device"): vol.In(devices)}) if devices else None
+
+
+@callback
+def _async_last_action_fields(hass: HomeAssistant, device_id: str) -> vol.Schema:
+    """Return the action/template fields, cached per template registry version."""
+    entry_data = async_get_entry_data(hass, async_get_device_entry_id(hass, device_id))
+    if entry_data is None:
+        return _build_last_action_fields([])
+
+    version = entry_data.template_registry.version
+    cached = entry_data.capability_cache.get("last_action_was")
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    fields = _build_last_action_fields(entry_data.template_registry.templates)
+    entry_data.capability_cache["last_action_was"] = (version, fields)
+    return fields
+
+
+def _build_last_action_fields(templates: list[dict]) -> vol.Schema:
+    """Build the action/template fields from user templates."""
+    action_options = _get_all_action_ids(templates)
+    template_options = _get_all_template_names(templates)
+    return vol.Schema(
+        {
+            vol.Required("action"): vol.In(list(action_options.keys())),
+            vol.Optional("template_name", default="any"): vol.In(list(template_options.keys())),
+            vol.Optional("within_seconds", default=300): cv.positive_int,
+        }
+    )
@@ -2,6 +2,14 @@
 
 Diese Datei ermöglicht die Auswahl von Notify Manager Events als Auslöser 
 in der Automations-UI unter "Gerät" -> Notify Manager.
+
+Für jeden Button der eigenen Templates gibt es einen eigenen Auslöser
+(`template_action` mit der Action-ID als `subtype`), die Liste folgt der
+Template-Registry. Button-Auslöser hängen am internen Action-Dispatcher
+(action_dispatch.py) statt je einen Listener auf dem Event-Bus anzumelden,
+ebenso „gelöscht“ und „abgelaufen“ (siehe lifecycle.py).
+Die früheren festen Typen (`action_confirm`, ...) werden nicht mehr
+angeboten, bestehende Automationen laufen aber weiter.
 """
 from __future__ import annotations
 
@@ -11,20 +19,26 @@ from typing import Any
 import voluptuous as vol
 
 from homeassistant.components.device_automation import DEVICE_TRIGGER_BASE_SCHEMA
+from homeassistant.components.device_automation.exceptions import (
+    InvalidDeviceAutomationConfig,
+)
 from homeassistant.components.homeassistant.triggers import event as event_trigger
 from homeassistant.const import (
     CONF_DEVICE_ID,
     CONF_DOMAIN,
-    CONF_ENTITY_ID,
     CONF_PLATFORM,
     CONF_TYPE,
 )
-from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, Event, HassJob, HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv, device_registry as dr
 from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
 from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN, ACTION_TEMPLATES, DEFAULT_CATEGORIES
+from .action_dispatch import KIND_ACTION, async_get_action_dispatcher
+from .const import DOMAIN, DEFAULT_CATEGORIES, EVENT_NOTIFICATION_ACTION
+from .data import async_get_device_entry_id, async_get_entry_data
+from .lifecycle import LIFECYCLE_CLEARED, LIFECYCLE_EXPIRED
+from .registry import template_action_ids
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -41,11 +55,29 @@ TRIGGER_TYPES = {
     "action_door_unlock": "Tür öffnen gedrückt",
     "action_door_ignore": "Tür ignorieren gedrückt",
     "action_reply": "Antwort gesendet",
+    "template_action": "Template-Button gedrückt",
     "notification_sent": "Benachrichtigung gesendet",
     "notification_cleared": "Benachrichtigung gelöscht",
+    "notification_expired": "Benachrichtigung abgelaufen",
+}
+
+# Offered in the automation editor, besides one template_action per button
+LISTED_TRIGGER_TYPES = (
+    "action_received",
+    "notification_sent",
+    "notification_cleared",
+    "notification_expired",
+)
+
+# Lifecycle trigger types and their dispatcher kind (see lifecycle.py)
+LIFECYCLE_TRIGGER_TYPES = {
+    "notification_cleared": LIFECYCLE_CLEARED,
+    "notification_expired": LIFECYCLE_EXPIRED,
 }
 
-# Map trigger types to action values
+CONF_SUBTYPE = "subtype"
+
+# Legacy trigger types and their action values
 TRIGGER_ACTION_MAP = {
     "action_confirm": "CONFIRM",
     "action_dismiss": "DISMISS",
@@ -59,9 +91,21 @@ TRIGGER_ACTION_MAP = {
     "action_reply": "REPLY",
 }
 
+# Extra fields per trigger type - static, built once instead of per editor request
+_CATEGORY_FIELD = {vol.Optional("category"): vol.In(list(DEFAULT_CATEGORIES.keys()))}
+TRIGGER_EXTRA_FIELDS = {
+    # For action_received, allow custom action input
+    "action_received": vol.Schema({vol.Optional("action"): cv.string, **_CATEGORY_FIELD}),
+    "template_action": vol.Schema(_CATEGORY_FIELD),
+    "notification_sent": vol.Schema(_CATEGORY_FIELD),
+    "notification_cleared": vol.Schema(_CATEGORY_FIELD),
+    "notification_expired": vol.Schema(_CATEGORY_FIELD),
+}
+
 TRIGGER_SCHEMA = DEVICE_TRIGGER_BASE_SCHEMA.extend(
     {
         vol.Required(CONF_TYPE): vol.In(TRIGGER_TYPES.keys()),
+        vol.Optional(CONF_SUBTYPE): cv.string,
         vol.Optional("action"): cv.string,
         vol.Optional("category"): vol.In(list(DEFAULT_CATEGORIES.keys())),
     }
@@ -82,26 +126,49 @@ async def async_get_triggers(
     if not any(identifier[0] == DOMAIN for identifier in device.identifiers):
         return []
     
-    triggers = []
-    
-    for trigger_type, trigger_name in TRIGGER_TYPES.items():
-        triggers.append(
-            {
-                CONF_PLATFORM: "device",
-                CONF_DEVICE_ID: device_id,
-                CONF_DOMAIN: DOMAIN,
-                CONF_TYPE: trigger_type,
-            }
-        )
-    
+    base = {
+        CONF_PLATFORM: "device",
+        CONF_DEVICE_ID: device_id,
+        CONF_DOMAIN: DOMAIN,
+    }
+    triggers = [{**base, CONF_TYPE: trigger_type} for trigger_type in LISTED_TRIGGER_TYPES]
+    triggers.extend(
+        {**base, CONF_TYPE: "template_action", CONF_SUBTYPE: action_id}
+        for action_id in _async_template_action_ids(hass, device_id)
+    )
     return triggers
 
 
+@callback
+def _async_template_action_ids(hass: HomeAssistant, device_id: str) -> list[str]:
+    """Return the button actions of the device's templates, cached per version."""
+    entry_data = async_get_entry_data(hass, async_get_device_entry_id(hass, device_id))
+    if entry_data is None:
+        return []
+
+    registry = entry_data.template_registry
+    cached = entry_data.capability_cache.get("trigger_actions")
+    if cached is not None and cached[0] == registry.version:
+        return cached[1]
+
+    # Templates may share buttons, keep the first occurrence
+    action_ids = list(dict.fromkeys(
+        action_id
+        for template in registry.templates
+        for action_id in template_action_ids(template)
+    ))
+    entry_data.capability_cache["trigger_actions"] = (registry.version, action_ids)
+    return action_ids
+
+
 async def async_validate_trigger_config(
     hass: HomeAssistant, config: ConfigType
 ) -> ConfigType:
     """Validate config."""
-    return TRIGGER_SCHEMA(config)
+    config = TRIGGER_SCHEMA(config)
+    if config[CONF_TYPE] == "template_action" and not config.get(CONF_SUBTYPE):
+        raise InvalidDeviceAutomationConfig("template_action needs the button action as subtype")
+    return config
 
 
 async def async_attach_trigger(
@@ -112,30 +179,73 @@ async def async_attach_trigger(
 ) -> CALLBACK_TYPE:
     """Attach a trigger."""
     trigger_type = config[CONF_TYPE]
+    category = config.get("category")
     
-    # Determine which events to listen to
     if trigger_type == "notification_sent":
-        event_type = f"{DOMAIN}_notification_sent"
-        event_data = {}
-    elif trigger_type == "notification_cleared":
-        event_type = f"{DOMAIN}_notification_cleared"
-        event_data = {}
-    elif trigger_type == "action_received":
-        # Listen to any action
-        event_type = "mobile_app_notification_action"
-        event_data = {}
-        if "action" in config:
-            event_data["action"] = config["action"]
+        return await _async_attach_event_trigger(
+            hass, f"{DOMAIN}_{trigger_type}", {}, config, action, trigger_info
+        )
+
+    if trigger_type in LIFECYCLE_TRIGGER_TYPES:
+        # Lifecycle events are indexed by category, None listens to all
+        kind = LIFECYCLE_TRIGGER_TYPES[trigger_type]
+        key = category
+        fallback_event = (f"{DOMAIN}_{trigger_type}", {})
     else:
-        # Specific action type
-        event_type = "mobile_app_notification_action"
-        event_data = {}
-        if trigger_type in TRIGGER_ACTION_MAP:
-            event_data["action"] = TRIGGER_ACTION_MAP[trigger_type]
-    
+        # Button triggers: None listens to any action
+        kind = KIND_ACTION
+        if trigger_type == "template_action":
+            key = config[CONF_SUBTYPE]
+        elif trigger_type == "action_received":
+            key = config.get("action")
+        else:
+            key = TRIGGER_ACTION_MAP.get(trigger_type)
+        fallback_event = (EVENT_NOTIFICATION_ACTION, {"action": key} if key else {})
+
+    entry_id = async_get_device_entry_id(hass, config[CONF_DEVICE_ID])
+    if entry_id is None:
+        # Device without entry (removed?), fall back to the bus
+        return await _async_attach_event_trigger(
+            hass, *fallback_event, config, action, trigger_info
+        )
+
+    job = HassJob(action, f"{DOMAIN} device trigger {trigger_info['name']}")
+    trigger_data = trigger_info["trigger_data"]
+
+    @callback
+    def handle_event(event: Event) -> None:
+        """Run the automation for a matching event."""
+        if category is not None and event.data.get("category") != category:
+            return
+        subject = event.data.get("action") if kind == KIND_ACTION else event.data.get("tag")
+        hass.async_run_hass_job(
+            job,
+            {
+                "trigger": {
+                    **trigger_data,
+                    "platform": "device",
+                    "event": event,
+                    "description": f"notification {kind} {subject}",
+                }
+            },
+            event.context,
+        )
+
+    return async_get_action_dispatcher(hass).async_listen(entry_id, kind, key, handle_event)
+
+
+async def _async_attach_event_trigger(
+    hass: HomeAssistant,
+    event_type: str,
+    event_data: dict[str, Any],
+    config: ConfigType,
+    action: TriggerActionType,
+    trigger_info: TriggerInfo,
+) -> CALLBACK_TYPE:
+    """Attach a plain event trigger on the bus."""
     # Add category filter if specified
     if "category" in config:
-        event_data["category"] = config["category"]
+        event_data = {**event_data, "category": config["category"]}
     
     event_config = {
         event_trigger.CONF_PLATFORM: "event",
@@ -156,24 +266,5 @@ async def async_get_trigger_capabilities(
     hass: HomeAssistant, config: ConfigType
 ) -> dict[str, vol.Schema]:
     """Return trigger capabilities."""
-    trigger_type = config.get(CONF_TYPE)
-    
-    # Base capabilities
-    capabilities = {}
-    
-    # For action_received, allow custom action input
-    if trigger_type == "action_received":
-        capabilities["extra_fields"] = vol.Schema(
-            {
-                vol.Optional("action"): cv.string,
-                vol.Optional("category"): vol.In(list(DEFAULT_CATEGORIES.keys())),
-            }
-        )
-    elif trigger_type in ["notification_sent", "notification_cleared"]:
-        capabilities["extra_fields"] = vol.Schema(
-            {
-                vol.Optional("category"): vol.In(list(DEFAULT_CATEGORIES.keys())),
-            }
-        )
-    
-    return capabilities
+    fields = TRIGGER_EXTRA_FIELDS.get(config.get(CONF_TYPE))
+    return {"extra_fields": fields} if fields is not None else {}
@@ -0,0 +1,47 @@
+"""Diagnostics support for Notify Manager."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_DEVICES
+from .data import NotifyManagerConfigEntry
+
+# Device names usually contain the owner's name
+TO_REDACT = {CONF_DEVICES}
+# Errors name the notify service (notify.mobile_app_<device>)
+TO_REDACT_HEALTH = {"last_error"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: NotifyManagerConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    entry_data = entry.runtime_data
+
+    return {
+        "entry": {
+            "title": entry.title,
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+        },
+        "state": {
+            "devices": len(entry_data.devices),
+            "templates": len(entry_data.user_templates),
+            "template_version": entry_data.template_registry.version,
+            "groups": len(entry_data.user_groups),
+            "history_entries": len(entry_data.notification_history),
+            "pending_actions": len(entry_data.pending_actions),
+            "active_notifications": len(entry_data.active_notifications or ()),
+        },
+        # Device names are redacted, only the circuit states are listed
+        "device_health": [
+            {
+                "device": f"device_{index}",
+                **async_redact_data(state.as_dict(), TO_REDACT_HEALTH),
+            }
+            for index, state in enumerate(entry_data.health.devices.values())
+        ],
+        "metrics": entry_data.metrics.as_dict(),
+    }
@@ -0,0 +1,229 @@
+"""Digest mode for Notify Manager.
+
+Sammelt Benachrichtigungen von Kategorien mit aktiviertem Digest (z.B. `system`,
+`info`) und sendet sie gebündelt als EINE Benachrichtigung pro Gerät:
+- Versand nach Ablauf des Intervalls oder bei Erreichen der Maximalanzahl
+- Nachricht listet alle gesammelten Einträge
+- Fester Tag pro Kategorie ersetzt den vorherigen Digest auf dem Gerät
+- Wird eine Benachrichtigung gelöscht oder läuft ab, werden gesammelte
+  Einträge mit ihrem `tag` verworfen
+"""
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+import logging
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import (
+    DOMAIN,
+    CONF_DIGEST,
+    CONF_DIGEST_INTERVAL,
+    CONF_DIGEST_MAX_ITEMS,
+    DEFAULT_DIGEST_INTERVAL,
+    DEFAULT_DIGEST_MAX_ITEMS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Maximum number of listed items in one digest message, the rest is summarised
+DIGEST_MAX_LISTED_ITEMS = 20
+
+# Keys that must not be copied from a single notification into the digest
+_DIGEST_DROPPED_KEYS = ("actions", "action_data", "image", "video", "audio", "entity_id")
+
+DeliverCallback = Callable[[str, str, list[str], dict], Awaitable[Any]]
+
+
+def digest_enabled(cat_config: dict[str, Any] | None) -> bool:
+    """Return True if digest mode is enabled for a category config."""
+    return bool(cat_config and cat_config.get(CONF_DIGEST, False))
+
+
+def digest_tag(category: str) -> str:
+    """Return the tag used for the digest of a category."""
+    return f"{DOMAIN}_digest_{category}"
+
+
+class NotificationDigest:
+    """Collect notifications per category and device and send them combined."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        deliver: DeliverCallback,
+        defaults: dict[str, Any] | None = None,
+    ) -> None:
+        """Initialize the digest.
+
+        `deliver` is called with (title, message, devices, data) and sends one
+        notification to the given devices.
+        """
+        self.hass = hass
+        self._deliver = deliver
+        self._defaults = defaults or {}
+        # category -> device -> list of (title, message, tag)
+        self._items: dict[str, dict[str, list[tuple[str, str, str | None]]]] = {}
+        # category -> number of collected notifications
+        self._counts: dict[str, int] = {}
+        # category -> tag -> number of collected notifications with the tag
+        self._tags: dict[str, dict[str, int]] = {}
+        # category -> data of the last collected notification
+        self._data: dict[str, dict] = {}
+        # category -> cancel callback of the flush timer
+        self._timers: dict[str, CALLBACK_TYPE] = {}
+
+    def _interval(self, cat_config: dict[str, Any]) -> int:
+        """Return the flush interval in seconds for a category."""
+        return int(
+            cat_config.get(CONF_DIGEST_INTERVAL)
+            or self._defaults.get(CONF_DIGEST_INTERVAL)
+            or DEFAULT_DIGEST_INTERVAL
+        )
+
+    def _max_items(self, cat_config: dict[str, Any]) -> int:
+        """Return the count threshold for a category."""
+        return int(
+            cat_config.get(CONF_DIGEST_MAX_ITEMS)
+            or self._defaults.get(CONF_DIGEST_MAX_ITEMS)
+            or DEFAULT_DIGEST_MAX_ITEMS
+        )
+
+    @callback
+    def async_set_defaults(self, defaults: dict[str, Any]) -> None:
+        """Replace the entry-wide defaults (used when options change)."""
+        self._defaults = defaults
+
+    @property
+    def pending(self) -> dict[str, int]:
+        """Return the number of collected notifications per category."""
+        return dict(self._counts)
+
+    async def async_add(
+        self,
+        category: str,
+        cat_config: dict[str, Any],
+        title: str,
+        message: str,
+        devices: list[str],
+        data: dict,
+    ) -> None:
+        """Collect a notification for the digest of a category."""
+        tag = data.get("tag")
+        per_device = self._items.setdefault(category, {})
+        for device in devices:
+            per_device.setdefault(device, []).append((title, message, tag))
+        self._counts[category] = self._counts.get(category, 0) + 1
+        if tag:
+            tags = self._tags.setdefault(category, {})
+            tags[tag] = tags.get(tag, 0) + 1
+        self._data[category] = data
+
+        _LOGGER.debug(
+            "Collected notification for digest '%s' (%d pending)",
+            category, self._counts[category],
+        )
+
+        if self._counts[category] >= self._max_items(cat_config):
+            await self.async_flush(category)
+            return
+
+        if category not in self._timers:
+            @callback
+            def _flush_later(_now: Any) -> None:
+                """Flush the digest when the interval has elapsed."""
+                self._timers.pop(category, None)
+                self.hass.async_create_task(self.async_flush(category))
+
+            self._timers[category] = async_call_later(
+                self.hass, self._interval(cat_config), _flush_later
+            )
+
+    async def async_flush(self, category: str) -> None:
+        """Send the collected notifications of a category, one per device."""
+        cancel = self._timers.pop(category, None)
+        if cancel:
+            cancel()
+
+        per_device = self._items.pop(category, {})
+        self._counts.pop(category, None)
+        self._tags.pop(category, None)
+        base_data = self._data.pop(category, {})
+        if not per_device:
+            return
+
+        data = {k: v for k, v in base_data.items() if k not in _DIGEST_DROPPED_KEYS}
+        data["tag"] = digest_tag(category)
+
+        # Devices with identical item lists get one combined call
+        by_items: dict[tuple[tuple[str, str, str | None], ...], list[str]] = {}
+        for device, items in per_device.items():
+            by_items.setdefault(tuple(items), []).append(device)
+
+        for items, devices in by_items.items():
+            title, message = self._format(category, list(items))
+            await self._deliver(title, message, devices, data)
+
+        _LOGGER.debug("Sent digest '%s' to %d devices", category, len(per_device))
+
+    async def async_flush_all(self) -> None:
+        """Send all pending digests (used on unload)."""
+        for category in list(self._items):
+            await self.async_flush(category)
+
+    @callback
+    def async_discard(self, tag: str) -> None:
+        """Drop collected notifications of a tag whose notification is gone."""
+        for category, tags in list(self._tags.items()):
+            removed = tags.pop(tag, 0)
+            if not removed:
+                continue
+            per_device = self._items[category]
+            for device, items in list(per_device.items()):
+                items[:] = [item for item in items if item[2] != tag]
+                if not items:
+                    del per_device[device]
+            self._counts[category] -= removed
+            if self._counts[category] <= 0:
+                self._drop(category)
+            _LOGGER.debug("Dropped %d digest items of '%s'", removed, tag)
+
+    def _drop(self, category: str) -> None:
+        """Forget a category and cancel its timer."""
+        cancel = self._timers.pop(category, None)
+        if cancel:
+            cancel()
+        self._items.pop(category, None)
+        self._counts.pop(category, None)
+        self._tags.pop(category, None)
+        self._data.pop(category, None)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel all timers and drop pending items."""
+        for cancel in self._timers.values():
+            cancel()
+        self._timers.clear()
+        self._items.clear()
+        self._counts.clear()
+        self._tags.clear()
+        self._data.clear()
+
+    @staticmethod
+    def _format(
+        category: str, items: list[tuple[str, str, str | None]]
+    ) -> tuple[str, str]:
+        """Build title and message of a digest notification."""
+        title = f"{category.title()}: {len(items)} Meldungen"
+        lines = []
+        for item_title, item_message, _tag in items[-DIGEST_MAX_LISTED_ITEMS:]:
+            if item_title and item_message:
+                lines.append(f"• {item_title}: {item_message}")
+            else:
+                lines.append(f"• {item_title or item_message}")
+        hidden = len(items) - DIGEST_MAX_LISTED_ITEMS
+        if hidden > 0:
+            lines.insert(0, f"… und {hidden} weitere")
+        return title, "\n".join(lines)
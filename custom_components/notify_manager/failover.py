@@ -0,0 +1,205 @@
+"""Failover routing for critical notifications.
+
+Schlägt der Push an ein Gerät fehl (oder ist sein Circuit offen, siehe
+health.py), werden kritische Benachrichtigungen über Ersatzwege zugestellt
+(Option `failover_routes`):
+- `notify`: anderer Notify-Dienst, z.B. `notify.telegram`
+- `persistent_notification`: Meldung in der HA-Oberfläche
+- `tts`: Ansage auf einem `media_player` über eine TTS-Entity (`engine`)
+- `light`: Licht blinken lassen
+Die Routen werden der Reihe nach mit kurzem Timeout probiert, bis eine
+klappt. Optional gelten sie nur für bestimmte Geräte (`devices`) oder
+Kategorien (`categories`). Die Routing-Tabelle wird pro Gerät und Kategorie
+vorab aufgebaut; der normale Versand ohne Fehler prüft nur die Priorität.
+
+Beispiel:
+    - type: notify
+      service: notify.telegram
+    - type: tts
+      entity_id: media_player.kueche
+      engine: tts.google_translate_de_de
+      categories: [security]
+    - type: light
+      entity_id: light.flur
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+ROUTE_NOTIFY = "notify"
+ROUTE_PERSISTENT = "persistent_notification"
+ROUTE_TTS = "tts"
+ROUTE_LIGHT = "light"
+
+DEFAULT_ROUTE_TIMEOUT = 5.0
+PERSISTENT_NOTIFICATION_ID = "notify_manager_failover"
+
+
+def is_critical(data: dict[str, Any]) -> bool:
+    """Return True if the notification data has critical priority."""
+    if data.get("critical") or data.get("interruption_level") == "critical":
+        return True
+    push = data.get("push")
+    return isinstance(push, dict) and push.get("interruption-level") == "critical"
+
+
+class FailoverRoute:
+    """One compiled fallback route."""
+
+    __slots__ = ("name", "kind", "domain", "service", "data", "timeout", "devices", "categories")
+
+    def __init__(self, config: dict[str, Any]) -> None:
+        """Compile a route config. Raises ValueError if it is incomplete."""
+        self.kind = config.get("type", "")
+        self.timeout = float(config.get("timeout", DEFAULT_ROUTE_TIMEOUT))
+        self.devices = frozenset(config.get("devices") or ())
+        self.categories = frozenset(config.get("categories") or ())
+        entity_id = config.get("entity_id")
+
+        if self.kind == ROUTE_NOTIFY:
+            service = config.get("service", "")
+            domain, _, name = service.partition(".")
+            if domain != "notify" or not name:
+                raise ValueError(f"invalid notify service: {service!r}")
+            self.domain, self.service, self.data = domain, name, {}
+            self.name = service
+        elif self.kind == ROUTE_PERSISTENT:
+            self.domain, self.service, self.data = "persistent_notification", "create", {}
+            self.name = ROUTE_PERSISTENT
+        elif self.kind == ROUTE_TTS:
+            if not entity_id or not config.get("engine"):
+                raise ValueError("tts needs entity_id and engine")
+            self.domain, self.service = "tts", "speak"
+            self.data = {"entity_id": config["engine"], "media_player_entity_id": entity_id}
+            self.name = f"tts:{entity_id}"
+        elif self.kind == ROUTE_LIGHT:
+            if not entity_id:
+                raise ValueError("light needs entity_id")
+            self.domain, self.service = "light", "turn_on"
+            self.data = {"entity_id": entity_id, "flash": config.get("flash", "long")}
+            self.name = f"light:{entity_id}"
+        else:
+            raise ValueError(f"unknown route type: {self.kind!r}")
+
+    def matches(self, device: str, category: str | None) -> bool:
+        """Return True if the route applies to a device and category."""
+        if self.devices and device not in self.devices:
+            return False
+        return not self.categories or category in self.categories
+
+    def service_data(self, title: str, message: str, tag: str | None) -> dict[str, Any]:
+        """Return the service data for a notification."""
+        if self.kind in (ROUTE_NOTIFY, ROUTE_PERSISTENT):
+            data = {"title": title, "message": message}
+            if self.kind == ROUTE_PERSISTENT:
+                data["notification_id"] = tag or PERSISTENT_NOTIFICATION_ID
+            return data
+        if self.kind == ROUTE_TTS:
+            return {**self.data, "message": f"{title}. {message}" if title else message}
+        return self.data
+
+
+class FailoverRouter:
+    """Routing table of fallback routes per device and category."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        routes: list[dict[str, Any]] | None = None,
+        devices: Iterable[str] = (),
+        categories: Iterable[str] = (),
+    ) -> None:
+        """Initialize the router."""
+        self.hass = hass
+        self._routes: list[FailoverRoute] = []
+        self._table: dict[tuple[str, str | None], tuple[FailoverRoute, ...]] = {}
+        self.async_compile(routes, devices, categories)
+
+    def __bool__(self) -> bool:
+        """Return True if any route is configured."""
+        return bool(self._routes)
+
+    def async_compile(
+        self,
+        routes: list[dict[str, Any]] | None,
+        devices: Iterable[str],
+        categories: Iterable[str],
+    ) -> None:
+        """Compile the routes and build the table for the known devices."""
+        self._routes = []
+        for index, config in enumerate(routes or []):
+            try:
+                self._routes.append(FailoverRoute(config))
+            except (AttributeError, TypeError, ValueError) as err:
+                _LOGGER.warning("Ignoring failover route %d: %s", index + 1, err)
+
+        self._table = {}
+        if self._routes:
+            for device in devices:
+                for category in (None, *categories):
+                    self.routes_for(device, category)
+
+    def routes_for(self, device: str, category: str | None) -> tuple[FailoverRoute, ...]:
+        """Return the routes of a device and category in order."""
+        key = (device, category)
+        routes = self._table.get(key)
+        if routes is None:
+            routes = self._table[key] = tuple(
+                route for route in self._routes if route.matches(device, category)
+            )
+        return routes
+
+    async def async_route(
+        self,
+        outcomes: list[dict[str, Any]],
+        category: str | None,
+        title: str,
+        message: str,
+        tag: str | None,
+    ) -> None:
+        """Deliver failed device outcomes over their fallback routes.
+
+        Adds `failover` (route used or None, attempted routes) to each outcome.
+        A route is called at most once per notification, even if it serves
+        several failed devices.
+        """
+        called: dict[str, bool] = {}
+        for outcome in outcomes:
+            attempts = []
+            used = None
+            for route in self.routes_for(outcome["device"], category):
+                attempts.append(route.name)
+                if route.name not in called:
+                    called[route.name] = await self._async_call(route, title, message, tag)
+                if called[route.name]:
+                    used = route.name
+                    break
+            outcome["failover"] = {"route": used, "attempts": attempts}
+
+    async def _async_call(
+        self, route: FailoverRoute, title: str, message: str, tag: str | None
+    ) -> bool:
+        """Call one route and return True on success."""
+        try:
+            async with asyncio.timeout(route.timeout):
+                await self.hass.services.async_call(
+                    route.domain,
+                    route.service,
+                    route.service_data(title, message, tag),
+                    blocking=True,
+                )
+        except TimeoutError:
+            _LOGGER.warning("Failover route %s timed out", route.name)
+            return False
+        except Exception as err:
+            _LOGGER.warning("Failover route %s failed: %s", route.name, err)
+            return False
+        _LOGGER.info("Delivered critical notification via %s", route.name)
+        return True
@@ -0,0 +1,188 @@
+/**
+ * Notify Manager Panel - Devices & Groups tab
+ *
+ * Lazy loaded chunk: the methods are mixed into NotifyManagerPanel when the
+ * tab is opened for the first time.
+ */
+
+import { html } from "https://unpkg.com/lit-element@2.5.1/lit-element.js?module";
+
+export default {
+  _renderDevicesTab() {
+    const devices = this._getDevices();
+    const activeGroup = this._activeGroupId ? this._groups.find(g => g.id === this._activeGroupId) : null;
+
+    return html`
+      <div class="stats-grid">
+        <div class="stat-card">
+          <div class="stat-value">${devices.length}</div>
+          <div class="stat-label">${this.t('devices')}</div>
+        </div>
+        <div class="stat-card">
+          <div class="stat-value">${this._groups.length}</div>
+          <div class="stat-label">${this.t('groups')}</div>
+        </div>
+        <div class="stat-card">
+          <div class="stat-value">${this._getServiceCount()}</div>
+          <div class="stat-label">${this.t('services')}</div>
+        </div>
+        <div class="stat-card">
+          <div class="stat-value">${devices.filter(d => this._getDeviceType(d) === 'ios').length}</div>
+          <div class="stat-label">iOS</div>
+        </div>
+        <div class="stat-card">
+          <div class="stat-value">${devices.filter(d => this._getDeviceType(d) === 'android').length}</div>
+          <div class="stat-label">Android</div>
+        </div>
+      </div>
+
+      <!-- Device Types -->
+      <div class="card">
+        <div class="card-title">📱 ${this.t('connectedDevices')} - ${this.t('deviceType')}</div>
+        <p style="color: var(--text2); font-size: 12px; margin-bottom: 12px;">${this.t('setDeviceType')}</p>
+        <div style="display: flex; flex-direction: column; gap: 8px;">
+          ${devices.map(d => html`
+            <div class="device-card">
+              <div class="name">
+                ${this._getDeviceType(d) === 'ios' ? '📱' : this._getDeviceType(d) === 'android' ? '🤖' : '❓'}
+                ${d}
+              </div>
+              <div class="type-btns">
+                <button class="type-btn ${this._getDeviceType(d) === 'ios' ? 'active ios' : ''}" @click=${() => this._setDeviceType(d, 'ios')}>iOS</button>
+                <button class="type-btn ${this._getDeviceType(d) === 'android' ? 'active android' : ''}" @click=${() => this._setDeviceType(d, 'android')}>Android</button>
+              </div>
+            </div>
+          `)}
+          ${!devices.length ? html`<p style="color: var(--text2);">${this.t('noDevices')}</p>` : ''}
+        </div>
+      </div>
+
+      <!-- Groups -->
+      <div class="card">
+        <div class="card-title">
+          <span>👥 ${this.t('deviceGroups')}</span>
+          <button class="btn btn-primary btn-small" @click=${() => this._editingGroup = { id: '', name: '', devices: [] }}>${this.t('newGroup')}</button>
+        </div>
+        <p style="color: var(--text2); font-size: 12px; margin-bottom: 12px;">${this.t('clickToAddRemove')}</p>
+
+        ${this._groups.length ? html`
+          <div class="group-grid" style="margin-bottom: 16px;">
+            ${this._groups.map(g => html`
+              <div class="group-card ${this._activeGroupId === g.id ? 'active-group' : ''}"
+                   @click=${() => this._activeGroupId = this._activeGroupId === g.id ? null : g.id}>
+                <div class="group-name">👥 ${g.name}</div>
+                <div class="group-info">${g.devices?.length || 0} ${this.t('devices')}</div>
+                <div class="group-actions" @click=${(e) => e.stopPropagation()}>
+                  <button class="btn btn-outline btn-small" @click=${() => this._editingGroup = {...g, devices: [...(g.devices || [])]}}}>✏️</button>
+                  <button class="btn btn-danger btn-small" @click=${() => this._deleteGroup(g.id)}>🗑️</button>
+                </div>
+              </div>
+            `)}
+          </div>
+
+          ${activeGroup ? html`
+            <div style="background: rgba(3,169,244,0.1); padding: 12px; border-radius: 8px;">
+              <p style="color: var(--accent); font-size: 13px; margin: 0 0 10px 0;">
+                <strong>${this.t('clickDevicesFor')} "${activeGroup.name}":</strong>
+              </p>
+              <div class="device-selector">
+                ${devices.map(d => {
+                  const isInGroup = (activeGroup.devices || []).includes(d);
+                  return html`
+                    <div class="device-chip ${isInGroup ? 'selected' : ''}"
+                         @click=${() => this._toggleDeviceInGroup(d, activeGroup.id)}>
+                      ${this._getDeviceType(d) === 'ios' ? '📱' : '🤖'} ${d} ${isInGroup ? '✓' : ''}
+                    </div>
+                  `;
+                })}
+              </div>
+            </div>
+          ` : ''}
+        ` : html`
+          <div class="empty-state">
+            <div class="empty-state-icon">👥</div>
+            <p>${this.t('noGroups')}</p>
+          </div>
+        `}
+      </div>
+    `;
+  },
+
+  _renderGroupModal() {
+    const g = this._editingGroup;
+    const devices = this._getDevices();
+
+    return html`
+      <div class="modal-overlay" @click=${(e) => { if(e.target === e.currentTarget) this._editingGroup = null; }}>
+        <div class="modal">
+          <div class="modal-title">${g.id ? `✏️ ${this.t('editGroup')}` : `👥 ${this.t('newGroupTitle')}`}</div>
+
+          <div class="form-group">
+            <label>${this.t('groupName')}</label>
+            <input type="text" .value=${g.name} @input=${(e) => g.name = e.target.value} placeholder="Family">
+          </div>
+
+          <div class="form-group">
+            <label>${this.t('selectDevices')}</label>
+            <div class="device-selector">
+              ${devices.map(d => html`
+                <div class="device-chip ${(g.devices || []).includes(d) ? 'selected' : ''}"
+                     @click=${() => {
+                       g.devices = g.devices || [];
+                       if(g.devices.includes(d)) g.devices = g.devices.filter(x => x !== d);
+                       else g.devices = [...g.devices, d];
+                       this.requestUpdate();
+                     }}>
+                  ${this._getDeviceType(d) === 'ios' ? '📱' : '🤖'} ${d}
+                </div>
+              `)}
+            </div>
+          </div>
+
+          <div class="modal-actions">
+            <button class="btn btn-outline" @click=${() => this._editingGroup = null}>${this.t('cancel')}</button>
+            <button class="btn btn-primary" @click=${() => this._saveGroup(g)}>💾 ${this.t('save')}</button>
+          </div>
+        </div>
+      </div>
+    `;
+  },
+
+  _setDeviceType(device, type) {
+    this._deviceTypes = { ...this._deviceTypes, [device]: type };
+    this._saveToStorage("notify_manager_device_types", this._deviceTypes);
+  },
+
+  _toggleDeviceInGroup(device, groupId) {
+    const group = this._groups.find(g => g.id === groupId);
+    if (!group) return;
+    group.devices = group.devices || [];
+    if (group.devices.includes(device)) {
+      group.devices = group.devices.filter(d => d !== device);
+    } else {
+      group.devices = [...group.devices, device];
+    }
+    this._groups = [...this._groups];
+    this._saveToStorage("notify_manager_groups", this._groups);
+    this.requestUpdate();
+  },
+
+  _saveGroup(g) {
+    if (!g.name) { alert(this.t('enterName')); return; }
+    if (!g.devices?.length) { alert(this.t('selectAtLeastOne')); return; }
+    if (g.id) {
+      this._groups = this._groups.map(x => x.id === g.id ? {...g} : x);
+    } else {
+      g.id = 'grp_' + Date.now();
+      this._groups = [...this._groups, {...g}];
+    }
+    this._saveToStorage("notify_manager_groups", this._groups);
+    this._editingGroup = null;
+  },
+
+  _deleteGroup(id) {
+    if (!confirm(this.t('deleteConfirm'))) return;
+    this._groups = this._groups.filter(g => g.id !== id);
+    this._saveToStorage("notify_manager_groups", this._groups);
+  },
+};
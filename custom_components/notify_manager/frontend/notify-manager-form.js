@@ -0,0 +1,508 @@
+/**
+ * Notify Manager Panel - Notification form (shared by Send and Templates tab)
+ *
+ * Lazy loaded chunk: the methods are mixed into NotifyManagerPanel when the
+ * tab is opened for the first time.
+ */
+
+import { html } from "https://unpkg.com/lit-element@2.5.1/lit-element.js?module";
+
+export default {
+  _getTargetPlatforms() {
+    // Determine which platforms are targeted
+    let targets = [];
+    if (this._selectedGroup) {
+      const group = this._groups.find(g => g.id === this._selectedGroup);
+      if (group) targets = group.devices || [];
+    } else if (this._selectedDevices.length) {
+      targets = this._selectedDevices;
+    } else {
+      targets = this._getDevices();
+    }
+
+    const platforms = new Set();
+    for (const device of targets) {
+      const type = this._getDeviceType(device);
+      if (type) platforms.add(type);
+      else { platforms.add('ios'); platforms.add('android'); } // Unknown = show both
+    }
+    return platforms;
+  },
+
+  _renderNotificationForm(cameras, showIos, showAndroid, isTemplateMode) {
+    return html`
+      <!-- Type -->
+      <div class="form-group">
+        <label>${this.t('notificationType')}</label>
+        <div class="type-selector">
+          <button class="type-btn ${this._type === 'simple' ? 'active' : ''}" @click=${() => this._type = 'simple'}>📱 ${this.t('simple')}</button>
+          <button class="type-btn ${this._type === 'buttons' ? 'active' : ''}" @click=${() => this._type = 'buttons'}>🔘 ${this.t('withButtons')}</button>
+          <button class="type-btn ${this._type === 'image' ? 'active' : ''}" @click=${() => this._type = 'image'}>📷 ${this.t('withCamera')}</button>
+          <button class="type-btn ${this._type === 'media' ? 'active' : ''}" @click=${() => this._type = 'media'}>🎬 ${this.t('withMedia')}</button>
+          ${showAndroid ? html`<button class="type-btn ${this._type === 'tts' ? 'active' : ''}" @click=${() => this._type = 'tts'}>🔊 ${this.t('tts')}</button>` : ''}
+          ${showIos ? html`<button class="type-btn ${this._type === 'map' ? 'active' : ''}" @click=${() => this._type = 'map'}>🗺️ ${this.t('map')}</button>` : ''}
+          ${showAndroid ? html`<button class="type-btn ${this._type === 'progress' ? 'active' : ''}" @click=${() => this._type = 'progress'}>📊 ${this.t('progress')}</button>` : ''}
+        </div>
+      </div>
+
+      <!-- Basic Fields -->
+      <div class="form-row">
+        <div class="form-group">
+          <label>${this.t('title_field')}</label>
+          <input type="text" .value=${this._title} @input=${(e) => this._title = e.target.value} placeholder="Home Assistant">
+        </div>
+        <div class="form-group">
+          <label>${this.t('subtitle')}</label>
+          <input type="text" .value=${this._subtitle} @input=${(e) => this._subtitle = e.target.value} placeholder="${this.t('subtitle')}">
+        </div>
+      </div>
+
+      <div class="form-group">
+        <label>${this._type === 'tts' ? this.t('textToRead') : this.t('message')}</label>
+        <textarea .value=${this._message} @input=${(e) => this._message = e.target.value}
+                  placeholder="${this._type === 'tts' ? this.t('textToRead') : this.t('message')}..."></textarea>
+      </div>
+
+      <!-- Type-specific fields -->
+      ${this._type === 'image' ? html`
+        <div class="form-row">
+          <div class="form-group">
+            <label>${this.t('camera')}</label>
+            <select .value=${this._camera} @change=${(e) => this._camera = e.target.value}>
+              <option value="">${this.t('selectCamera')}</option>
+              ${cameras.map(c => html`<option value="${c}">${this.hass.states[c]?.attributes?.friendly_name || c}</option>`)}
+            </select>
+          </div>
+          <div class="form-group">
+            <label>${this.t('imageUrl')}</label>
+            <input type="text" .value=${this._imageUrl} @input=${(e) => this._imageUrl = e.target.value} placeholder="/local/image.jpg">
+          </div>
+        </div>
+      ` : ''}
+
+      ${this._type === 'media' ? html`
+        <div class="form-row">
+          <div class="form-group">
+            <label>${this.t('imageUrl')}</label>
+            <input type="text" .value=${this._imageUrl} @input=${(e) => this._imageUrl = e.target.value} placeholder="/local/image.jpg">
+          </div>
+          <div class="form-group">
+            <label>${this.t('videoUrl')}</label>
+            <input type="text" .value=${this._videoUrl} @input=${(e) => this._videoUrl = e.target.value} placeholder="/media/local/video.mp4">
+          </div>
+          ${showIos ? html`
+            <div class="form-group">
+              <label>${this.t('audioUrl')}</label>
+              <input type="text" .value=${this._audioUrl} @input=${(e) => this._audioUrl = e.target.value} placeholder="/media/local/audio.mp3">
+            </div>
+          ` : ''}
+        </div>
+      ` : ''}
+
+      ${this._type === 'buttons' ? this._renderButtonsSection() : ''}
+
+      ${this._type === 'tts' && showAndroid ? html`
+        <div class="form-row">
+          <div class="form-group">
+            <label>Media Stream</label>
+            <select .value=${this._mediaStream} @change=${(e) => this._mediaStream = e.target.value}>
+              <option value="music_stream">Music</option>
+              <option value="alarm_stream">Alarm</option>
+              <option value="alarm_stream_max">Alarm Max Volume</option>
+            </select>
+          </div>
+        </div>
+      ` : ''}
+
+      ${this._type === 'map' && showIos ? html`
+        <div class="form-row">
+          <div class="form-group">
+            <label>${this.t('latitude')}</label>
+            <input type="text" .value=${this._latitude} @input=${(e) => this._latitude = e.target.value} placeholder="52.5200">
+          </div>
+          <div class="form-group">
+            <label>${this.t('longitude')}</label>
+            <input type="text" .value=${this._longitude} @input=${(e) => this._longitude = e.target.value} placeholder="13.4050">
+          </div>
+        </div>
+        <div class="form-row">
+          <div class="form-group">
+            <label>${this.t('secondPinLat')}</label>
+            <input type="text" .value=${this._secondPinLat} @input=${(e) => this._secondPinLat = e.target.value}>
+          </div>
+          <div class="form-group">
+            <label>${this.t('secondPinLng')}</label>
+            <input type="text" .value=${this._secondPinLng} @input=${(e) => this._secondPinLng = e.target.value}>
+          </div>
+        </div>
+      ` : ''}
+
+      ${this._type === 'progress' && showAndroid ? html`
+        <div class="form-row">
+          <div class="form-group">
+            <label>${this.t('progressValue')}</label>
+            <input type="number" min="0" max="100" .value=${this._progress} @input=${(e) => this._progress = parseInt(e.target.value) || 0}>
+          </div>
+          <div class="form-group">
+            <label>${this.t('progressMax')}</label>
+            <input type="number" min="1" .value=${this._progressMax} @input=${(e) => this._progressMax = parseInt(e.target.value) || 100}>
+          </div>
+        </div>
+        <div class="checkbox-row">
+          <label class="checkbox-item"><input type="checkbox" .checked=${this._progressIndeterminate} @change=${(e) => this._progressIndeterminate = e.target.checked}> ${this.t('indeterminate')}</label>
+        </div>
+      ` : ''}
+
+      <!-- Click Action -->
+      <div class="form-group">
+        <label>${this.t('clickAction')}</label>
+        <select .value=${this._clickAction}
+                @focus=${() => this._ensureData("dashboards")}
+                @pointerdown=${() => this._ensureData("dashboards")}
+                @change=${(e) => this._clickAction = e.target.value}>
+          <option value="">${this.t('selectDashboard')}</option>
+          ${this._dashboards.map(d => html`
+            <optgroup label="${d.title || d.url_path || 'Default'}">
+              ${d.url_path ? html`<option value="/lovelace-${d.url_path}" ?selected=${this._clickAction === `/lovelace-${d.url_path}`}>${d.title || d.url_path}</option>` : html`<option value="/lovelace" ?selected=${this._clickAction === '/lovelace'}>Default</option>`}
+              ${(d.views || []).map(v => {
+                const url = d.url_path ? `/lovelace-${d.url_path}/${v.path || v.title}` : `/lovelace/${v.path || v.title}`;
+                return html`<option value="${url}" ?selected=${this._clickAction === url}>└ ${v.title || v.path}</option>`;
+              })}
+            </optgroup>
+          `)}
+        </select>
+        <input type="text" style="margin-top: 6px;" placeholder="${this.t('customUrl')}"
+               .value=${this._clickAction.startsWith('/lovelace') ? '' : this._clickAction}
+               @input=${(e) => this._clickAction = e.target.value}>
+      </div>
+
+      <!-- Advanced Options Toggle -->
+      <button class="section-toggle" @click=${() => this._showAdvanced = !this._showAdvanced}>
+        ${this._showAdvanced ? '▼ ' + this.t('hideAdvanced') : '▶ ' + this.t('showAdvanced')}
+      </button>
+
+      ${this._showAdvanced ? this._renderAdvancedOptions(showIos, showAndroid) : ''}
+
+      <!-- Preview -->
+      <div class="preview">
+        <div class="preview-title">📱 ${this.t('preview')}</div>
+        <div class="preview-notification">
+          <div class="preview-header">
+            <div class="preview-icon"></div>
+            <span class="preview-app">HOME ASSISTANT</span>
+          </div>
+          <div class="preview-t">${this._title || this.t('title_field')}</div>
+          ${this._subtitle ? html`<div style="font-size: 12px; color: #aaa;">${this._subtitle}</div>` : ''}
+          <div class="preview-m">${this._message || this.t('message') + '...'}</div>
+          ${this._type === 'buttons' && this._buttons.length ? html`
+            <div class="preview-buttons">
+              ${this._buttons.slice(0, 3).map(b => html`<div class="preview-btn">${b.title || 'Button'}</div>`)}
+            </div>
+          ` : ''}
+          ${this._type === 'progress' ? html`
+            <div style="background: #444; height: 4px; border-radius: 2px; margin-top: 10px;">
+              <div style="background: var(--accent); height: 100%; width: ${this._progressIndeterminate ? '50%' : (this._progress / this._progressMax * 100) + '%'}; border-radius: 2px;"></div>
+            </div>
+          ` : ''}
+        </div>
+      </div>
+
+      <!-- Reset Button -->
+      <div style="margin-top: 10px;">
+        <button class="btn btn-outline" @click=${() => this._resetForm()}>🔄 ${this.t('reset')}</button>
+      </div>
+    `;
+  },
+
+  _renderButtonsSection() {
+    return html`
+      <div class="form-group">
+        <label>${this.t('buttonTemplate')}</label>
+        <div class="type-selector" style="margin-bottom: 10px;">
+          <div class="type-btn ${this._buttons.length === 0 ? 'active' : ''}" @click=${() => this._buttons = []}>${this.t('none')}</div>
+          <div class="type-btn" @click=${() => this._applyButtonTemplate('confirm_dismiss')}>✅ ${this.t('confirmReject')}</div>
+          <div class="type-btn" @click=${() => this._applyButtonTemplate('yes_no')}>👍 ${this.t('yesNo')}</div>
+          <div class="type-btn" @click=${() => this._applyButtonTemplate('alarm_response')}>🚨 ${this.t('alarm')}</div>
+          <div class="type-btn" @click=${() => this._applyButtonTemplate('door_response')}>🚪 ${this.t('door')}</div>
+          <div class="type-btn" @click=${() => this._applyButtonTemplate('reply')}>💬 ${this.t('reply')}</div>
+        </div>
+        <label>${this.t('buttons')} <span style="font-weight: normal; color: var(--text2);">(${this.t('maxButtons')})</span></label>
+        <div class="button-list">
+          ${this._buttons.map((btn, i) => html`
+            <div class="button-item">
+              <input type="text" placeholder="${this.t('actionId')}" .value=${btn.action} @input=${(e) => this._updateButton(i, 'action', e.target.value)}>
+              <input type="text" placeholder="${this.t('buttonText')}" .value=${btn.title} @input=${(e) => this._updateButton(i, 'title', e.target.value)}>
+              <input type="text" placeholder="${this.t('uri')}" .value=${btn.uri || ''} @input=${(e) => this._updateButton(i, 'uri', e.target.value)}>
+              <button class="btn btn-danger btn-icon" @click=${() => this._removeButton(i)}>✕</button>
+            </div>
+            <div class="button-options">
+              <label class="checkbox-item"><input type="checkbox" .checked=${btn.destructive || false} @change=${(e) => this._updateButton(i, 'destructive', e.target.checked)}> ${this.t('destructive')}</label>
+              <label class="checkbox-item"><input type="checkbox" .checked=${btn.authenticationRequired || false} @change=${(e) => this._updateButton(i, 'authenticationRequired', e.target.checked)}> ${this.t('authRequired')}</label>
+            </div>
+          `)}
+          <button class="btn btn-success btn-small" @click=${this._addButton} ?disabled=${this._buttons.length >= 3}>${this.t('addButton')}</button>
+        </div>
+      </div>
+    `;
+  },
+
+  _renderAdvancedOptions(showIos, showAndroid) {
+    return html`
+      <!-- Grouping -->
+      <div class="form-row">
+        <div class="form-group">
+          <label>${this.t('group')}</label>
+          <input type="text" .value=${this._group} @input=${(e) => this._group = e.target.value} placeholder="my_group">
+        </div>
+        <div class="form-group">
+          <label>${this.t('tag')}</label>
+          <input type="text" .value=${this._tag} @input=${(e) => this._tag = e.target.value} placeholder="notification_tag">
+        </div>
+      </div>
+
+      ${showAndroid ? html`
+        <div class="platform-section android">
+          <h4><span class="badge android">ANDROID</span> ${this.t('androidOptions')}</h4>
+          <div class="form-row">
+            <div class="form-group">
+              <label>${this.t('channel')}</label>
+              <input type="text" .value=${this._channel} @input=${(e) => this._channel = e.target.value} placeholder="alerts">
+            </div>
+            <div class="form-group">
+              <label>${this.t('importance')}</label>
+              <select .value=${this._importance} @change=${(e) => this._importance = e.target.value}>
+                <option value="default">${this.t('default')}</option>
+                <option value="low">${this.t('low')}</option>
+                <option value="high">${this.t('high')}</option>
+                <option value="max">${this.t('max')}</option>
+                <option value="min">${this.t('min')}</option>
+              </select>
+            </div>
+            <div class="form-group">
+              <label>${this.t('color')}</label>
+              <input type="color" .value=${this._color || '#03a9f4'} @input=${(e) => this._color = e.target.value}>
+            </div>
+          </div>
+          <div class="form-row">
+            <div class="form-group">
+              <label>${this.t('notificationIcon')}</label>
+              <input type="text" .value=${this._notificationIcon} @input=${(e) => this._notificationIcon = e.target.value} placeholder="mdi:bell">
+            </div>
+            <div class="form-group">
+              <label>${this.t('iconUrl')}</label>
+              <input type="text" .value=${this._iconUrl} @input=${(e) => this._iconUrl = e.target.value} placeholder="https://...">
+            </div>
+          </div>
+          <div class="form-row">
+            <div class="form-group">
+              <label>${this.t('ledColor')}</label>
+              <input type="text" .value=${this._ledColor} @input=${(e) => this._ledColor = e.target.value} placeholder="red">
+            </div>
+            <div class="form-group">
+              <label>${this.t('vibrationPattern')}</label>
+              <input type="text" .value=${this._vibrationPattern} @input=${(e) => this._vibrationPattern = e.target.value} placeholder="100, 1000, 100">
+            </div>
+            <div class="form-group">
+              <label>${this.t('timeout')}</label>
+              <input type="number" min="0" .value=${this._timeout} @input=${(e) => this._timeout = parseInt(e.target.value) || 0}>
+            </div>
+          </div>
+          <div class="form-group">
+            <label>${this.t('visibility')}</label>
+            <select .value=${this._visibility} @change=${(e) => this._visibility = e.target.value}>
+              <option value="public">${this.t('public')}</option>
+              <option value="private">${this.t('private')}</option>
+              <option value="secret">${this.t('secret')}</option>
+            </select>
+          </div>
+          <div class="checkbox-row">
+            <label class="checkbox-item"><input type="checkbox" .checked=${this._sticky} @change=${(e) => this._sticky = e.target.checked}> ${this.t('sticky')}</label>
+            <label class="checkbox-item"><input type="checkbox" .checked=${this._persistent} @change=${(e) => this._persistent = e.target.checked}> ${this.t('persistent')}</label>
+            <label class="checkbox-item"><input type="checkbox" .checked=${this._alertOnce} @change=${(e) => this._alertOnce = e.target.checked}> ${this.t('alertOnce')}</label>
+            <label class="checkbox-item"><input type="checkbox" .checked=${this._carUi} @change=${(e) => this._carUi = e.target.checked}> ${this.t('carUi')}</label>
+            <label class="checkbox-item"><input type="checkbox" .checked=${this._chronometer} @change=${(e) => this._chronometer = e.target.checked}> ${this.t('chronometerValue')}</label>
+          </div>
+        </div>
+      ` : ''}
+
+      ${showIos ? html`
+        <div class="platform-section ios">
+          <h4><span class="badge ios">iOS</span> ${this.t('iosOptions')}</h4>
+          <div class="form-row">
+            <div class="form-group">
+              <label>${this.t('sound')}</label>
+              <input type="text" .value=${this._sound} @input=${(e) => this._sound = e.target.value} placeholder="default">
+            </div>
+            <div class="form-group">
+              <label>${this.t('badge')}</label>
+              <input type="number" min="0" .value=${this._badge} @input=${(e) => this._badge = parseInt(e.target.value) || 0}>
+            </div>
+            <div class="form-group">
+              <label>${this.t('interruptionLevel')}</label>
+              <select .value=${this._interruptionLevel} @change=${(e) => this._interruptionLevel = e.target.value}>
+                <option value="passive">${this.t('passive')}</option>
+                <option value="active">${this.t('active')}</option>
+                <option value="time-sensitive">${this.t('timeSensitive')}</option>
+                <option value="critical">${this.t('criticalLevel')}</option>
+              </select>
+            </div>
+          </div>
+          <div class="checkbox-row">
+            <label class="checkbox-item"><input type="checkbox" .checked=${this._critical} @change=${(e) => this._critical = e.target.checked}> ${this.t('criticalAlert')}</label>
+          </div>
+          ${this._critical ? html`
+            <div class="form-group">
+              <label>${this.t('criticalVolume')} (0.0 - 1.0)</label>
+              <input type="number" min="0" max="1" step="0.1" .value=${this._criticalVolume} @input=${(e) => this._criticalVolume = parseFloat(e.target.value) || 1.0}>
+            </div>
+          ` : ''}
+        </div>
+      ` : ''}
+
+      <!-- Attachment Options -->
+      ${(this._type === 'image' || this._type === 'media') ? html`
+        <div class="platform-section">
+          <h4>📎 ${this.t('attachmentOptions')}</h4>
+          <div class="checkbox-row">
+            <label class="checkbox-item"><input type="checkbox" .checked=${this._hideThumbnail} @change=${(e) => this._hideThumbnail = e.target.checked}> ${this.t('hideThumbnail')}</label>
+            ${showIos ? html`<label class="checkbox-item"><input type="checkbox" .checked=${this._lazyLoad} @change=${(e) => this._lazyLoad = e.target.checked}> ${this.t('lazyLoad')}</label>` : ''}
+          </div>
+          <div class="form-group">
+            <label>${this.t('contentType')}</label>
+            <input type="text" .value=${this._contentType} @input=${(e) => this._contentType = e.target.value} placeholder="image/jpeg">
+          </div>
+        </div>
+      ` : ''}
+    `;
+  },
+
+  _applyTemplate(t) {
+    // Basic fields
+    this._title = t.title || '';
+    this._subtitle = t.subtitle || '';
+    this._message = t.message || '';
+    this._type = t.type || 'simple';
+    this._priority = t.priority || 'normal';
+    this._buttons = [...(t.buttons || [])];
+
+    // Recipients
+    this._selectedDevices = [...(t.devices || [])];
+    this._selectedGroup = t.group || '';
+
+    // Image/Camera
+    this._camera = t.camera || '';
+    this._imageUrl = t.image || '';
+
+    // Android options
+    this._channel = t.channel || '';
+    this._color = t.color || '';
+    this._ledColor = t.ledColor || '';
+    this._vibrationPattern = t.vibrationPattern || '';
+    this._notificationIcon = t.notificationIcon || '';
+    this._iconUrl = t.iconUrl || '';
+    this._sticky = t.sticky || false;
+    this._persistent = t.persistent || false;
+    this._alertOnce = t.alertOnce || false;
+    this._timeout = t.timeout || 0;
+    this._visibility = t.visibility || 'public';
+    this._carUi = t.carUi || false;
+    this._importance = t.importance || 'default';
+
+    // iOS options
+    this._sound = t.sound || '';
+    this._badge = t.badge || 0;
+    this._interruptionLevel = t.interruptionLevel || 'active';
+    this._critical = t.critical || false;
+    this._criticalVolume = t.criticalVolume || 1.0;
+
+    // Common
+    this._clickAction = t.clickAction || '';
+    // Dashboard views are only fetched for the click action picker
+    if (this._clickAction.startsWith('/lovelace')) this._ensureData("dashboards");
+    this._tag = t.tag || '';
+    this._group = t.notificationGroup || '';
+
+    // TTS
+    this._ttsText = t.ttsText || '';
+    this._mediaStream = t.mediaStream || 'music_stream';
+
+    // Map
+    this._latitude = t.latitude || '';
+    this._longitude = t.longitude || '';
+
+    // Progress
+    this._progress = t.progress || 0;
+    this._progressMax = t.progressMax || 100;
+    this._progressIndeterminate = t.progressIndeterminate || false;
+  },
+
+  _applyButtonTemplate(templateName) {
+    const templates = {
+      confirm_dismiss: [{ action: 'CONFIRM', title: '✅ Confirm' }, { action: 'DISMISS', title: '❌ Dismiss' }],
+      yes_no: [{ action: 'YES', title: '👍 Yes' }, { action: 'NO', title: '👎 No' }],
+      alarm_response: [{ action: 'ALARM_OK', title: '✅ OK' }, { action: 'ALARM_SNOOZE', title: '⏰ Later' }, { action: 'ALARM_EMERGENCY', title: '🆘 Emergency' }],
+      door_response: [{ action: 'DOOR_OPEN', title: '🔓 Open' }, { action: 'DOOR_IGNORE', title: '🚪 Ignore' }],
+      reply: [{ action: 'REPLY', title: '💬 Reply' }]
+    };
+    this._buttons = [...(templates[templateName] || [])];
+  },
+
+  _addButton() { if (this._buttons.length < 3) this._buttons = [...this._buttons, { action: '', title: '' }]; },
+
+  _removeButton(i) { this._buttons = this._buttons.filter((_, idx) => idx !== i); },
+
+  _updateButton(i, field, value) { this._buttons = this._buttons.map((btn, idx) => idx === i ? { ...btn, [field]: value } : btn); },
+
+  _buildTemplateFromForm(name, existingId) {
+    return {
+      id: existingId || 'tpl_' + Date.now(),
+      name,
+      title: this._title,
+      subtitle: this._subtitle,
+      message: this._message,
+      type: this._type,
+      priority: this._priority,
+      buttons: [...this._buttons],
+      // Recipients - IMPORTANT for send_from_template
+      devices: [...this._selectedDevices],  // Selected devices
+      group: this._selectedGroup,            // Selected group (name/id)
+      // Image/Camera
+      camera: this._camera,
+      image: this._imageUrl,
+      // Android options
+      channel: this._channel,
+      color: this._color,
+      ledColor: this._ledColor,
+      vibrationPattern: this._vibrationPattern,
+      notificationIcon: this._notificationIcon,
+      iconUrl: this._iconUrl,
+      sticky: this._sticky,
+      persistent: this._persistent,
+      alertOnce: this._alertOnce,
+      timeout: this._timeout,
+      visibility: this._visibility,
+      carUi: this._carUi,
+      importance: this._importance,
+      // iOS options
+      sound: this._sound,
+      badge: this._badge,
+      interruptionLevel: this._interruptionLevel,
+      critical: this._critical,
+      criticalVolume: this._criticalVolume,
+      // Common
+      clickAction: this._clickAction,
+      tag: this._tag,
+      notificationGroup: this._group,
+      // TTS (Android)
+      ttsText: this._ttsText,
+      mediaStream: this._mediaStream,
+      // Map (iOS)
+      latitude: this._latitude,
+      longitude: this._longitude,
+      // Progress (Android)
+      progress: this._progress,
+      progressMax: this._progressMax,
+      progressIndeterminate: this._progressIndeterminate,
+    };
+  },
+};
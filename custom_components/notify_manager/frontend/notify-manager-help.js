@@ -0,0 +1,78 @@
+/**
+ * Notify Manager Panel - Help tab
+ *
+ * Lazy loaded chunk: the methods are mixed into NotifyManagerPanel when the
+ * tab is opened for the first time.
+ */
+
+import { html } from "https://unpkg.com/lit-element@2.5.1/lit-element.js?module";
+
+export default {
+  _renderHelpTab() {
+    return html`
+      <div class="card">
+        <div class="card-title">❓ ${this.t('helpTitle')}</div>
+
+        <div class="help-section">
+          <h3>🚀 ${this.t('quickStart')}</h3>
+          <p>${this.t('quickStartText').split('\n').map(line => html`${line}<br>`)}</p>
+        </div>
+
+        <div class="help-section">
+          <h3>📱 ${this.t('iosFeatures')}</h3>
+          <p>${this.t('iosFeaturesText')}</p>
+          <ul>
+            <li><code>critical: true</code> - Override DND</li>
+            <li><code>badge: 5</code> - App icon badge</li>
+            <li><code>sound: "default"</code> - Custom sounds</li>
+            <li><code>interruption-level</code> - passive, active, time-sensitive, critical</li>
+          </ul>
+        </div>
+
+        <div class="help-section">
+          <h3>🤖 ${this.t('androidFeatures')}</h3>
+          <p>${this.t('androidFeaturesText')}</p>
+          <ul>
+            <li><code>channel: "alerts"</code> - Notification channels</li>
+            <li><code>color: "#FF0000"</code> - Notification color</li>
+            <li><code>ledColor: "red"</code> - LED color</li>
+            <li><code>vibrationPattern: "100, 1000, 100"</code></li>
+            <li><code>sticky: true</code> - Cannot dismiss</li>
+            <li><code>persistent: true</code> - Stays until cleared</li>
+            <li><code>chronometer: true</code> - Timer display</li>
+            <li><code>message: TTS</code> with <code>tts_text</code> - Text-to-speech</li>
+          </ul>
+        </div>
+
+        <div class="help-section">
+          <h3>🔄 ${this.t('buttonReaction')}</h3>
+          <pre>trigger:
+  - platform: event
+    event_type: mobile_app_notification_action
+    event_data:
+      action: "YOUR_ACTION_ID"
+action:
+  - service: notify.notify
+    data:
+      message: "Button pressed!"</pre>
+        </div>
+
+        <div class="help-section">
+          <h3>📲 ${this.t('availableServices')}</h3>
+          <ul>
+            <li><code>send_notification</code> - Simple notification</li>
+            <li><code>send_actionable</code> - With buttons</li>
+            <li><code>send_with_image</code> - With camera/image</li>
+            <li><code>send_tts</code> - Text-to-speech (Android)</li>
+            <li><code>send_map</code> - Map with pin (iOS)</li>
+            <li><code>send_progress</code> - Progress bar (Android)</li>
+            <li><code>send_chronometer</code> - Timer (Android)</li>
+            <li><code>send_from_template</code> - From template</li>
+            <li><code>send_to_group</code> - Send to device group</li>
+            <li><code>device_command</code> - Device commands (Android)</li>
+          </ul>
+        </div>
+      </div>
+    `;
+  },
+};
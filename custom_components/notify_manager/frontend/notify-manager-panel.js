@@ -8,6 +8,10 @@
  * - Automatic language detection (DE/EN)
  * - Template and group management
  * - Dashboard/page selection for click actions
+ *
+ * Dieses Modul ist nur die Hülle (Header, Tabs, Styles, Übersetzungen).
+ * Die Tabs werden beim ersten Öffnen als eigene Module nachgeladen und
+ * laden nur die Daten, die sie brauchen.
  */
 
 import {
@@ -195,6 +199,7 @@ const TRANSLATIONS = {
     showAdvanced: "Show Advanced Options",
     hideAdvanced: "Hide Advanced Options",
     reset: "Reset",
+    loading: "Loading...",
   },
   de: {
     title: "Notify Manager",
@@ -354,9 +359,26 @@ const TRANSLATIONS = {
     showAdvanced: "Erweiterte Optionen zeigen",
     hideAdvanced: "Erweiterte Optionen ausblenden",
     reset: "Zurücksetzen",
+    loading: "Lade...",
   }
 };
 
+// Lazy loaded tab modules (relative to this module's versioned URL)
+const TAB_CHUNKS = {
+  send: () => import("./notify-manager-send.js"),
+  devices: () => import("./notify-manager-devices.js"),
+  templates: () => import("./notify-manager-templates.js"),
+  help: () => import("./notify-manager-help.js"),
+};
+
+// Data each tab needs before it can render
+const TAB_DATA = {
+  send: ["templates", "groups"],
+  devices: ["groups"],
+  templates: ["templates", "groups"],
+  help: [],
+};
+
 class NotifyManagerPanel extends LitElement {
   static get properties() {
     return {
@@ -438,6 +460,8 @@ class NotifyManagerPanel extends LitElement {
       _templateEditMode: { type: Boolean },
       _templateFormId: { type: String },
       _templateFormName: { type: String },
+      // Lazy loading
+      _loadedTabs: { type: Object },
     };
   }
 
@@ -455,10 +479,14 @@ class NotifyManagerPanel extends LitElement {
     this._groups = [];
     this._deviceTypes = {}; // { device_name: 'ios' | 'android' }
     this._dashboards = [];
+    this._entryId = null;
     this._editingTemplate = null;
     this._editingGroup = null;
     this._activeGroupId = null;
-    this._templatesLoaded = false;
+    // Lazy loading: loaded tab modules and running data requests
+    this._loadedTabs = {};
+    this._tabPromises = {};
+    this._dataPromises = {};
     // Template editor
     this._templateEditMode = false;
     this._templateFormId = '';
@@ -522,11 +550,63 @@ class NotifyManagerPanel extends LitElement {
     return TRANSLATIONS[this._lang]?.[key] || TRANSLATIONS.en[key] || key;
   }
 
-  async connectedCallback() {
+  connectedCallback() {
     super.connectedCallback();
     this._detectLanguage();
-    await this._loadData();
-    await this._loadDashboards();
+    // Device types are local only and cheap to read
+    try {
+      const storedTypes = localStorage.getItem("notify_manager_device_types");
+      if (storedTypes) {
+        this._deviceTypes = JSON.parse(storedTypes);
+      }
+    } catch {}
+    this._activateTab(this._tab);
+  }
+
+  updated(changedProps) {
+    super.updated(changedProps);
+    // hass is usually set after connect, retry loading the data of the open tab
+    if (changedProps.has("_tab") || (changedProps.has("hass") && !changedProps.get("hass"))) {
+      this._activateTab(this._tab);
+    }
+  }
+
+  _activateTab(tab) {
+    this._loadTab(tab);
+    if (!this.hass) return;
+    for (const key of TAB_DATA[tab] || []) this._ensureData(key);
+  }
+
+  _loadTab(tab) {
+    if (!this._tabPromises[tab]) {
+      this._tabPromises[tab] = TAB_CHUNKS[tab]()
+        .then((mod) => {
+          Object.assign(NotifyManagerPanel.prototype, mod.default);
+          this._loadedTabs = { ...this._loadedTabs, [tab]: true };
+        })
+        .catch((e) => {
+          console.error(`Notify Manager: failed to load tab "${tab}"`, e);
+          delete this._tabPromises[tab];
+        });
+    }
+    return this._tabPromises[tab];
+  }
+
+  _ensureData(key) {
+    if (!this._dataPromises[key]) {
+      const loaders = {
+        templates: () => this._loadTemplates(),
+        groups: () => this._loadGroups(),
+        dashboards: () => this._loadDashboards(),
+      };
+      this._dataPromises[key] = loaders[key]();
+    }
+    return this._dataPromises[key];
+  }
+
+  _withEntry(data) {
+    // Stick to the entry the server picked; needed once several are set up
+    return this._entryId ? { ...data, config_entry_id: this._entryId } : data;
   }
 
   _detectLanguage() {
@@ -534,15 +614,13 @@ class NotifyManagerPanel extends LitElement {
     this._lang = haLang.startsWith("de") ? "de" : "en";
   }
 
-  async _loadData() {
-    if (!this.hass || this._templatesLoaded) return;
-
+  async _loadTemplates() {
     try {
       // Load templates from HA
-      const response = await this.hass.callWS({ type: "notify_manager/get_templates" });
+      const response = await this.hass.callWS(this._withEntry({ type: "notify_manager/get_templates" }));
+      this._entryId = response?.config_entry_id || this._entryId;
       if (response?.templates?.length) {
         this._templates = response.templates;
-        this._templatesLoaded = true;
       }
     } catch (e) {
       // Fallback to localStorage
@@ -551,10 +629,13 @@ class NotifyManagerPanel extends LitElement {
         try { this._templates = JSON.parse(stored); } catch {}
       }
     }
+  }
 
-    // Load groups from HA
+  async _loadGroups() {
     try {
-      const groupsResponse = await this.hass.callWS({ type: "notify_manager/get_groups" });
+      // Load groups from HA
+      const groupsResponse = await this.hass.callWS(this._withEntry({ type: "notify_manager/get_groups" }));
+      this._entryId = groupsResponse?.config_entry_id || this._entryId;
       if (groupsResponse?.groups?.length) {
         this._groups = groupsResponse.groups;
       }
@@ -565,22 +646,13 @@ class NotifyManagerPanel extends LitElement {
         try { this._groups = JSON.parse(storedGroups); } catch {}
       }
     }
-
-    // Load device types from localStorage
-    try {
-      const storedTypes = localStorage.getItem("notify_manager_device_types");
-      if (storedTypes) {
-        this._deviceTypes = JSON.parse(storedTypes);
-      }
-    } catch {}
   }
 
   async _loadDashboards() {
     if (!this.hass) return;
     try {
-      const dashboards = await this.hass.callWS({ type: "lovelace/dashboards" });
-      this._dashboards = dashboards || [];
-      for (const dashboard of this._dashboards) {
+      const dashboards = (await this.hass.callWS({ type: "lovelace/dashboards" })) || [];
+      for (const dashboard of dashboards) {
         try {
           const config = await this.hass.callWS({
             type: "lovelace/config",
@@ -589,6 +661,7 @@ class NotifyManagerPanel extends LitElement {
           dashboard.views = config?.views || [];
         } catch { dashboard.views = []; }
       }
+      this._dashboards = dashboards;
     } catch { this._dashboards = []; }
   }
 
@@ -603,7 +676,7 @@ class NotifyManagerPanel extends LitElement {
   async _syncTemplatesToHA() {
     if (this.hass && this._templates) {
       try {
-        await this.hass.callService("notify_manager", "save_templates", { templates: this._templates });
+        await this.hass.callService("notify_manager", "save_templates", this._withEntry({ templates: this._templates }));
       } catch {}
     }
   }
@@ -611,16 +684,11 @@ class NotifyManagerPanel extends LitElement {
   async _syncGroupsToHA() {
     if (this.hass && this._groups) {
       try {
-        await this.hass.callService("notify_manager", "save_groups", { groups: this._groups });
+        await this.hass.callService("notify_manager", "save_groups", this._withEntry({ groups: this._groups }));
       } catch {}
     }
   }
 
-  _setDeviceType(device, type) {
-    this._deviceTypes = { ...this._deviceTypes, [device]: type };
-    this._saveToStorage("notify_manager_device_types", this._deviceTypes);
-  }
-
   _getDeviceType(device) {
     // Check stored type first
     if (this._deviceTypes[device]) return this._deviceTypes[device];
@@ -631,27 +699,6 @@ class NotifyManagerPanel extends LitElement {
     return null;
   }
 
-  _getTargetPlatforms() {
-    // Determine which platforms are targeted
-    let targets = [];
-    if (this._selectedGroup) {
-      const group = this._groups.find(g => g.id === this._selectedGroup);
-      if (group) targets = group.devices || [];
-    } else if (this._selectedDevices.length) {
-      targets = this._selectedDevices;
-    } else {
-      targets = this._getDevices();
-    }
-
-    const platforms = new Set();
-    for (const device of targets) {
-      const type = this._getDeviceType(device);
-      if (type) platforms.add(type);
-      else { platforms.add('ios'); platforms.add('android'); } // Unknown = show both
-    }
-    return platforms;
-  }
-
   static get styles() {
     return css`
       :host {
@@ -829,688 +876,23 @@ class NotifyManagerPanel extends LitElement {
         <button class="tab ${this._tab === 'help' ? 'active' : ''}" @click=${() => this._tab = 'help'}>❓ ${this.t('help')}</button>
       </div>
 
-      ${this._tab === 'send' ? this._renderSendTab() : ''}
-      ${this._tab === 'devices' ? this._renderDevicesTab() : ''}
-      ${this._tab === 'templates' ? this._renderTemplatesTab() : ''}
-      ${this._tab === 'help' ? this._renderHelpTab() : ''}
-
-      ${this._editingGroup ? this._renderGroupModal() : ''}
-    `;
-  }
-
-  _renderSendTab() {
-    const devices = this._getDevices();
-    const cameras = Object.keys(this.hass?.states || {}).filter(e => e.startsWith('camera.'));
-    const platforms = this._getTargetPlatforms();
-    const showIos = platforms.has('ios');
-    const showAndroid = platforms.has('android');
-
-    return html`
-      <div class="card">
-        <div class="card-title">📨 ${this.t('quickNotification')}</div>
-
-        <!-- Templates -->
-        ${this._templates.length ? html`
-          <div class="form-group">
-            <label>${this.t('useTemplate')}</label>
-            <div class="type-selector">
-              ${this._templates.map(t => html`
-                <div class="type-btn" @click=${() => this._applyTemplate(t)}>${t.name}</div>
-              `)}
-            </div>
-          </div>
-        ` : ''}
-
-        <!-- Recipients -->
-        <div class="form-group">
-          <label>${this.t('recipients')}</label>
-          <div class="device-selector">
-            <div class="device-chip ${this._selectedDevices.length === 0 && !this._selectedGroup ? 'selected' : ''}"
-                 @click=${() => { this._selectedDevices = []; this._selectedGroup = ''; }}>
-              📱 ${this.t('allDevices')}
-            </div>
-            ${this._groups.map(g => html`
-              <div class="device-chip group ${this._selectedGroup === g.id ? 'selected' : ''}"
-                   @click=${() => { this._selectedGroup = g.id; this._selectedDevices = []; }}>
-                👥 ${g.name}
-              </div>
-            `)}
-            ${devices.map(d => html`
-              <div class="device-chip ${this._selectedDevices.includes(d) ? 'selected' : ''}"
-                   @click=${() => this._toggleDevice(d)}>
-                ${this._getDeviceType(d) === 'ios' ? '📱' : this._getDeviceType(d) === 'android' ? '🤖' : '📱'} ${d}
-                ${this._getDeviceType(d) ? html`<span class="type-badge ${this._getDeviceType(d)}">${this._getDeviceType(d).toUpperCase()}</span>` : ''}
-              </div>
-            `)}
-          </div>
-        </div>
-
-        ${this._renderNotificationForm(cameras, showIos, showAndroid, false)}
-
-        <!-- Action Buttons -->
-        <div class="action-buttons">
-          <button class="send-btn" @click=${this._send} ?disabled=${this._loading || !this._message}>
-            ${this._loading ? `⏳ ${this.t('sending')}` : `📤 ${this.t('sendNotification')}`}
-          </button>
-          <button class="save-template-btn" @click=${this._saveAsTemplate}>
-            💾 ${this.t('saveAsTemplate')}
-          </button>
-        </div>
-        ${this._success ? html`<div class="${this._success.startsWith('❌') ? 'error-msg' : 'success-msg'}">${this._success}</div>` : ''}
-      </div>
-    `;
-  }
-
-  _renderNotificationForm(cameras, showIos, showAndroid, isTemplateMode) {
-    return html`
-      <!-- Type -->
-      <div class="form-group">
-        <label>${this.t('notificationType')}</label>
-        <div class="type-selector">
-          <button class="type-btn ${this._type === 'simple' ? 'active' : ''}" @click=${() => this._type = 'simple'}>📱 ${this.t('simple')}</button>
-          <button class="type-btn ${this._type === 'buttons' ? 'active' : ''}" @click=${() => this._type = 'buttons'}>🔘 ${this.t('withButtons')}</button>
-          <button class="type-btn ${this._type === 'image' ? 'active' : ''}" @click=${() => this._type = 'image'}>📷 ${this.t('withCamera')}</button>
-          <button class="type-btn ${this._type === 'media' ? 'active' : ''}" @click=${() => this._type = 'media'}>🎬 ${this.t('withMedia')}</button>
-          ${showAndroid ? html`<button class="type-btn ${this._type === 'tts' ? 'active' : ''}" @click=${() => this._type = 'tts'}>🔊 ${this.t('tts')}</button>` : ''}
-          ${showIos ? html`<button class="type-btn ${this._type === 'map' ? 'active' : ''}" @click=${() => this._type = 'map'}>🗺️ ${this.t('map')}</button>` : ''}
-          ${showAndroid ? html`<button class="type-btn ${this._type === 'progress' ? 'active' : ''}" @click=${() => this._type = 'progress'}>📊 ${this.t('progress')}</button>` : ''}
-        </div>
-      </div>
-
-      <!-- Basic Fields -->
-      <div class="form-row">
-        <div class="form-group">
-          <label>${this.t('title_field')}</label>
-          <input type="text" .value=${this._title} @input=${(e) => this._title = e.target.value} placeholder="Home Assistant">
-        </div>
-        <div class="form-group">
-          <label>${this.t('subtitle')}</label>
-          <input type="text" .value=${this._subtitle} @input=${(e) => this._subtitle = e.target.value} placeholder="${this.t('subtitle')}">
-        </div>
-      </div>
-
-      <div class="form-group">
-        <label>${this._type === 'tts' ? this.t('textToRead') : this.t('message')}</label>
-        <textarea .value=${this._message} @input=${(e) => this._message = e.target.value}
-                  placeholder="${this._type === 'tts' ? this.t('textToRead') : this.t('message')}..."></textarea>
-      </div>
-
-      <!-- Type-specific fields -->
-      ${this._type === 'image' ? html`
-        <div class="form-row">
-          <div class="form-group">
-            <label>${this.t('camera')}</label>
-            <select .value=${this._camera} @change=${(e) => this._camera = e.target.value}>
-              <option value="">${this.t('selectCamera')}</option>
-              ${cameras.map(c => html`<option value="${c}">${this.hass.states[c]?.attributes?.friendly_name || c}</option>`)}
-            </select>
-          </div>
-          <div class="form-group">
-            <label>${this.t('imageUrl')}</label>
-            <input type="text" .value=${this._imageUrl} @input=${(e) => this._imageUrl = e.target.value} placeholder="/local/image.jpg">
-          </div>
-        </div>
-      ` : ''}
-
-      ${this._type === 'media' ? html`
-        <div class="form-row">
-          <div class="form-group">
-            <label>${this.t('imageUrl')}</label>
-            <input type="text" .value=${this._imageUrl} @input=${(e) => this._imageUrl = e.target.value} placeholder="/local/image.jpg">
-          </div>
-          <div class="form-group">
-            <label>${this.t('videoUrl')}</label>
-            <input type="text" .value=${this._videoUrl} @input=${(e) => this._videoUrl = e.target.value} placeholder="/media/local/video.mp4">
-          </div>
-          ${showIos ? html`
-            <div class="form-group">
-              <label>${this.t('audioUrl')}</label>
-              <input type="text" .value=${this._audioUrl} @input=${(e) => this._audioUrl = e.target.value} placeholder="/media/local/audio.mp3">
-            </div>
-          ` : ''}
-        </div>
-      ` : ''}
-
-      ${this._type === 'buttons' ? this._renderButtonsSection() : ''}
-
-      ${this._type === 'tts' && showAndroid ? html`
-        <div class="form-row">
-          <div class="form-group">
-            <label>Media Stream</label>
-            <select .value=${this._mediaStream} @change=${(e) => this._mediaStream = e.target.value}>
-              <option value="music_stream">Music</option>
-              <option value="alarm_stream">Alarm</option>
-              <option value="alarm_stream_max">Alarm Max Volume</option>
-            </select>
-          </div>
-        </div>
-      ` : ''}
-
-      ${this._type === 'map' && showIos ? html`
-        <div class="form-row">
-          <div class="form-group">
-            <label>${this.t('latitude')}</label>
-            <input type="text" .value=${this._latitude} @input=${(e) => this._latitude = e.target.value} placeholder="52.5200">
-          </div>
-          <div class="form-group">
-            <label>${this.t('longitude')}</label>
-            <input type="text" .value=${this._longitude} @input=${(e) => this._longitude = e.target.value} placeholder="13.4050">
-          </div>
-        </div>
-        <div class="form-row">
-          <div class="form-group">
-            <label>${this.t('secondPinLat')}</label>
-            <input type="text" .value=${this._secondPinLat} @input=${(e) => this._secondPinLat = e.target.value}>
-          </div>
-          <div class="form-group">
-            <label>${this.t('secondPinLng')}</label>
-            <input type="text" .value=${this._secondPinLng} @input=${(e) => this._secondPinLng = e.target.value}>
-          </div>
-        </div>
-      ` : ''}
-
-      ${this._type === 'progress' && showAndroid ? html`
-        <div class="form-row">
-          <div class="form-group">
-            <label>${this.t('progressValue')}</label>
-            <input type="number" min="0" max="100" .value=${this._progress} @input=${(e) => this._progress = parseInt(e.target.value) || 0}>
-          </div>
-          <div class="form-group">
-            <label>${this.t('progressMax')}</label>
-            <input type="number" min="1" .value=${this._progressMax} @input=${(e) => this._progressMax = parseInt(e.target.value) || 100}>
-          </div>
-        </div>
-        <div class="checkbox-row">
-          <label class="checkbox-item"><input type="checkbox" .checked=${this._progressIndeterminate} @change=${(e) => this._progressIndeterminate = e.target.checked}> ${this.t('indeterminate')}</label>
-        </div>
-      ` : ''}
-
-      <!-- Click Action -->
-      <div class="form-group">
-        <label>${this.t('clickAction')}</label>
-        <select .value=${this._clickAction} @change=${(e) => this._clickAction = e.target.value}>
-          <option value="">${this.t('selectDashboard')}</option>
-          ${this._dashboards.map(d => html`
-            <optgroup label="${d.title || d.url_path || 'Default'}">
-              ${d.url_path ? html`<option value="/lovelace-${d.url_path}">${d.title || d.url_path}</option>` : html`<option value="/lovelace">Default</option>`}
-              ${(d.views || []).map(v => html`
-                <option value="${d.url_path ? `/lovelace-${d.url_path}/${v.path || v.title}` : `/lovelace/${v.path || v.title}`}">└ ${v.title || v.path}</option>
-              `)}
-            </optgroup>
-          `)}
-        </select>
-        <input type="text" style="margin-top: 6px;" placeholder="${this.t('customUrl')}"
-               .value=${this._clickAction.startsWith('/lovelace') ? '' : this._clickAction}
-               @input=${(e) => this._clickAction = e.target.value}>
-      </div>
-
-      <!-- Advanced Options Toggle -->
-      <button class="section-toggle" @click=${() => this._showAdvanced = !this._showAdvanced}>
-        ${this._showAdvanced ? '▼ ' + this.t('hideAdvanced') : '▶ ' + this.t('showAdvanced')}
-      </button>
-
-      ${this._showAdvanced ? this._renderAdvancedOptions(showIos, showAndroid) : ''}
-
-      <!-- Preview -->
-      <div class="preview">
-        <div class="preview-title">📱 ${this.t('preview')}</div>
-        <div class="preview-notification">
-          <div class="preview-header">
-            <div class="preview-icon"></div>
-            <span class="preview-app">HOME ASSISTANT</span>
-          </div>
-          <div class="preview-t">${this._title || this.t('title_field')}</div>
-          ${this._subtitle ? html`<div style="font-size: 12px; color: #aaa;">${this._subtitle}</div>` : ''}
-          <div class="preview-m">${this._message || this.t('message') + '...'}</div>
-          ${this._type === 'buttons' && this._buttons.length ? html`
-            <div class="preview-buttons">
-              ${this._buttons.slice(0, 3).map(b => html`<div class="preview-btn">${b.title || 'Button'}</div>`)}
-            </div>
-          ` : ''}
-          ${this._type === 'progress' ? html`
-            <div style="background: #444; height: 4px; border-radius: 2px; margin-top: 10px;">
-              <div style="background: var(--accent); height: 100%; width: ${this._progressIndeterminate ? '50%' : (this._progress / this._progressMax * 100) + '%'}; border-radius: 2px;"></div>
-            </div>
-          ` : ''}
-        </div>
-      </div>
-
-      <!-- Reset Button -->
-      <div style="margin-top: 10px;">
-        <button class="btn btn-outline" @click=${() => this._resetForm()}>🔄 ${this.t('reset')}</button>
-      </div>
-    `;
-  }
-
-  _renderButtonsSection() {
-    return html`
-      <div class="form-group">
-        <label>${this.t('buttonTemplate')}</label>
-        <div class="type-selector" style="margin-bottom: 10px;">
-          <div class="type-btn ${this._buttons.length === 0 ? 'active' : ''}" @click=${() => this._buttons = []}>${this.t('none')}</div>
-          <div class="type-btn" @click=${() => this._applyButtonTemplate('confirm_dismiss')}>✅ ${this.t('confirmReject')}</div>
-          <div class="type-btn" @click=${() => this._applyButtonTemplate('yes_no')}>👍 ${this.t('yesNo')}</div>
-          <div class="type-btn" @click=${() => this._applyButtonTemplate('alarm_response')}>🚨 ${this.t('alarm')}</div>
-          <div class="type-btn" @click=${() => this._applyButtonTemplate('door_response')}>🚪 ${this.t('door')}</div>
-          <div class="type-btn" @click=${() => this._applyButtonTemplate('reply')}>💬 ${this.t('reply')}</div>
-        </div>
-        <label>${this.t('buttons')} <span style="font-weight: normal; color: var(--text2);">(${this.t('maxButtons')})</span></label>
-        <div class="button-list">
-          ${this._buttons.map((btn, i) => html`
-            <div class="button-item">
-              <input type="text" placeholder="${this.t('actionId')}" .value=${btn.action} @input=${(e) => this._updateButton(i, 'action', e.target.value)}>
-              <input type="text" placeholder="${this.t('buttonText')}" .value=${btn.title} @input=${(e) => this._updateButton(i, 'title', e.target.value)}>
-              <input type="text" placeholder="${this.t('uri')}" .value=${btn.uri || ''} @input=${(e) => this._updateButton(i, 'uri', e.target.value)}>
-              <button class="btn btn-danger btn-icon" @click=${() => this._removeButton(i)}>✕</button>
-            </div>
-            <div class="button-options">
-              <label class="checkbox-item"><input type="checkbox" .checked=${btn.destructive || false} @change=${(e) => this._updateButton(i, 'destructive', e.target.checked)}> ${this.t('destructive')}</label>
-              <label class="checkbox-item"><input type="checkbox" .checked=${btn.authenticationRequired || false} @change=${(e) => this._updateButton(i, 'authenticationRequired', e.target.checked)}> ${this.t('authRequired')}</label>
-            </div>
-          `)}
-          <button class="btn btn-success btn-small" @click=${this._addButton} ?disabled=${this._buttons.length >= 3}>${this.t('addButton')}</button>
-        </div>
-      </div>
-    `;
-  }
-
-  _renderAdvancedOptions(showIos, showAndroid) {
-    return html`
-      <!-- Grouping -->
-      <div class="form-row">
-        <div class="form-group">
-          <label>${this.t('group')}</label>
-          <input type="text" .value=${this._group} @input=${(e) => this._group = e.target.value} placeholder="my_group">
-        </div>
-        <div class="form-group">
-          <label>${this.t('tag')}</label>
-          <input type="text" .value=${this._tag} @input=${(e) => this._tag = e.target.value} placeholder="notification_tag">
-        </div>
-      </div>
-
-      ${showAndroid ? html`
-        <div class="platform-section android">
-          <h4><span class="badge android">ANDROID</span> ${this.t('androidOptions')}</h4>
-          <div class="form-row">
-            <div class="form-group">
-              <label>${this.t('channel')}</label>
-              <input type="text" .value=${this._channel} @input=${(e) => this._channel = e.target.value} placeholder="alerts">
-            </div>
-            <div class="form-group">
-              <label>${this.t('importance')}</label>
-              <select .value=${this._importance} @change=${(e) => this._importance = e.target.value}>
-                <option value="default">${this.t('default')}</option>
-                <option value="low">${this.t('low')}</option>
-                <option value="high">${this.t('high')}</option>
-                <option value="max">${this.t('max')}</option>
-                <option value="min">${this.t('min')}</option>
-              </select>
-            </div>
-            <div class="form-group">
-              <label>${this.t('color')}</label>
-              <input type="color" .value=${this._color || '#03a9f4'} @input=${(e) => this._color = e.target.value}>
-            </div>
-          </div>
-          <div class="form-row">
-            <div class="form-group">
-              <label>${this.t('notificationIcon')}</label>
-              <input type="text" .value=${this._notificationIcon} @input=${(e) => this._notificationIcon = e.target.value} placeholder="mdi:bell">
-            </div>
-            <div class="form-group">
-              <label>${this.t('iconUrl')}</label>
-              <input type="text" .value=${this._iconUrl} @input=${(e) => this._iconUrl = e.target.value} placeholder="https://...">
-            </div>
-          </div>
-          <div class="form-row">
-            <div class="form-group">
-              <label>${this.t('ledColor')}</label>
-              <input type="text" .value=${this._ledColor} @input=${(e) => this._ledColor = e.target.value} placeholder="red">
-            </div>
-            <div class="form-group">
-              <label>${this.t('vibrationPattern')}</label>
-              <input type="text" .value=${this._vibrationPattern} @input=${(e) => this._vibrationPattern = e.target.value} placeholder="100, 1000, 100">
-            </div>
-            <div class="form-group">
-              <label>${this.t('timeout')}</label>
-              <input type="number" min="0" .value=${this._timeout} @input=${(e) => this._timeout = parseInt(e.target.value) || 0}>
-            </div>
-          </div>
-          <div class="form-group">
-            <label>${this.t('visibility')}</label>
-            <select .value=${this._visibility} @change=${(e) => this._visibility = e.target.value}>
-              <option value="public">${this.t('public')}</option>
-              <option value="private">${this.t('private')}</option>
-              <option value="secret">${this.t('secret')}</option>
-            </select>
-          </div>
-          <div class="checkbox-row">
-            <label class="checkbox-item"><input type="checkbox" .checked=${this._sticky} @change=${(e) => this._sticky = e.target.checked}> ${this.t('sticky')}</label>
-            <label class="checkbox-item"><input type="checkbox" .checked=${this._persistent} @change=${(e) => this._persistent = e.target.checked}> ${this.t('persistent')}</label>
-            <label class="checkbox-item"><input type="checkbox" .checked=${this._alertOnce} @change=${(e) => this._alertOnce = e.target.checked}> ${this.t('alertOnce')}</label>
-            <label class="checkbox-item"><input type="checkbox" .checked=${this._carUi} @change=${(e) => this._carUi = e.target.checked}> ${this.t('carUi')}</label>
-            <label class="checkbox-item"><input type="checkbox" .checked=${this._chronometer} @change=${(e) => this._chronometer = e.target.checked}> ${this.t('chronometerValue')}</label>
-          </div>
-        </div>
-      ` : ''}
-
-      ${showIos ? html`
-        <div class="platform-section ios">
-          <h4><span class="badge ios">iOS</span> ${this.t('iosOptions')}</h4>
-          <div class="form-row">
-            <div class="form-group">
-              <label>${this.t('sound')}</label>
-              <input type="text" .value=${this._sound} @input=${(e) => this._sound = e.target.value} placeholder="default">
-            </div>
-            <div class="form-group">
-              <label>${this.t('badge')}</label>
-              <input type="number" min="0" .value=${this._badge} @input=${(e) => this._badge = parseInt(e.target.value) || 0}>
-            </div>
-            <div class="form-group">
-              <label>${this.t('interruptionLevel')}</label>
-              <select .value=${this._interruptionLevel} @change=${(e) => this._interruptionLevel = e.target.value}>
-                <option value="passive">${this.t('passive')}</option>
-                <option value="active">${this.t('active')}</option>
-                <option value="time-sensitive">${this.t('timeSensitive')}</option>
-                <option value="critical">${this.t('criticalLevel')}</option>
-              </select>
-            </div>
-          </div>
-          <div class="checkbox-row">
-            <label class="checkbox-item"><input type="checkbox" .checked=${this._critical} @change=${(e) => this._critical = e.target.checked}> ${this.t('criticalAlert')}</label>
-          </div>
-          ${this._critical ? html`
-            <div class="form-group">
-              <label>${this.t('criticalVolume')} (0.0 - 1.0)</label>
-              <input type="number" min="0" max="1" step="0.1" .value=${this._criticalVolume} @input=${(e) => this._criticalVolume = parseFloat(e.target.value) || 1.0}>
-            </div>
-          ` : ''}
-        </div>
-      ` : ''}
+      ${this._renderTab()}
 
-      <!-- Attachment Options -->
-      ${(this._type === 'image' || this._type === 'media') ? html`
-        <div class="platform-section">
-          <h4>📎 ${this.t('attachmentOptions')}</h4>
-          <div class="checkbox-row">
-            <label class="checkbox-item"><input type="checkbox" .checked=${this._hideThumbnail} @change=${(e) => this._hideThumbnail = e.target.checked}> ${this.t('hideThumbnail')}</label>
-            ${showIos ? html`<label class="checkbox-item"><input type="checkbox" .checked=${this._lazyLoad} @change=${(e) => this._lazyLoad = e.target.checked}> ${this.t('lazyLoad')}</label>` : ''}
-          </div>
-          <div class="form-group">
-            <label>${this.t('contentType')}</label>
-            <input type="text" .value=${this._contentType} @input=${(e) => this._contentType = e.target.value} placeholder="image/jpeg">
-          </div>
-        </div>
-      ` : ''}
+      ${this._editingGroup && this._loadedTabs.devices ? this._renderGroupModal() : ''}
     `;
   }
 
-  _renderDevicesTab() {
-    const devices = this._getDevices();
-    const activeGroup = this._activeGroupId ? this._groups.find(g => g.id === this._activeGroupId) : null;
-
-    return html`
-      <div class="stats-grid">
-        <div class="stat-card">
-          <div class="stat-value">${devices.length}</div>
-          <div class="stat-label">${this.t('devices')}</div>
-        </div>
-        <div class="stat-card">
-          <div class="stat-value">${this._groups.length}</div>
-          <div class="stat-label">${this.t('groups')}</div>
-        </div>
-        <div class="stat-card">
-          <div class="stat-value">${this._getServiceCount()}</div>
-          <div class="stat-label">${this.t('services')}</div>
-        </div>
-        <div class="stat-card">
-          <div class="stat-value">${devices.filter(d => this._getDeviceType(d) === 'ios').length}</div>
-          <div class="stat-label">iOS</div>
-        </div>
-        <div class="stat-card">
-          <div class="stat-value">${devices.filter(d => this._getDeviceType(d) === 'android').length}</div>
-          <div class="stat-label">Android</div>
-        </div>
-      </div>
-
-      <!-- Device Types -->
-      <div class="card">
-        <div class="card-title">📱 ${this.t('connectedDevices')} - ${this.t('deviceType')}</div>
-        <p style="color: var(--text2); font-size: 12px; margin-bottom: 12px;">${this.t('setDeviceType')}</p>
-        <div style="display: flex; flex-direction: column; gap: 8px;">
-          ${devices.map(d => html`
-            <div class="device-card">
-              <div class="name">
-                ${this._getDeviceType(d) === 'ios' ? '📱' : this._getDeviceType(d) === 'android' ? '🤖' : '❓'}
-                ${d}
-              </div>
-              <div class="type-btns">
-                <button class="type-btn ${this._getDeviceType(d) === 'ios' ? 'active ios' : ''}" @click=${() => this._setDeviceType(d, 'ios')}>iOS</button>
-                <button class="type-btn ${this._getDeviceType(d) === 'android' ? 'active android' : ''}" @click=${() => this._setDeviceType(d, 'android')}>Android</button>
-              </div>
-            </div>
-          `)}
-          ${!devices.length ? html`<p style="color: var(--text2);">${this.t('noDevices')}</p>` : ''}
-        </div>
-      </div>
-
-      <!-- Groups -->
-      <div class="card">
-        <div class="card-title">
-          <span>👥 ${this.t('deviceGroups')}</span>
-          <button class="btn btn-primary btn-small" @click=${() => this._editingGroup = { id: '', name: '', devices: [] }}>${this.t('newGroup')}</button>
-        </div>
-        <p style="color: var(--text2); font-size: 12px; margin-bottom: 12px;">${this.t('clickToAddRemove')}</p>
-
-        ${this._groups.length ? html`
-          <div class="group-grid" style="margin-bottom: 16px;">
-            ${this._groups.map(g => html`
-              <div class="group-card ${this._activeGroupId === g.id ? 'active-group' : ''}"
-                   @click=${() => this._activeGroupId = this._activeGroupId === g.id ? null : g.id}>
-                <div class="group-name">👥 ${g.name}</div>
-                <div class="group-info">${g.devices?.length || 0} ${this.t('devices')}</div>
-                <div class="group-actions" @click=${(e) => e.stopPropagation()}>
-                  <button class="btn btn-outline btn-small" @click=${() => this._editingGroup = {...g, devices: [...(g.devices || [])]}}}>✏️</button>
-                  <button class="btn btn-danger btn-small" @click=${() => this._deleteGroup(g.id)}>🗑️</button>
-                </div>
-              </div>
-            `)}
-          </div>
-
-          ${activeGroup ? html`
-            <div style="background: rgba(3,169,244,0.1); padding: 12px; border-radius: 8px;">
-              <p style="color: var(--accent); font-size: 13px; margin: 0 0 10px 0;">
-                <strong>${this.t('clickDevicesFor')} "${activeGroup.name}":</strong>
-              </p>
-              <div class="device-selector">
-                ${devices.map(d => {
-                  const isInGroup = (activeGroup.devices || []).includes(d);
-                  return html`
-                    <div class="device-chip ${isInGroup ? 'selected' : ''}"
-                         @click=${() => this._toggleDeviceInGroup(d, activeGroup.id)}>
-                      ${this._getDeviceType(d) === 'ios' ? '📱' : '🤖'} ${d} ${isInGroup ? '✓' : ''}
-                    </div>
-                  `;
-                })}
-              </div>
-            </div>
-          ` : ''}
-        ` : html`
-          <div class="empty-state">
-            <div class="empty-state-icon">👥</div>
-            <p>${this.t('noGroups')}</p>
-          </div>
-        `}
-      </div>
-    `;
-  }
-
-  _renderTemplatesTab() {
-    const devices = this._getDevices();
-    const cameras = Object.keys(this.hass?.states || {}).filter(e => e.startsWith('camera.'));
-    const platforms = this._getTargetPlatforms();
-    const showIos = platforms.has('ios');
-    const showAndroid = platforms.has('android');
-
-    return html`
-      <!-- Saved Templates -->
-      ${this._templates.length ? html`
-        <div class="card">
-          <div class="card-title">📋 ${this.t('savedTemplates')}</div>
-          <div class="template-grid">
-            ${this._templates.map(t => html`
-              <div class="template-card">
-                <div class="template-name">${t.name}</div>
-                <div class="template-preview">${t.title}: ${t.message?.substring(0, 30)}${t.message?.length > 30 ? '...' : ''}</div>
-                <div class="template-preview">${this.t('type')}: ${t.type} | ${t.buttons?.length || 0} buttons</div>
-                <div class="template-actions">
-                  <button class="btn btn-primary btn-small" @click=${() => { this._loadTemplateForEdit(t); }}>${this.t('editTemplate')}</button>
-                  <button class="btn btn-outline btn-small" @click=${() => { this._applyTemplate(t); this._tab = 'send'; }}>${this.t('use')}</button>
-                  <button class="btn btn-danger btn-small" @click=${() => this._deleteTemplate(t.id)}>🗑️</button>
-                </div>
-              </div>
-            `)}
-          </div>
-        </div>
-      ` : ''}
-
-      <!-- Template Editor - Same as Send Tab -->
-      <div class="card">
-        <div class="card-title">
-          ${this._templateFormId ? `✏️ ${this.t('editTemplate')}` : `📝 ${this.t('createTemplate')}`}
-        </div>
-
-        <!-- Template Name Input (highlighted) -->
-        <div class="template-name-input">
-          <label>📋 ${this.t('templateName')} *</label>
-          <input type="text" .value=${this._templateFormName}
-                 @input=${(e) => this._templateFormName = e.target.value}
-                 placeholder="🚪 Türklingel, 🚨 Alarm, etc.">
-        </div>
-
-        ${this._renderNotificationForm(cameras, showIos, showAndroid, true)}
-
-        <!-- Action Buttons -->
-        <div class="action-buttons">
-          <button class="save-template-btn" @click=${this._saveTemplateFromEditor} ?disabled=${!this._templateFormName}>
-            💾 ${this._templateFormId ? this.t('save') : this.t('saveAsTemplate')}
-          </button>
-          ${this._templateFormId ? html`
-            <button class="btn btn-outline" style="padding: 14px;" @click=${() => { this._resetForm(); this._templateFormId = ''; this._templateFormName = ''; }}>
-              ❌ ${this.t('cancel')}
-            </button>
-          ` : ''}
-        </div>
-        ${this._success ? html`<div class="${this._success.startsWith('❌') ? 'error-msg' : 'success-msg'}">${this._success}</div>` : ''}
-      </div>
-    `;
-  }
-
-  _renderHelpTab() {
-    return html`
-      <div class="card">
-        <div class="card-title">❓ ${this.t('helpTitle')}</div>
-
-        <div class="help-section">
-          <h3>🚀 ${this.t('quickStart')}</h3>
-          <p>${this.t('quickStartText').split('\n').map(line => html`${line}<br>`)}</p>
-        </div>
-
-        <div class="help-section">
-          <h3>📱 ${this.t('iosFeatures')}</h3>
-          <p>${this.t('iosFeaturesText')}</p>
-          <ul>
-            <li><code>critical: true</code> - Override DND</li>
-            <li><code>badge: 5</code> - App icon badge</li>
-            <li><code>sound: "default"</code> - Custom sounds</li>
-            <li><code>interruption-level</code> - passive, active, time-sensitive, critical</li>
-          </ul>
-        </div>
-
-        <div class="help-section">
-          <h3>🤖 ${this.t('androidFeatures')}</h3>
-          <p>${this.t('androidFeaturesText')}</p>
-          <ul>
-            <li><code>channel: "alerts"</code> - Notification channels</li>
-            <li><code>color: "#FF0000"</code> - Notification color</li>
-            <li><code>ledColor: "red"</code> - LED color</li>
-            <li><code>vibrationPattern: "100, 1000, 100"</code></li>
-            <li><code>sticky: true</code> - Cannot dismiss</li>
-            <li><code>persistent: true</code> - Stays until cleared</li>
-            <li><code>chronometer: true</code> - Timer display</li>
-            <li><code>message: TTS</code> with <code>tts_text</code> - Text-to-speech</li>
-          </ul>
-        </div>
-
-        <div class="help-section">
-          <h3>🔄 ${this.t('buttonReaction')}</h3>
-          <pre>trigger:
-  - platform: event
-    event_type: mobile_app_notification_action
-    event_data:
-      action: "YOUR_ACTION_ID"
-action:
-  - service: notify.notify
-    data:
-      message: "Button pressed!"</pre>
-        </div>
-
-        <div class="help-section">
-          <h3>📲 ${this.t('availableServices')}</h3>
-          <ul>
-            <li><code>send_notification</code> - Simple notification</li>
-            <li><code>send_actionable</code> - With buttons</li>
-            <li><code>send_with_image</code> - With camera/image</li>
-            <li><code>send_tts</code> - Text-to-speech (Android)</li>
-            <li><code>send_map</code> - Map with pin (iOS)</li>
-            <li><code>send_progress</code> - Progress bar (Android)</li>
-            <li><code>send_chronometer</code> - Timer (Android)</li>
-            <li><code>send_from_template</code> - From template</li>
-            <li><code>send_to_group</code> - Send to device group</li>
-            <li><code>device_command</code> - Device commands (Android)</li>
-          </ul>
-        </div>
-      </div>
-    `;
-  }
-
-  _renderGroupModal() {
-    const g = this._editingGroup;
-    const devices = this._getDevices();
-
-    return html`
-      <div class="modal-overlay" @click=${(e) => { if(e.target === e.currentTarget) this._editingGroup = null; }}>
-        <div class="modal">
-          <div class="modal-title">${g.id ? `✏️ ${this.t('editGroup')}` : `👥 ${this.t('newGroupTitle')}`}</div>
-
-          <div class="form-group">
-            <label>${this.t('groupName')}</label>
-            <input type="text" .value=${g.name} @input=${(e) => g.name = e.target.value} placeholder="Family">
-          </div>
-
-          <div class="form-group">
-            <label>${this.t('selectDevices')}</label>
-            <div class="device-selector">
-              ${devices.map(d => html`
-                <div class="device-chip ${(g.devices || []).includes(d) ? 'selected' : ''}"
-                     @click=${() => {
-                       g.devices = g.devices || [];
-                       if(g.devices.includes(d)) g.devices = g.devices.filter(x => x !== d);
-                       else g.devices = [...g.devices, d];
-                       this.requestUpdate();
-                     }}>
-                  ${this._getDeviceType(d) === 'ios' ? '📱' : '🤖'} ${d}
-                </div>
-              `)}
-            </div>
-          </div>
-
-          <div class="modal-actions">
-            <button class="btn btn-outline" @click=${() => this._editingGroup = null}>${this.t('cancel')}</button>
-            <button class="btn btn-primary" @click=${() => this._saveGroup(g)}>💾 ${this.t('save')}</button>
-          </div>
-        </div>
-      </div>
-    `;
+  _renderTab() {
+    if (!this._loadedTabs[this._tab]) {
+      return html`<div class="card">⏳ ${this.t('loading')}</div>`;
+    }
+    switch (this._tab) {
+      case 'send': return this._renderSendTab();
+      case 'devices': return this._renderDevicesTab();
+      case 'templates': return this._renderTemplatesTab();
+      case 'help': return this._renderHelpTab();
+      default: return '';
+    }
   }
 
   // Helpers
@@ -1523,334 +905,6 @@ action:
   _getServiceCount() {
     return Object.keys(this.hass?.services?.notify_manager || {}).length;
   }
-
-  _toggleDevice(device) {
-    this._selectedGroup = '';
-    if (this._selectedDevices.includes(device)) {
-      this._selectedDevices = this._selectedDevices.filter(d => d !== device);
-    } else {
-      this._selectedDevices = [...this._selectedDevices, device];
-    }
-  }
-
-  _toggleDeviceInGroup(device, groupId) {
-    const group = this._groups.find(g => g.id === groupId);
-    if (!group) return;
-    group.devices = group.devices || [];
-    if (group.devices.includes(device)) {
-      group.devices = group.devices.filter(d => d !== device);
-    } else {
-      group.devices = [...group.devices, device];
-    }
-    this._groups = [...this._groups];
-    this._saveToStorage("notify_manager_groups", this._groups);
-    this.requestUpdate();
-  }
-
-  _applyTemplate(t) {
-    // Basic fields
-    this._title = t.title || '';
-    this._subtitle = t.subtitle || '';
-    this._message = t.message || '';
-    this._type = t.type || 'simple';
-    this._priority = t.priority || 'normal';
-    this._buttons = [...(t.buttons || [])];
-
-    // Recipients
-    this._selectedDevices = [...(t.devices || [])];
-    this._selectedGroup = t.group || '';
-
-    // Image/Camera
-    this._camera = t.camera || '';
-    this._imageUrl = t.image || '';
-
-    // Android options
-    this._channel = t.channel || '';
-    this._color = t.color || '';
-    this._ledColor = t.ledColor || '';
-    this._vibrationPattern = t.vibrationPattern || '';
-    this._notificationIcon = t.notificationIcon || '';
-    this._iconUrl = t.iconUrl || '';
-    this._sticky = t.sticky || false;
-    this._persistent = t.persistent || false;
-    this._alertOnce = t.alertOnce || false;
-    this._timeout = t.timeout || 0;
-    this._visibility = t.visibility || 'public';
-    this._carUi = t.carUi || false;
-    this._importance = t.importance || 'default';
-
-    // iOS options
-    this._sound = t.sound || '';
-    this._badge = t.badge || 0;
-    this._interruptionLevel = t.interruptionLevel || 'active';
-    this._critical = t.critical || false;
-    this._criticalVolume = t.criticalVolume || 1.0;
-
-    // Common
-    this._clickAction = t.clickAction || '';
-    this._tag = t.tag || '';
-    this._group = t.notificationGroup || '';
-
-    // TTS
-    this._ttsText = t.ttsText || '';
-    this._mediaStream = t.mediaStream || 'music_stream';
-
-    // Map
-    this._latitude = t.latitude || '';
-    this._longitude = t.longitude || '';
-
-    // Progress
-    this._progress = t.progress || 0;
-    this._progressMax = t.progressMax || 100;
-    this._progressIndeterminate = t.progressIndeterminate || false;
-  }
-
-  _loadTemplateForEdit(t) {
-    this._templateFormId = t.id;
-    this._templateFormName = t.name;
-    this._applyTemplate(t);
-  }
-
-  _applyButtonTemplate(templateName) {
-    const templates = {
-      confirm_dismiss: [{ action: 'CONFIRM', title: '✅ Confirm' }, { action: 'DISMISS', title: '❌ Dismiss' }],
-      yes_no: [{ action: 'YES', title: '👍 Yes' }, { action: 'NO', title: '👎 No' }],
-      alarm_response: [{ action: 'ALARM_OK', title: '✅ OK' }, { action: 'ALARM_SNOOZE', title: '⏰ Later' }, { action: 'ALARM_EMERGENCY', title: '🆘 Emergency' }],
-      door_response: [{ action: 'DOOR_OPEN', title: '🔓 Open' }, { action: 'DOOR_IGNORE', title: '🚪 Ignore' }],
-      reply: [{ action: 'REPLY', title: '💬 Reply' }]
-    };
-    this._buttons = [...(templates[templateName] || [])];
-  }
-
-  _addButton() { if (this._buttons.length < 3) this._buttons = [...this._buttons, { action: '', title: '' }]; }
-  _removeButton(i) { this._buttons = this._buttons.filter((_, idx) => idx !== i); }
-  _updateButton(i, field, value) { this._buttons = this._buttons.map((btn, idx) => idx === i ? { ...btn, [field]: value } : btn); }
-
-  _saveAsTemplate() {
-    const name = prompt(this.t('templateName') + ":", this._title || "📝 New Template");
-    if (!name) return;
-    const newTemplate = this._buildTemplateFromForm(name, '');
-    this._templates = [...this._templates, newTemplate];
-    this._saveToStorage("notify_manager_templates", this._templates);
-    this._success = `✅ ${this.t('templateSaved')}`;
-    setTimeout(() => this._success = "", 3000);
-  }
-
-  _saveTemplateFromEditor() {
-    if (!this._templateFormName) {
-      alert(this.t('enterName'));
-      return;
-    }
-
-    const template = this._buildTemplateFromForm(this._templateFormName, this._templateFormId);
-
-    if (this._templateFormId) {
-      // Update existing
-      this._templates = this._templates.map(t => t.id === this._templateFormId ? template : t);
-    } else {
-      // Create new
-      this._templates = [...this._templates, template];
-    }
-
-    this._saveToStorage("notify_manager_templates", this._templates);
-    this._success = `✅ ${this.t('templateSaved')}`;
-    setTimeout(() => this._success = "", 3000);
-
-    // Reset form
-    this._resetForm();
-    this._templateFormId = '';
-    this._templateFormName = '';
-  }
-
-  _buildTemplateFromForm(name, existingId) {
-    return {
-      id: existingId || 'tpl_' + Date.now(),
-      name,
-      title: this._title,
-      subtitle: this._subtitle,
-      message: this._message,
-      type: this._type,
-      priority: this._priority,
-      buttons: [...this._buttons],
-      // Recipients - IMPORTANT for send_from_template
-      devices: [...this._selectedDevices],  // Selected devices
-      group: this._selectedGroup,            // Selected group (name/id)
-      // Image/Camera
-      camera: this._camera,
-      image: this._imageUrl,
-      // Android options
-      channel: this._channel,
-      color: this._color,
-      ledColor: this._ledColor,
-      vibrationPattern: this._vibrationPattern,
-      notificationIcon: this._notificationIcon,
-      iconUrl: this._iconUrl,
-      sticky: this._sticky,
-      persistent: this._persistent,
-      alertOnce: this._alertOnce,
-      timeout: this._timeout,
-      visibility: this._visibility,
-      carUi: this._carUi,
-      importance: this._importance,
-      // iOS options
-      sound: this._sound,
-      badge: this._badge,
-      interruptionLevel: this._interruptionLevel,
-      critical: this._critical,
-      criticalVolume: this._criticalVolume,
-      // Common
-      clickAction: this._clickAction,
-      tag: this._tag,
-      notificationGroup: this._group,
-      // TTS (Android)
-      ttsText: this._ttsText,
-      mediaStream: this._mediaStream,
-      // Map (iOS)
-      latitude: this._latitude,
-      longitude: this._longitude,
-      // Progress (Android)
-      progress: this._progress,
-      progressMax: this._progressMax,
-      progressIndeterminate: this._progressIndeterminate,
-    };
-  }
-
-  _deleteTemplate(id) {
-    if (!confirm(this.t('deleteConfirm'))) return;
-    this._templates = this._templates.filter(t => t.id !== id);
-    this._saveToStorage("notify_manager_templates", this._templates);
-  }
-
-  _saveGroup(g) {
-    if (!g.name) { alert(this.t('enterName')); return; }
-    if (!g.devices?.length) { alert(this.t('selectAtLeastOne')); return; }
-    if (g.id) {
-      this._groups = this._groups.map(x => x.id === g.id ? {...g} : x);
-    } else {
-      g.id = 'grp_' + Date.now();
-      this._groups = [...this._groups, {...g}];
-    }
-    this._saveToStorage("notify_manager_groups", this._groups);
-    this._editingGroup = null;
-  }
-
-  _deleteGroup(id) {
-    if (!confirm(this.t('deleteConfirm'))) return;
-    this._groups = this._groups.filter(g => g.id !== id);
-    this._saveToStorage("notify_manager_groups", this._groups);
-  }
-
-  async _send() {
-    if (!this._message && this._type !== 'tts') return;
-    this._loading = true;
-    this._success = "";
-
-    try {
-      // Build data object with ALL options
-      const data = {
-        title: this._title || "Home Assistant",
-        message: this._message,
-      };
-
-      // Basic options
-      if (this._subtitle) data.subtitle = this._subtitle;
-      if (this._clickAction) data.clickAction = this._clickAction;
-      if (this._group) data.group = this._group;
-      if (this._tag) data.tag = this._tag;
-
-      // Target
-      let targets = [];
-      if (this._selectedGroup) {
-        const group = this._groups.find(g => g.id === this._selectedGroup);
-        if (group) targets = group.devices;
-      } else if (this._selectedDevices.length) {
-        targets = this._selectedDevices;
-      }
-      if (targets.length) data.target = targets;
-
-      // Determine service and add type-specific data
-      let service = "send_advanced";
-
-      // Android options
-      if (this._channel) data.channel = this._channel;
-      if (this._importance !== 'default') data.importance = this._importance;
-      if (this._color) data.color = this._color;
-      if (this._ledColor) data.ledColor = this._ledColor;
-      if (this._vibrationPattern) data.vibrationPattern = this._vibrationPattern;
-      if (this._notificationIcon) data.notification_icon = this._notificationIcon;
-      if (this._iconUrl) data.icon_url = this._iconUrl;
-      if (this._sticky) data.sticky = true;
-      if (this._persistent) data.persistent = true;
-      if (this._alertOnce) data.alert_once = true;
-      if (this._timeout > 0) data.timeout = this._timeout;
-      if (this._visibility !== 'public') data.visibility = this._visibility;
-      if (this._carUi) data.car_ui = true;
-      if (this._chronometer) data.chronometer = true;
-
-      // iOS options
-      if (this._sound) data.sound = this._sound;
-      if (this._badge > 0) data.badge = this._badge;
-      if (this._interruptionLevel !== 'active') data["interruption-level"] = this._interruptionLevel;
-      if (this._critical) {
-        data.push = { sound: { critical: 1, volume: this._criticalVolume } };
-      }
-
-      // Type specific
-      if (this._type === 'buttons' && this._buttons.length) {
-        data.actions = this._buttons.filter(b => b.action && b.title);
-      }
-
-      if (this._type === 'image') {
-        if (this._camera) data.camera_entity = this._camera;
-        if (this._imageUrl) data.image = this._imageUrl;
-      }
-
-      if (this._type === 'media') {
-        if (this._imageUrl) data.image = this._imageUrl;
-        if (this._videoUrl) data.video = this._videoUrl;
-        if (this._audioUrl) data.audio = this._audioUrl;
-      }
-
-      if (this._type === 'tts') {
-        service = "send_tts";
-        data.tts_text = this._message;
-        data.media_stream = this._mediaStream;
-      }
-
-      if (this._type === 'map') {
-        if (this._latitude && this._longitude) {
-          data.action_data = {
-            latitude: parseFloat(this._latitude),
-            longitude: parseFloat(this._longitude),
-          };
-          if (this._secondPinLat && this._secondPinLng) {
-            data.action_data.second_latitude = parseFloat(this._secondPinLat);
-            data.action_data.second_longitude = parseFloat(this._secondPinLng);
-          }
-        }
-      }
-
-      if (this._type === 'progress') {
-        data.progress = this._progress;
-        data.progress_max = this._progressMax;
-        if (this._progressIndeterminate) data.progress_indeterminate = true;
-      }
-
-      // Attachment options
-      if (this._hideThumbnail) data["hide-thumbnail"] = true;
-      if (this._lazyLoad) data.lazy = true;
-      if (this._contentType) data["content-type"] = this._contentType;
-
-      await this.hass.callService("notify_manager", service, data);
-      this._success = `✅ ${this.t('sent')}`;
-      setTimeout(() => this._success = "", 3000);
-    } catch (err) {
-      console.error("Send error:", err);
-      this._success = `❌ ${this.t('error')}: ` + err.message;
-    } finally {
-      this._loading = false;
-    }
-  }
 }
 
 customElements.define("notify-manager-panel", NotifyManagerPanel);
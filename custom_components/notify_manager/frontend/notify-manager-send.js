@@ -0,0 +1,207 @@
+/**
+ * Notify Manager Panel - Send tab
+ *
+ * Lazy loaded chunk: the methods are mixed into NotifyManagerPanel when the
+ * tab is opened for the first time.
+ */
+
+import { html } from "https://unpkg.com/lit-element@2.5.1/lit-element.js?module";
+import form from "./notify-manager-form.js";
+
+export default {
+  ...form,
+
+  _renderSendTab() {
+    const devices = this._getDevices();
+    const cameras = Object.keys(this.hass?.states || {}).filter(e => e.startsWith('camera.'));
+    const platforms = this._getTargetPlatforms();
+    const showIos = platforms.has('ios');
+    const showAndroid = platforms.has('android');
+
+    return html`
+      <div class="card">
+        <div class="card-title">📨 ${this.t('quickNotification')}</div>
+
+        <!-- Templates -->
+        ${this._templates.length ? html`
+          <div class="form-group">
+            <label>${this.t('useTemplate')}</label>
+            <div class="type-selector">
+              ${this._templates.map(t => html`
+                <div class="type-btn" @click=${() => this._applyTemplate(t)}>${t.name}</div>
+              `)}
+            </div>
+          </div>
+        ` : ''}
+
+        <!-- Recipients -->
+        <div class="form-group">
+          <label>${this.t('recipients')}</label>
+          <div class="device-selector">
+            <div class="device-chip ${this._selectedDevices.length === 0 && !this._selectedGroup ? 'selected' : ''}"
+                 @click=${() => { this._selectedDevices = []; this._selectedGroup = ''; }}>
+              📱 ${this.t('allDevices')}
+            </div>
+            ${this._groups.map(g => html`
+              <div class="device-chip group ${this._selectedGroup === g.id ? 'selected' : ''}"
+                   @click=${() => { this._selectedGroup = g.id; this._selectedDevices = []; }}>
+                👥 ${g.name}
+              </div>
+            `)}
+            ${devices.map(d => html`
+              <div class="device-chip ${this._selectedDevices.includes(d) ? 'selected' : ''}"
+                   @click=${() => this._toggleDevice(d)}>
+                ${this._getDeviceType(d) === 'ios' ? '📱' : this._getDeviceType(d) === 'android' ? '🤖' : '📱'} ${d}
+                ${this._getDeviceType(d) ? html`<span class="type-badge ${this._getDeviceType(d)}">${this._getDeviceType(d).toUpperCase()}</span>` : ''}
+              </div>
+            `)}
+          </div>
+        </div>
+
+        ${this._renderNotificationForm(cameras, showIos, showAndroid, false)}
+
+        <!-- Action Buttons -->
+        <div class="action-buttons">
+          <button class="send-btn" @click=${this._send} ?disabled=${this._loading || !this._message}>
+            ${this._loading ? `⏳ ${this.t('sending')}` : `📤 ${this.t('sendNotification')}`}
+          </button>
+          <button class="save-template-btn" @click=${this._saveAsTemplate}>
+            💾 ${this.t('saveAsTemplate')}
+          </button>
+        </div>
+        ${this._success ? html`<div class="${this._success.startsWith('❌') ? 'error-msg' : 'success-msg'}">${this._success}</div>` : ''}
+      </div>
+    `;
+  },
+
+  _toggleDevice(device) {
+    this._selectedGroup = '';
+    if (this._selectedDevices.includes(device)) {
+      this._selectedDevices = this._selectedDevices.filter(d => d !== device);
+    } else {
+      this._selectedDevices = [...this._selectedDevices, device];
+    }
+  },
+
+  _saveAsTemplate() {
+    const name = prompt(this.t('templateName') + ":", this._title || "📝 New Template");
+    if (!name) return;
+    const newTemplate = this._buildTemplateFromForm(name, '');
+    this._templates = [...this._templates, newTemplate];
+    this._saveToStorage("notify_manager_templates", this._templates);
+    this._success = `✅ ${this.t('templateSaved')}`;
+    setTimeout(() => this._success = "", 3000);
+  },
+
+  async _send() {
+    if (!this._message && this._type !== 'tts') return;
+    this._loading = true;
+    this._success = "";
+
+    try {
+      // Build data object with ALL options
+      const data = {
+        title: this._title || "Home Assistant",
+        message: this._message,
+      };
+
+      // Basic options
+      if (this._subtitle) data.subtitle = this._subtitle;
+      if (this._clickAction) data.clickAction = this._clickAction;
+      if (this._group) data.group = this._group;
+      if (this._tag) data.tag = this._tag;
+
+      // Target
+      let targets = [];
+      if (this._selectedGroup) {
+        const group = this._groups.find(g => g.id === this._selectedGroup);
+        if (group) targets = group.devices;
+      } else if (this._selectedDevices.length) {
+        targets = this._selectedDevices;
+      }
+      if (targets.length) data.target = targets;
+
+      // Determine service and add type-specific data
+      let service = "send_advanced";
+
+      // Android options
+      if (this._channel) data.channel = this._channel;
+      if (this._importance !== 'default') data.importance = this._importance;
+      if (this._color) data.color = this._color;
+      if (this._ledColor) data.ledColor = this._ledColor;
+      if (this._vibrationPattern) data.vibrationPattern = this._vibrationPattern;
+      if (this._notificationIcon) data.notification_icon = this._notificationIcon;
+      if (this._iconUrl) data.icon_url = this._iconUrl;
+      if (this._sticky) data.sticky = true;
+      if (this._persistent) data.persistent = true;
+      if (this._alertOnce) data.alert_once = true;
+      if (this._timeout > 0) data.timeout = this._timeout;
+      if (this._visibility !== 'public') data.visibility = this._visibility;
+      if (this._carUi) data.car_ui = true;
+      if (this._chronometer) data.chronometer = true;
+
+      // iOS options
+      if (this._sound) data.sound = this._sound;
+      if (this._badge > 0) data.badge = this._badge;
+      if (this._interruptionLevel !== 'active') data["interruption-level"] = this._interruptionLevel;
+      if (this._critical) {
+        data.push = { sound: { critical: 1, volume: this._criticalVolume } };
+      }
+
+      // Type specific
+      if (this._type === 'buttons' && this._buttons.length) {
+        data.actions = this._buttons.filter(b => b.action && b.title);
+      }
+
+      if (this._type === 'image') {
+        if (this._camera) data.camera_entity = this._camera;
+        if (this._imageUrl) data.image = this._imageUrl;
+      }
+
+      if (this._type === 'media') {
+        if (this._imageUrl) data.image = this._imageUrl;
+        if (this._videoUrl) data.video = this._videoUrl;
+        if (this._audioUrl) data.audio = this._audioUrl;
+      }
+
+      if (this._type === 'tts') {
+        service = "send_tts";
+        data.tts_text = this._message;
+        data.media_stream = this._mediaStream;
+      }
+
+      if (this._type === 'map') {
+        if (this._latitude && this._longitude) {
+          data.action_data = {
+            latitude: parseFloat(this._latitude),
+            longitude: parseFloat(this._longitude),
+          };
+          if (this._secondPinLat && this._secondPinLng) {
+            data.action_data.second_latitude = parseFloat(this._secondPinLat);
+            data.action_data.second_longitude = parseFloat(this._secondPinLng);
+          }
+        }
+      }
+
+      if (this._type === 'progress') {
+        data.progress = this._progress;
+        data.progress_max = this._progressMax;
+        if (this._progressIndeterminate) data.progress_indeterminate = true;
+      }
+
+      // Attachment options
+      if (this._hideThumbnail) data["hide-thumbnail"] = true;
+      if (this._lazyLoad) data.lazy = true;
+      if (this._contentType) data["content-type"] = this._contentType;
+
+      await this.hass.callService("notify_manager", service, data);
+      this._success = `✅ ${this.t('sent')}`;
+      setTimeout(() => this._success = "", 3000);
+    } catch (err) {
+      console.error("Send error:", err);
+      this._success = `❌ ${this.t('error')}: ` + err.message;
+    } finally {
+      this._loading = false;
+    }
+  },
+};
@@ -0,0 +1,112 @@
+/**
+ * Notify Manager Panel - Templates tab
+ *
+ * Lazy loaded chunk: the methods are mixed into NotifyManagerPanel when the
+ * tab is opened for the first time.
+ */
+
+import { html } from "https://unpkg.com/lit-element@2.5.1/lit-element.js?module";
+import form from "./notify-manager-form.js";
+
+export default {
+  ...form,
+
+  _renderTemplatesTab() {
+    const devices = this._getDevices();
+    const cameras = Object.keys(this.hass?.states || {}).filter(e => e.startsWith('camera.'));
+    const platforms = this._getTargetPlatforms();
+    const showIos = platforms.has('ios');
+    const showAndroid = platforms.has('android');
+
+    return html`
+      <!-- Saved Templates -->
+      ${this._templates.length ? html`
+        <div class="card">
+          <div class="card-title">📋 ${this.t('savedTemplates')}</div>
+          <div class="template-grid">
+            ${this._templates.map(t => html`
+              <div class="template-card">
+                <div class="template-name">${t.name}</div>
+                <div class="template-preview">${t.title}: ${t.message?.substring(0, 30)}${t.message?.length > 30 ? '...' : ''}</div>
+                <div class="template-preview">${this.t('type')}: ${t.type} | ${t.buttons?.length || 0} buttons</div>
+                <div class="template-actions">
+                  <button class="btn btn-primary btn-small" @click=${() => { this._loadTemplateForEdit(t); }}>${this.t('editTemplate')}</button>
+                  <button class="btn btn-outline btn-small" @click=${() => { this._applyTemplate(t); this._tab = 'send'; }}>${this.t('use')}</button>
+                  <button class="btn btn-danger btn-small" @click=${() => this._deleteTemplate(t.id)}>🗑️</button>
+                </div>
+              </div>
+            `)}
+          </div>
+        </div>
+      ` : ''}
+
+      <!-- Template Editor - Same as Send Tab -->
+      <div class="card">
+        <div class="card-title">
+          ${this._templateFormId ? `✏️ ${this.t('editTemplate')}` : `📝 ${this.t('createTemplate')}`}
+        </div>
+
+        <!-- Template Name Input (highlighted) -->
+        <div class="template-name-input">
+          <label>📋 ${this.t('templateName')} *</label>
+          <input type="text" .value=${this._templateFormName}
+                 @input=${(e) => this._templateFormName = e.target.value}
+                 placeholder="🚪 Türklingel, 🚨 Alarm, etc.">
+        </div>
+
+        ${this._renderNotificationForm(cameras, showIos, showAndroid, true)}
+
+        <!-- Action Buttons -->
+        <div class="action-buttons">
+          <button class="save-template-btn" @click=${this._saveTemplateFromEditor} ?disabled=${!this._templateFormName}>
+            💾 ${this._templateFormId ? this.t('save') : this.t('saveAsTemplate')}
+          </button>
+          ${this._templateFormId ? html`
+            <button class="btn btn-outline" style="padding: 14px;" @click=${() => { this._resetForm(); this._templateFormId = ''; this._templateFormName = ''; }}>
+              ❌ ${this.t('cancel')}
+            </button>
+          ` : ''}
+        </div>
+        ${this._success ? html`<div class="${this._success.startsWith('❌') ? 'error-msg' : 'success-msg'}">${this._success}</div>` : ''}
+      </div>
+    `;
+  },
+
+  _loadTemplateForEdit(t) {
+    this._templateFormId = t.id;
+    this._templateFormName = t.name;
+    this._applyTemplate(t);
+  },
+
+  _saveTemplateFromEditor() {
+    if (!this._templateFormName) {
+      alert(this.t('enterName'));
+      return;
+    }
+
+    const template = this._buildTemplateFromForm(this._templateFormName, this._templateFormId);
+
+    if (this._templateFormId) {
+      // Update existing
+      this._templates = this._templates.map(t => t.id === this._templateFormId ? template : t);
+    } else {
+      // Create new
+      this._templates = [...this._templates, template];
+    }
+
+    this._saveToStorage("notify_manager_templates", this._templates);
+    this._success = `✅ ${this.t('templateSaved')}`;
+    setTimeout(() => this._success = "", 3000);
+
+    // Reset form
+    this._resetForm();
+    this._templateFormId = '';
+    this._templateFormName = '';
+  },
+
+  _deleteTemplate(id) {
+    if (!confirm(this.t('deleteConfirm'))) return;
+    this._templates = this._templates.filter(t => t.id !== id);
+    this._saveToStorage("notify_manager_templates", this._templates);
+  },
+};
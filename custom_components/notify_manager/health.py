@@ -0,0 +1,169 @@
+"""Device health for Notify Manager.
+
+Pro Gerät wird mitgeführt, wie zuverlässig es erreichbar ist:
+- Fehler in Folge, letzter Erfolg/Fehler, geglättete Latenz (EWMA)
+- Circuit Breaker: nach `failure_threshold` Fehlern in Folge wird das Gerät
+  `cooldown` Sekunden lang übersprungen (open); danach geht genau ein
+  Probe-Versand raus (half-open) - Erfolg schließt, Fehler öffnet erneut
+So verschwenden Gruppen-Sendungen keine Zeit an toten Zielen (App
+deinstalliert, Push-Token abgelaufen), und `device_available` wird aussagekräftig.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime
+import time
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, DEFAULT_CIRCUIT_COOLDOWN, DEFAULT_FAILURE_THRESHOLD
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+# Weight of the newest latency in the moving average
+EWMA_ALPHA = 0.2
+
+
+def signal_health_updated(entry_id: str) -> str:
+    """Return the dispatcher signal for device health changes of an entry."""
+    return f"{DOMAIN}_{entry_id}_health_updated"
+
+
+class DeviceHealth:
+    """Health and circuit state of one device."""
+
+    __slots__ = (
+        "state",
+        "consecutive_failures",
+        "last_success",
+        "last_failure",
+        "last_error",
+        "latency_ms",
+        "opened_at",
+        "probing",
+    )
+
+    def __init__(self) -> None:
+        """Initialize a healthy device."""
+        self.state = STATE_CLOSED
+        self.consecutive_failures = 0
+        self.last_success: datetime | None = None
+        self.last_failure: datetime | None = None
+        self.last_error: str | None = None
+        self.latency_ms: float | None = None
+        self.opened_at = 0.0
+        self.probing = False
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the health as JSON-serialisable dict."""
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "last_success": self.last_success.isoformat() if self.last_success else None,
+            "last_failure": self.last_failure.isoformat() if self.last_failure else None,
+            "last_error": self.last_error,
+            "latency_ms": round(self.latency_ms, 1) if self.latency_ms is not None else None,
+        }
+
+
+class HealthTracker:
+    """Track device health and skip devices with an open circuit."""
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        cooldown: float = DEFAULT_CIRCUIT_COOLDOWN,
+        on_change: Callable[[], None] | None = None,
+    ) -> None:
+        """Initialize the tracker. `on_change` is called on state changes."""
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._on_change = on_change
+        self._devices: dict[str, DeviceHealth] = {}
+
+    @property
+    def devices(self) -> dict[str, DeviceHealth]:
+        """Return the health of all devices seen so far."""
+        return self._devices
+
+    def available(self, device: str) -> bool:
+        """Return False while the circuit of a device is open."""
+        health = self._devices.get(device)
+        if health is None or health.state != STATE_OPEN:
+            return True
+        return time.monotonic() - health.opened_at >= self.cooldown
+
+    def allow(self, device: str) -> bool:
+        """Return True if a notification may be sent to a device now."""
+        health = self._devices.get(device)
+        if health is None or health.state == STATE_CLOSED:
+            return True
+
+        if health.state == STATE_OPEN:
+            if time.monotonic() - health.opened_at < self.cooldown:
+                return False
+            self._set_state(health, STATE_HALF_OPEN)
+
+        # Half-open: exactly one probe at a time
+        if health.probing:
+            return False
+        health.probing = True
+        return True
+
+    def release(self, device: str) -> None:
+        """Give up a probe that ended without an outcome (e.g. cancelled)."""
+        health = self._devices.get(device)
+        if health is not None:
+            health.probing = False
+
+    def record(self, device: str, outcome: dict[str, Any]) -> None:
+        """Update the health of a device from a delivery outcome."""
+        health = self._devices.get(device)
+        if health is None:
+            health = self._devices[device] = DeviceHealth()
+        health.probing = False
+
+        latency = outcome.get("latency_ms")
+        if latency is not None:
+            health.latency_ms = (
+                latency
+                if health.latency_ms is None
+                else EWMA_ALPHA * latency + (1 - EWMA_ALPHA) * health.latency_ms
+            )
+
+        if outcome["status"] == "sent":
+            health.consecutive_failures = 0
+            health.last_success = dt_util.utcnow()
+            health.last_error = None
+            if health.state != STATE_CLOSED:
+                self._set_state(health, STATE_CLOSED)
+            return
+
+        health.consecutive_failures += 1
+        health.last_failure = dt_util.utcnow()
+        health.last_error = outcome.get("error")
+        if (
+            health.state == STATE_HALF_OPEN
+            or health.consecutive_failures >= self.failure_threshold
+        ):
+            health.opened_at = time.monotonic()
+            self._set_state(health, STATE_OPEN)
+
+    def reset(self, device: str | None = None) -> None:
+        """Close the circuit of one or all devices."""
+        for name in [device] if device else list(self._devices):
+            if self._devices.pop(name, None) is not None and self._on_change:
+                self._on_change()
+
+    def _set_state(self, health: DeviceHealth, state: str) -> None:
+        """Change the circuit state and notify listeners."""
+        health.state = state
+        if self._on_change:
+            self._on_change()
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        """Return the health of all devices."""
+        return {device: health.as_dict() for device, health in sorted(self._devices.items())}
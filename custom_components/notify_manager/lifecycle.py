@@ -0,0 +1,266 @@
+"""Lifecycle of sent notifications.
+
+Merkt sich pro Eintrag, welche Benachrichtigungen (per `tag`) gerade auf
+welchen Geräten angezeigt werden:
+- Index nach Tag und nach Korrelations-ID (siehe delivery.py)
+- `mobile_app_notification_cleared` entfernt das Gerät; ist die Meldung auf
+  keinem Gerät mehr offen, gilt sie als gelöscht (`cleared`)
+- das Gerät wird über `device_id`/`webhook_id` der mobile_app-Registrierung
+  auf das Notify-Ziel abgebildet; ist es unbekannt, zählt das Event als
+  ein Gerät (nie als alle)
+- mit `timeout` gesendete Meldungen laufen ab (`expired`); ungültige Werte
+  werden mit Warnung ignoriert
+- ein Button-Druck quittiert die Meldung, sie läuft dann nicht mehr ab
+Gelöschte und abgelaufene Meldungen werden über den `on_event`-Callback
+gemeldet; laufende Arbeit für den Tag (z.B. Fortschritts-Updates) kann
+dann verworfen werden.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from datetime import datetime
+import logging
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_DEVICE_ID, CONF_WEBHOOK_ID
+from homeassistant.core import CALLBACK_TYPE, Context, HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import slugify
+
+_LOGGER = logging.getLogger(__name__)
+
+LIFECYCLE_CLEARED = "cleared"
+LIFECYCLE_EXPIRED = "expired"
+
+# Oldest notifications are forgotten beyond this (no cleared event from the app)
+MAX_ACTIVE_NOTIFICATIONS = 500
+
+# Called with (lifecycle kind, event data, context)
+LifecycleCallback = Callable[[str, dict[str, Any], Context | None], None]
+
+
+class ActiveNotification:
+    """A sent notification that is still shown on at least one device."""
+
+    __slots__ = (
+        "tag",
+        "correlation_id",
+        "category",
+        "devices",
+        "unknown_clears",
+        "sent",
+        "expire_timer",
+    )
+
+    def __init__(
+        self,
+        tag: str,
+        correlation_id: str | None,
+        category: str | None,
+        devices: Iterable[str],
+    ) -> None:
+        """Initialize the notification."""
+        self.tag = tag
+        self.correlation_id = correlation_id
+        self.category = category
+        self.devices = set(devices)
+        # Cleared events whose device could not be resolved
+        self.unknown_clears = 0
+        self.sent = datetime.now().isoformat()
+        self.expire_timer: CALLBACK_TYPE | None = None
+
+    def as_event_data(self) -> dict[str, Any]:
+        """Return the fields shared by all lifecycle events."""
+        return {
+            "tag": self.tag,
+            "correlation_id": self.correlation_id,
+            "category": self.category,
+            "sent": self.sent,
+        }
+
+
+class ActiveNotifications:
+    """Index of the notifications that are currently shown."""
+
+    def __init__(self, hass: HomeAssistant, on_event: LifecycleCallback) -> None:
+        """Initialize the index."""
+        self.hass = hass
+        self._on_event = on_event
+        self._by_tag: dict[str, ActiveNotification] = {}
+        self._by_correlation: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        """Return the number of active notifications."""
+        return len(self._by_tag)
+
+    def get(self, tag: str) -> ActiveNotification | None:
+        """Return the active notification with a tag."""
+        return self._by_tag.get(tag)
+
+    def by_correlation_id(self, correlation_id: str) -> ActiveNotification | None:
+        """Return the active notification of a send call."""
+        tag = self._by_correlation.get(correlation_id)
+        return self._by_tag.get(tag) if tag else None
+
+    @callback
+    def async_track(
+        self,
+        tag: str,
+        correlation_id: str | None,
+        category: str | None,
+        devices: Iterable[str],
+        timeout: float | None = None,
+    ) -> None:
+        """Remember a sent notification; it replaces one with the same tag."""
+        expire_after: float | None = None
+        if timeout:
+            try:
+                expire_after = cv.positive_float(timeout)
+            except vol.Invalid:
+                _LOGGER.warning(
+                    "Notification '%s' has an invalid timeout %r, it will not expire",
+                    tag,
+                    timeout,
+                )
+
+        # The app replaces the notification with the same tag, so does the index
+        self._remove(tag)
+        notification = self._by_tag[tag] = ActiveNotification(
+            tag, correlation_id, category, devices
+        )
+        if correlation_id:
+            self._by_correlation[correlation_id] = tag
+        if expire_after:
+            notification.expire_timer = async_call_later(
+                self.hass, expire_after, self._expire_job(tag)
+            )
+
+        while len(self._by_tag) > MAX_ACTIVE_NOTIFICATIONS:
+            self._remove(next(iter(self._by_tag)))
+
+    @callback
+    def async_clear(
+        self,
+        tag: str,
+        device: str | None = None,
+        context: Context | None = None,
+        reason: str = "dismissed",
+    ) -> ActiveNotification | None:
+        """Mark a notification as cleared on a device.
+
+        With an unknown device (None) the event counts as one device.
+        Returns the notification once it is cleared everywhere.
+        """
+        notification = self._by_tag.get(tag)
+        if notification is None:
+            return None
+
+        if device is None:
+            notification.unknown_clears += 1
+        elif device in notification.devices:
+            notification.devices.discard(device)
+        else:
+            return None
+        if len(notification.devices) > notification.unknown_clears:
+            _LOGGER.debug("Notification '%s' cleared on %s", tag, device)
+            return None
+
+        self._remove(tag)
+        self._on_event(
+            LIFECYCLE_CLEARED,
+            {**notification.as_event_data(), "device": device, "reason": reason},
+            context,
+        )
+        return notification
+
+    @callback
+    def async_acknowledge(self, tag: str) -> None:
+        """Stop tracking a notification once a button was pressed."""
+        self._remove(tag)
+
+    def _expire_job(self, tag: str) -> Callable[[Any], None]:
+        """Return the timer callback that expires a notification."""
+
+        @callback
+        def _expire(_now: Any) -> None:
+            """Report the notification as expired."""
+            notification = self._by_tag.get(tag)
+            if notification is None:
+                return
+            notification.expire_timer = None
+            self._remove(tag)
+            self._on_event(
+                LIFECYCLE_EXPIRED,
+                {**notification.as_event_data(), "devices": sorted(notification.devices)},
+                None,
+            )
+
+        return _expire
+
+    def _remove(self, tag: str) -> None:
+        """Forget a notification and cancel its timer."""
+        notification = self._by_tag.pop(tag, None)
+        if notification is None:
+            return
+        if notification.expire_timer is not None:
+            notification.expire_timer()
+            notification.expire_timer = None
+        if notification.correlation_id:
+            self._by_correlation.pop(notification.correlation_id, None)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel all timers and forget all notifications."""
+        for tag in list(self._by_tag):
+            self._remove(tag)
+
+
+@callback
+def async_event_device(
+    hass: HomeAssistant,
+    event_data: dict[str, Any],
+    notification: ActiveNotification,
+) -> str | None:
+    """Return the notify target a Companion App event came from, if known."""
+    candidates = [event_data.get(key) for key in ("device_id", "sourceDeviceID", "device")]
+    candidates.insert(0, _async_mobile_app_target(hass, event_data))
+    for device in candidates:
+        if device in notification.devices:
+            return device
+    return None
+
+
+@callback
+def _async_mobile_app_target(
+    hass: HomeAssistant, event_data: dict[str, Any]
+) -> str | None:
+    """Map the device or webhook of a mobile_app event to its notify target."""
+    registration = None
+    if device_id := event_data.get(ATTR_DEVICE_ID):
+        device_entry = dr.async_get(hass).async_get(device_id)
+        if device_entry is not None:
+            registration = next(
+                (
+                    config_entry
+                    for entry_id in device_entry.config_entries
+                    if (config_entry := hass.config_entries.async_get_entry(entry_id))
+                    and config_entry.domain == "mobile_app"
+                ),
+                None,
+            )
+    if registration is None and (webhook_id := event_data.get(CONF_WEBHOOK_ID)):
+        registration = next(
+            (
+                config_entry
+                for config_entry in hass.config_entries.async_entries("mobile_app")
+                if config_entry.data.get(CONF_WEBHOOK_ID) == webhook_id
+            ),
+            None,
+        )
+    if registration is None:
+        return None
+    # mobile_app registers notify.mobile_app_<slugified device name>
+    return slugify(registration.data.get("device_name") or registration.title)
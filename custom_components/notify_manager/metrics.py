@@ -0,0 +1,159 @@
+"""Send path metrics for Notify Manager.
+
+Leichte Zeitmessung der Versand-Phasen, aggregiert in Histogrammen mit
+festen Buckets statt in Logs:
+- `template` (Vorlage finden + rendern), `payload`, `targets`
+- `device_call` (pro Gerät), `history`, `event`, `send` (gesamt)
+- Zähler, z.B. gesendete und fehlgeschlagene Geräte-Aufrufe
+- `ack`: Zeit vom Versand bis zum Button-Druck (gleicher `tag`)
+Pro Messung nur ein `perf_counter()` und ein bisect - günstig genug für den
+Dauerbetrieb. Mit der Option `enable_metrics` lässt sich alles abschalten.
+Abrufbar über die Diagnose, den WebSocket-Befehl `notify_manager/metrics` und
+optional im Prometheus-Format (siehe prometheus.py).
+"""
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import OrderedDict
+from datetime import datetime
+import time
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+# Upper bounds in seconds; the last bucket catches everything above
+BUCKET_BOUNDS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+    0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+# Acks are human reaction times
+ACK_BUCKET_BOUNDS = (1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0, 3600.0)
+PHASE_BUCKET_BOUNDS = {"ack": ACK_BUCKET_BOUNDS}
+
+# Sent tags remembered for the ack latency
+MAX_TRACKED_TAGS = 256
+
+
+class Histogram:
+    """Fixed-size latency histogram."""
+
+    __slots__ = ("bounds", "counts", "count", "total", "max")
+
+    def __init__(self, bounds: tuple[float, ...] = BUCKET_BOUNDS) -> None:
+        """Initialize an empty histogram."""
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Add one duration."""
+        self.counts[bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, quantile: float) -> float:
+        """Return the upper bucket bound below which `quantile` of the values lie."""
+        if not self.count:
+            return 0.0
+        rank = quantile * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return self.bounds[index] if index < len(self.bounds) else self.max
+        return self.max
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram in milliseconds."""
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            "max_ms": round(self.max * 1000, 3),
+            "p50_ms": round(self.quantile(0.5) * 1000, 3),
+            "p90_ms": round(self.quantile(0.9) * 1000, 3),
+            "p99_ms": round(self.quantile(0.99) * 1000, 3),
+            "buckets": {
+                f"le_{bound * 1000:g}ms": count
+                for bound, count in zip(self.bounds, self.counts)
+            } | {"le_inf": self.counts[-1]},
+        }
+
+
+class Metrics:
+    """Histograms per send phase and simple counters."""
+
+    def __init__(self, enabled: bool = True) -> None:
+        """Initialize the metrics."""
+        self.enabled = enabled
+        self.histograms: dict[str, Histogram] = {}
+        self.counters: dict[str, int] = {}
+        self.since: datetime = dt_util.utcnow()
+        # Bumped on every change, lets exporters reuse their last output
+        self.generation = 0
+        # tag -> perf_counter() of the last send
+        self._sent_tags: OrderedDict[str, float] = OrderedDict()
+
+    def observe(self, phase: str, seconds: float) -> None:
+        """Add a duration to the histogram of a phase."""
+        if not self.enabled:
+            return
+        histogram = self.histograms.get(phase)
+        if histogram is None:
+            histogram = self.histograms[phase] = Histogram(
+                PHASE_BUCKET_BOUNDS.get(phase, BUCKET_BOUNDS)
+            )
+        histogram.observe(seconds)
+        self.generation += 1
+
+    def observe_since(self, phase: str, start: float) -> None:
+        """Add the time since `start` (a `time.perf_counter()` value)."""
+        if self.enabled:
+            self.observe(phase, time.perf_counter() - start)
+
+    def increment(self, counter: str, amount: int = 1) -> None:
+        """Increase a counter."""
+        if self.enabled:
+            self.counters[counter] = self.counters.get(counter, 0) + amount
+            self.generation += 1
+
+    def mark_sent(self, tag: str | None) -> None:
+        """Remember when a tag was sent, for the ack latency."""
+        if not self.enabled or not tag:
+            return
+        self._sent_tags.pop(tag, None)
+        self._sent_tags[tag] = time.perf_counter()
+        if len(self._sent_tags) > MAX_TRACKED_TAGS:
+            self._sent_tags.popitem(last=False)
+
+    def observe_ack(self, tag: str | None) -> None:
+        """Record the time from sending a tag to the first action on it."""
+        if not self.enabled or not tag:
+            return
+        sent = self._sent_tags.pop(tag, None)
+        if sent is not None:
+            self.observe("ack", time.perf_counter() - sent)
+
+    def reset(self) -> None:
+        """Drop all collected values."""
+        self.histograms.clear()
+        self.counters.clear()
+        self._sent_tags.clear()
+        self.since = dt_util.utcnow()
+        self.generation += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all metrics as JSON-serialisable dict."""
+        return {
+            "enabled": self.enabled,
+            "since": self.since.isoformat(),
+            "histograms": {
+                phase: histogram.as_dict()
+                for phase, histogram in sorted(self.histograms.items())
+            },
+            "counters": dict(sorted(self.counters.items())),
+        }
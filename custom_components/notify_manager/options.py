@@ -0,0 +1,86 @@
+"""Option change handling for Notify Manager.
+
+Ordnet geänderte Werte der Config-Entry-Daten einer Aktion zu, damit nur
+Änderungen, die es wirklich brauchen, einen Reload auslösen. Alles andere
+wird im laufenden Betrieb übernommen - Verlauf, offene Aktionen und
+Digest-Timer bleiben erhalten.
+"""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+from .const import (
+    DOMAIN,
+    CONF_DEVICES,
+    CONF_CATEGORIES,
+    CONF_DEFAULT_PRIORITY,
+    CONF_ENABLE_HISTORY,
+    CONF_SHOW_SIDEBAR,
+    CONF_DIGEST_INTERVAL,
+    CONF_DIGEST_MAX_ITEMS,
+    CONF_COMPACT_ATTRIBUTES,
+    CONF_RESIZE_ATTACHMENTS,
+    CONF_ENABLE_METRICS,
+    CONF_PROMETHEUS,
+    CONF_TRACE_SAMPLE_RATE,
+    CONF_FAILOVER_ROUTES,
+)
+
+# Only the sidebar entry has to be registered again
+PANEL_KEYS = frozenset({CONF_SHOW_SIDEBAR})
+
+# Read by the send path on every call, only the entry data has to be swapped
+RUNTIME_KEYS = frozenset({
+    CONF_DEVICES,
+    CONF_CATEGORIES,
+    CONF_DEFAULT_PRIORITY,
+    CONF_ENABLE_HISTORY,
+    CONF_DIGEST_INTERVAL,
+    CONF_DIGEST_MAX_ITEMS,
+    CONF_RESIZE_ATTACHMENTS,
+    CONF_ENABLE_METRICS,
+    CONF_PROMETHEUS,
+    CONF_TRACE_SAMPLE_RATE,
+    CONF_FAILOVER_ROUTES,
+})
+
+# Entities have to write their state again
+ENTITY_KEYS = frozenset({CONF_COMPACT_ATTRIBUTES})
+
+_MISSING = object()
+
+
+def signal_options_updated(entry_id: str) -> str:
+    """Return the dispatcher signal for option changes of an entry."""
+    return f"{DOMAIN}_{entry_id}_options_updated"
+
+
+class OptionChanges:
+    """Changed keys of a config entry, grouped by what they require."""
+
+    __slots__ = ("changed", "panel", "runtime", "entities", "reload")
+
+    def __init__(self, changed: set[str]) -> None:
+        """Classify the changed keys. Unknown keys require a reload."""
+        self.changed = changed
+        self.panel = bool(changed & PANEL_KEYS)
+        self.runtime = bool(changed & RUNTIME_KEYS)
+        self.entities = bool(changed & ENTITY_KEYS)
+        self.reload = bool(changed - PANEL_KEYS - RUNTIME_KEYS - ENTITY_KEYS)
+
+    def __bool__(self) -> bool:
+        """Return True if anything changed."""
+        return bool(self.changed)
+
+
+def classify_option_changes(
+    old: Mapping[str, Any], new: Mapping[str, Any]
+) -> OptionChanges:
+    """Return which keys differ between the old and the new entry data."""
+    changed = {
+        key
+        for key in old.keys() | new.keys()
+        if old.get(key, _MISSING) != new.get(key, _MISSING)
+    }
+    return OptionChanges(changed)
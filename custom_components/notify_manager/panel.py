@@ -0,0 +1,141 @@
+"""Panel asset serving for Notify Manager.
+
+Die Frontend-Dateien werden beim Start EINMAL gelesen, gehasht und vorkomprimiert
+(gzip, brotli falls verfügbar). Ausgeliefert werden sie unter einer URL mit dem
+Content-Hash, daher können Browser sie unbegrenzt cachen (immutable).
+"""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import logging
+from pathlib import Path
+
+from aiohttp import hdrs, web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+_LOGGER = logging.getLogger(__name__)
+
+PANEL_URL_BASE = "/notify_manager_panel"
+PANEL_MODULE = "notify-manager-panel.js"
+
+# Served assets never change for a given hash
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Requests for an outdated hash get the current file, but must not be cached
+NO_CACHE_CONTROL = "no-cache"
+
+CONTENT_TYPES = {
+    ".js": "application/javascript",
+    ".css": "text/css",
+}
+
+
+class PanelAsset:
+    """One frontend file with its pre-compressed variants."""
+
+    __slots__ = ("content_type", "raw", "gzip", "brotli")
+
+    def __init__(self, content_type: str, raw: bytes) -> None:
+        """Compress the file content (runs in the executor)."""
+        self.content_type = content_type
+        self.raw = raw
+        self.gzip = gzip.compress(raw, compresslevel=9, mtime=0)
+        self.brotli = brotli.compress(raw, quality=11) if brotli else None
+
+
+class PanelAssets:
+    """All frontend assets, keyed by file name, plus a content hash version."""
+
+    def __init__(self, assets: dict[str, PanelAsset], version: str) -> None:
+        """Initialize the asset set."""
+        self.assets = assets
+        self.version = version
+
+    @property
+    def module_url(self) -> str:
+        """Return the versioned URL of the panel module."""
+        return f"{PANEL_URL_BASE}/{self.version}/{PANEL_MODULE}"
+
+
+def load_panel_assets(frontend_path: Path) -> PanelAssets:
+    """Read, hash and compress all frontend files (blocking, use executor)."""
+    assets: dict[str, PanelAsset] = {}
+    digest = hashlib.sha256()
+
+    for path in sorted(frontend_path.iterdir()):
+        content_type = CONTENT_TYPES.get(path.suffix)
+        if content_type is None or not path.is_file():
+            continue
+        raw = path.read_bytes()
+        digest.update(path.name.encode())
+        digest.update(raw)
+        assets[path.name] = PanelAsset(content_type, raw)
+
+    return PanelAssets(assets, digest.hexdigest()[:16])
+
+
+async def async_get_panel_assets(hass: HomeAssistant, frontend_path: Path) -> PanelAssets:
+    """Return the panel assets, loading them once per Home Assistant run."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    panel_assets = domain_data.get("_panel_assets")
+    if panel_assets is None:
+        panel_assets = await hass.async_add_executor_job(load_panel_assets, frontend_path)
+        domain_data["_panel_assets"] = panel_assets
+        _LOGGER.debug(
+            "Loaded %d panel assets (version %s, brotli: %s)",
+            len(panel_assets.assets), panel_assets.version, brotli is not None,
+        )
+    return panel_assets
+
+
+class NotifyManagerPanelView(HomeAssistantView):
+    """Serve pre-compressed panel assets with immutable caching."""
+
+    url = PANEL_URL_BASE + "/{version}/{filename}"
+    name = "notify_manager:panel"
+    requires_auth = False
+
+    def __init__(self, panel_assets: PanelAssets) -> None:
+        """Initialize the view."""
+        self._panel_assets = panel_assets
+
+    async def get(self, request: web.Request, version: str, filename: str) -> web.Response:
+        """Return an asset in the best encoding the client accepts."""
+        asset = self._panel_assets.assets.get(filename)
+        if asset is None:
+            raise web.HTTPNotFound()
+
+        headers = {
+            hdrs.CACHE_CONTROL: (
+                IMMUTABLE_CACHE_CONTROL
+                if version == self._panel_assets.version
+                else NO_CACHE_CONTROL
+            ),
+            hdrs.VARY: hdrs.ACCEPT_ENCODING,
+        }
+        accept_encoding = request.headers.get(hdrs.ACCEPT_ENCODING, "")
+
+        if asset.brotli is not None and "br" in accept_encoding:
+            body = asset.brotli
+            headers[hdrs.CONTENT_ENCODING] = "br"
+        elif "gzip" in accept_encoding:
+            body = asset.gzip
+            headers[hdrs.CONTENT_ENCODING] = "gzip"
+        else:
+            body = asset.raw
+
+        return web.Response(
+            body=body,
+            headers=headers,
+            content_type=asset.content_type,
+            charset="utf-8",
+        )
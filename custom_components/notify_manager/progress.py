@@ -0,0 +1,262 @@
+"""Progress update stream for Notify Manager.
+
+Fortschrittsbalken (Download, Drucker, Waschmaschine, ...) werden oft mehrmals
+pro Sekunde mit demselben `tag` aktualisiert. Der Stream sendet pro Tag nur
+bei relevanter Änderung:
+- sofort, wenn sich der Fortschritt um mindestens `min_delta` Prozent ändert
+- sonst höchstens alle `min_interval` Sekunden (letzter Stand wird nachgereicht)
+- 100 %, Abbruch (< 0) und unbestimmter Fortschritt werden immer sofort gesendet
+Zwischenstände, die noch auf den Versand warten, werden zusammengefasst.
+Wird die Benachrichtigung gelöscht oder läuft ab, verwirft der Stream den
+wartenden Stand, statt sie erneut anzuzeigen. Streams ohne Update seit
+`idle_timeout` Sekunden (kein 100 % gemeldet) werden ebenfalls vergessen.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import logging
+import time
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.event import async_call_later
+
+from .const import (
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_MESSAGE,
+    ATTR_PROGRESS,
+    ATTR_PROGRESS_INDETERMINATE,
+    ATTR_PROGRESS_MAX,
+    ATTR_TAG,
+    ATTR_TARGET,
+    ATTR_TITLE,
+    DEFAULT_PROGRESS_IDLE_TIMEOUT,
+    DEFAULT_PROGRESS_MIN_DELTA,
+    DEFAULT_PROGRESS_MIN_INTERVAL,
+)
+from .metrics import Metrics
+
+_LOGGER = logging.getLogger(__name__)
+
+SendCallback = Callable[[Any], Awaitable[Any]]
+
+SEND_PROGRESS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_TITLE): cv.string,
+        vol.Required(ATTR_MESSAGE): cv.string,
+        vol.Required(ATTR_PROGRESS): vol.All(vol.Coerce(int), vol.Range(min=-1, max=100)),
+        vol.Optional(ATTR_PROGRESS_MAX, default=100): vol.Coerce(int),
+        vol.Optional(ATTR_PROGRESS_INDETERMINATE, default=False): cv.boolean,
+        vol.Required(ATTR_TAG): cv.string,
+        vol.Optional(ATTR_TARGET): vol.All(cv.ensure_list, [cv.string]),
+        # Stream mode (per tag)
+        vol.Optional("throttle", default=True): cv.boolean,
+        vol.Optional("min_delta"): vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
+        vol.Optional("min_interval"): vol.All(vol.Coerce(float), vol.Range(min=0, max=3600)),
+    }
+)
+
+
+def progress_percent(progress: int, progress_max: int) -> float:
+    """Return the progress in percent."""
+    if progress_max <= 0:
+        return float(progress)
+    return progress * 100 / progress_max
+
+
+class _TagState:
+    """Stream state of one tag."""
+
+    __slots__ = ("last_percent", "last_sent", "last_update", "pending", "timer", "task", "lock")
+
+    def __init__(self) -> None:
+        """Initialize the state."""
+        self.last_percent: float | None = None
+        self.last_sent = 0.0
+        self.last_update = time.monotonic()
+        # Latest update not sent yet: (percent, payload)
+        self.pending: tuple[float, Any] | None = None
+        self.timer: CALLBACK_TYPE | None = None
+        # Send of a flushed update that may not have started yet
+        self.task: asyncio.Task | None = None
+        self.lock = asyncio.Lock()
+
+
+class ProgressStream:
+    """Throttle progress notifications per tag."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        send: SendCallback,
+        min_delta: float = DEFAULT_PROGRESS_MIN_DELTA,
+        min_interval: float = DEFAULT_PROGRESS_MIN_INTERVAL,
+        metrics: Metrics | None = None,
+        idle_timeout: float = DEFAULT_PROGRESS_IDLE_TIMEOUT,
+    ) -> None:
+        """Initialize the stream.
+
+        `send` is called with the payload of an update that has to go out.
+        """
+        self.hass = hass
+        self._send = send
+        self._metrics = metrics
+        self.min_delta = min_delta
+        self.min_interval = min_interval
+        self.idle_timeout = idle_timeout
+        self._tags: dict[str, _TagState] = {}
+        self._sweep_timer: CALLBACK_TYPE | None = None
+
+    @property
+    def active_tags(self) -> list[str]:
+        """Return the tags with an open stream."""
+        return list(self._tags)
+
+    async def async_update(
+        self,
+        tag: str,
+        progress: int,
+        progress_max: int,
+        indeterminate: bool,
+        payload: Any,
+        min_delta: float | None = None,
+        min_interval: float | None = None,
+    ) -> Any:
+        """Handle a progress update.
+
+        Returns the result of `send` if the update went out right away,
+        None if it was held back.
+        """
+        percent = progress_percent(progress, progress_max)
+        state = self._tags.get(tag)
+
+        # Final states always go out and close the stream
+        if indeterminate or progress < 0 or percent >= 100:
+            if state is None:
+                state = _TagState()
+            # Also drops a flushed update that has not gone out yet
+            self._cancel(state)
+            self._tags.pop(tag, None)
+            async with state.lock:
+                result = await self._send(payload)
+            _LOGGER.debug("Progress '%s' finished (%s)", tag, "indeterminate" if indeterminate else progress)
+            return result
+
+        if state is None:
+            state = self._tags[tag] = _TagState()
+            self._schedule_sweep()
+        state.last_update = time.monotonic()
+
+        if state.last_percent is not None and percent == state.last_percent:
+            state.pending = None
+            self._count("progress_deduped")
+            return None
+
+        min_delta = self.min_delta if min_delta is None else min_delta
+        min_interval = self.min_interval if min_interval is None else min_interval
+        elapsed = time.monotonic() - state.last_sent
+
+        if (
+            state.last_percent is None
+            or abs(percent - state.last_percent) >= min_delta
+            or elapsed >= min_interval
+        ) and not state.lock.locked():
+            self._cancel(state)
+            return await self._async_send(state, percent, payload)
+
+        # Collapse with any update still waiting and send the latest later
+        self._count("progress_coalesced" if state.pending is not None else "progress_deferred")
+        state.pending = (percent, payload)
+        if state.timer is None:
+            state.timer = async_call_later(
+                self.hass, max(min_interval - elapsed, 0), self._flush_job(tag)
+            )
+        return None
+
+    async def _async_send(self, state: _TagState, percent: float, payload: Any) -> Any:
+        """Send an update and remember it as the last sent state."""
+        async with state.lock:
+            state.last_percent = percent
+            state.last_sent = time.monotonic()
+            return await self._send(payload)
+
+    def _flush_job(self, tag: str) -> Callable[[Any], None]:
+        """Return the timer callback that sends the pending update of a tag."""
+
+        @callback
+        def _flush(_now: Any) -> None:
+            """Send the latest pending update."""
+            state = self._tags.get(tag)
+            if state is None:
+                return
+            state.timer = None
+            if state.pending is None:
+                return
+            percent, payload = state.pending
+            state.pending = None
+            state.task = self.hass.async_create_task(
+                self._async_send(state, percent, payload)
+            )
+
+        return _flush
+
+    def _schedule_sweep(self) -> None:
+        """Look for idle streams once the idle timeout has passed."""
+        if self._sweep_timer is None:
+            self._sweep_timer = async_call_later(
+                self.hass, self.idle_timeout, self._async_sweep
+            )
+
+    @callback
+    def _async_sweep(self, _now: Any) -> None:
+        """Forget streams without an update within the idle timeout."""
+        self._sweep_timer = None
+        deadline = time.monotonic() - self.idle_timeout
+        for tag, state in list(self._tags.items()):
+            # A deferred update still has to go out
+            if state.last_update <= deadline and state.timer is None:
+                del self._tags[tag]
+                self._cancel(state)
+                self._count("progress_evicted")
+        if self._tags:
+            self._schedule_sweep()
+
+    def _count(self, counter: str) -> None:
+        """Count a throttled update."""
+        if self._metrics is not None:
+            self._metrics.increment(counter)
+
+    @staticmethod
+    def _cancel(state: _TagState) -> None:
+        """Drop the pending update, its timer and a flushed send."""
+        state.pending = None
+        if state.timer is not None:
+            state.timer()
+            state.timer = None
+        if state.task is not None:
+            if not state.task.done():
+                state.task.cancel()
+            state.task = None
+
+    @callback
+    def async_discard(self, tag: str) -> None:
+        """Drop the stream of a tag whose notification is gone."""
+        state = self._tags.pop(tag, None)
+        if state is not None:
+            self._cancel(state)
+            self._count("progress_discarded")
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel all timers and forget all streams."""
+        if self._sweep_timer is not None:
+            self._sweep_timer()
+            self._sweep_timer = None
+        for state in self._tags.values():
+            self._cancel(state)
+        self._tags.clear()
@@ -0,0 +1,126 @@
+"""Prometheus exposition of the Notify Manager metrics.
+
+Optional (Einstellung `prometheus_metrics`): `GET /api/notify_manager/metrics`
+liefert die Metriken im Prometheus-Textformat (Auth per Long-Lived Token):
+- Histogramme der Versand-Phasen inkl. `ack` (Versand bis Button-Druck)
+- Zähler: Versand nach Status, Geräte-Aufrufe, gedrosselte Fortschritts-Updates
+- Warteschlangen: gesammelte Digests, offene Fortschritts-Streams, offene Aktionen
+Die Werte liegen bereits aggregiert im Speicher; die Ausgabe wird nur neu
+erzeugt, wenn sich seit dem letzten Scrape etwas geändert hat.
+"""
+from __future__ import annotations
+
+from aiohttp import hdrs, web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN, CONF_PROMETHEUS
+from .data import NotifyManagerData, async_entries_data
+from .metrics import Metrics
+
+METRICS_URL = f"/api/{DOMAIN}/metrics"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+PREFIX = DOMAIN
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _queue_depths(entry_data: NotifyManagerData) -> dict[str, int]:
+    """Return the current queue sizes of an entry."""
+    digest = entry_data.digest
+    progress = entry_data.progress_stream
+    return {
+        "digest": sum(digest.pending.values()) if digest else 0,
+        "progress_streams": len(progress.active_tags) if progress else 0,
+        "pending_actions": len(entry_data.pending_actions),
+        "active_notifications": len(entry_data.active_notifications or ()),
+    }
+
+
+def format_metrics(entries: list[tuple[str, Metrics, dict[str, int]]]) -> str:
+    """Return metrics of all entries in the text exposition format."""
+    lines: list[str] = []
+
+    lines.append(f"# HELP {PREFIX}_phase_duration_seconds Duration of the send path phases.")
+    lines.append(f"# TYPE {PREFIX}_phase_duration_seconds histogram")
+    for entry_id, metrics, _queues in entries:
+        for phase, histogram in sorted(metrics.histograms.items()):
+            labels = f'entry="{_escape(entry_id)}",phase="{_escape(phase)}"'
+            cumulative = 0
+            for bound, count in zip(histogram.bounds, histogram.counts):
+                cumulative += count
+                lines.append(
+                    f'{PREFIX}_phase_duration_seconds_bucket{{{labels},le="{bound:g}"}} {cumulative}'
+                )
+            lines.append(
+                f'{PREFIX}_phase_duration_seconds_bucket{{{labels},le="+Inf"}} {histogram.count}'
+            )
+            lines.append(f"{PREFIX}_phase_duration_seconds_sum{{{labels}}} {histogram.total:.6f}")
+            lines.append(f"{PREFIX}_phase_duration_seconds_count{{{labels}}} {histogram.count}")
+
+    lines.append(f"# HELP {PREFIX}_events_total Counted send path events.")
+    lines.append(f"# TYPE {PREFIX}_events_total counter")
+    for entry_id, metrics, _queues in entries:
+        for counter, value in sorted(metrics.counters.items()):
+            lines.append(
+                f'{PREFIX}_events_total{{entry="{_escape(entry_id)}",event="{_escape(counter)}"}} {value}'
+            )
+
+    lines.append(f"# HELP {PREFIX}_queue_depth Items waiting in internal queues.")
+    lines.append(f"# TYPE {PREFIX}_queue_depth gauge")
+    for entry_id, _metrics, queues in entries:
+        for queue, depth in queues.items():
+            lines.append(
+                f'{PREFIX}_queue_depth{{entry="{_escape(entry_id)}",queue="{queue}"}} {depth}'
+            )
+
+    return "\n".join(lines) + "\n"
+
+
+class NotifyManagerMetricsView(HomeAssistantView):
+    """Serve the metrics in the Prometheus text format."""
+
+    url = METRICS_URL
+    name = f"api:{DOMAIN}:metrics"
+
+    def __init__(self) -> None:
+        """Initialize the view."""
+        # (generation key, body) of the last scrape
+        self._cache: tuple[tuple, str] | None = None
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Return the metrics of all entries that expose them."""
+        hass: HomeAssistant = request.app["hass"]
+        entries = []
+        for entry_id, entry_data in async_entries_data(hass):
+            if entry_data.config.get(CONF_PROMETHEUS, False):
+                entries.append((entry_id, entry_data.metrics, _queue_depths(entry_data)))
+
+        if not entries:
+            raise web.HTTPNotFound()
+
+        key = tuple(
+            (entry_id, metrics.generation, tuple(queues.values()))
+            for entry_id, metrics, queues in entries
+        )
+        if self._cache is None or self._cache[0] != key:
+            self._cache = (key, format_metrics(entries))
+
+        return web.Response(
+            text=self._cache[1],
+            headers={hdrs.CONTENT_TYPE: CONTENT_TYPE},
+        )
+
+
+@callback
+def async_register_metrics_view(hass: HomeAssistant) -> None:
+    """Register the metrics view once (views cannot be removed again)."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if not domain_data.get("_metrics_view"):
+        hass.http.register_view(NotifyManagerMetricsView())
+        domain_data["_metrics_view"] = True
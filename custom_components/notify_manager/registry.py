@@ -0,0 +1,109 @@
+"""Template registry for Notify Manager.
+
+Hält die Benutzer-Vorlagen indiziert nach ID und berechnet beim Speichern
+die Unterschiede (hinzugefügt / entfernt / geändert), damit Entities und
+Caches nur die betroffenen Vorlagen neu verarbeiten müssen.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+from .const import DOMAIN
+
+
+def signal_templates_updated(entry_id: str) -> str:
+    """Return the dispatcher signal for template changes of an entry."""
+    return f"{DOMAIN}_{entry_id}_templates_updated"
+
+
+def template_key(template: dict[str, Any]) -> str:
+    """Return the stable key of a template (id, falls back to name)."""
+    return template.get("id") or template.get("name", "")
+
+
+def template_action_ids(template: dict[str, Any]) -> list[str]:
+    """Return the action IDs of a template's buttons."""
+    return [btn["action"] for btn in template.get("buttons", []) if btn.get("action")]
+
+
+class TemplateDiff:
+    """Difference between two template registry versions."""
+
+    __slots__ = ("version", "added", "removed", "changed")
+
+    def __init__(
+        self,
+        version: int,
+        added: list[dict[str, Any]],
+        removed: list[dict[str, Any]],
+        changed: list[tuple[dict[str, Any], dict[str, Any]]],
+    ) -> None:
+        """Initialize the diff. `changed` holds (old, new) pairs."""
+        self.version = version
+        self.added = added
+        self.removed = removed
+        self.changed = changed
+
+    def __bool__(self) -> bool:
+        """Return True if anything changed."""
+        return bool(self.added or self.removed or self.changed)
+
+    def as_event_data(self) -> dict[str, Any]:
+        """Return a compact, JSON-serialisable summary of the diff."""
+        return {
+            "version": self.version,
+            "added": [t.get("name", "") for t in self.added],
+            "removed": [t.get("name", "") for t in self.removed],
+            "changed": [new.get("name", "") for _, new in self.changed],
+        }
+
+
+class TemplateRegistry:
+    """Indexed store of the user templates of one config entry."""
+
+    def __init__(self, templates: list[dict[str, Any]] | None = None) -> None:
+        """Initialize the registry."""
+        self._templates: dict[str, dict[str, Any]] = {}
+        self.version = 0
+        for template in templates or []:
+            key = template_key(template)
+            if key:
+                self._templates[key] = template
+
+    @property
+    def templates(self) -> list[dict[str, Any]]:
+        """Return all templates in insertion order."""
+        return list(self._templates.values())
+
+    def get(self, name_or_id: str) -> dict[str, Any] | None:
+        """Return a template by id or name."""
+        template = self._templates.get(name_or_id)
+        if template is not None:
+            return template
+        for template in self._templates.values():
+            if template.get("name") == name_or_id:
+                return template
+        return None
+
+    def async_update(self, templates: list[dict[str, Any]]) -> TemplateDiff:
+        """Replace all templates and return what changed."""
+        new: dict[str, dict[str, Any]] = {}
+        for template in templates:
+            key = template_key(template)
+            if key:
+                new[key] = template
+
+        added = [t for key, t in new.items() if key not in self._templates]
+        removed = [t for key, t in self._templates.items() if key not in new]
+        changed = [
+            (self._templates[key], t)
+            for key, t in new.items()
+            if key in self._templates and self._templates[key] != t
+        ]
+
+        self._templates = new
+        diff = TemplateDiff(self.version, added, removed, changed)
+        if diff:
+            self.version += 1
+            diff.version = self.version
+        return diff
@@ -0,0 +1,135 @@
+"""Jinja rendering of template fields for Notify Manager.
+
+Titel und Text einer Vorlage dürfen HA-Jinja enthalten, z.B.
+`{{ states('sensor.waschmaschine_restzeit') }} min`:
+- jedes Feld wird einmal pro Vorlagen-Version kompiliert und gecacht
+- Texte ohne Jinja werden unverändert durchgereicht
+- das Ergebnis wird wiederverwendet, bis sich eine der referenzierten
+  Entities ändert - nur diese Entities werden beobachtet
+- Felder mit `now()`, Zufall oder ganzen Domains/`states` werden jedes Mal gerendert
+Fehlerhafte Vorlagen werden geloggt und als Rohtext gesendet.
+"""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.exceptions import TemplateError
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.template import RenderInfo, Template, is_template_string
+
+from .registry import TemplateDiff, template_key
+
+_LOGGER = logging.getLogger(__name__)
+
+RENDERED_FIELDS = ("title", "message")
+
+
+def _cacheable(info: RenderInfo, source: str) -> bool:
+    """Return True if a result only depends on the entities it references."""
+    return not (
+        info.all_states
+        or info.all_states_lifecycle
+        or info.domains
+        or info.domains_lifecycle
+        or info.has_time
+        or "random" in source
+    )
+
+
+class _CompiledField:
+    """Compiled template of one field and its cached result."""
+
+    __slots__ = ("source", "template", "result", "unsub")
+
+    def __init__(self, source: str, template: Template | None) -> None:
+        """Initialize the field. `template` is None if it did not compile."""
+        self.source = source
+        self.template = template
+        self.result: str | None = None
+        self.unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_reset(self, _event: Event | None = None) -> None:
+        """Drop the cached result and stop watching its entities."""
+        self.result = None
+        if self.unsub is not None:
+            self.unsub()
+            self.unsub = None
+
+
+class TemplateRenderer:
+    """Render the Jinja fields of notification templates."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the renderer."""
+        self.hass = hass
+        # (template key, field) -> compiled field
+        self._fields: dict[tuple[str, str], _CompiledField] = {}
+
+    @callback
+    def async_render_fields(self, template: dict[str, Any]) -> dict[str, str]:
+        """Return the rendered title and message of a template."""
+        key = template_key(template)
+        return {
+            field: self.async_render(key, field, template.get(field) or "")
+            for field in RENDERED_FIELDS
+        }
+
+    @callback
+    def async_render(self, key: str, field: str, source: str) -> str:
+        """Render one field, compiling it on first use or after a change."""
+        if not source or not is_template_string(source):
+            return source
+
+        compiled = self._fields.get((key, field))
+        if compiled is None or compiled.source != source:
+            if compiled is not None:
+                compiled.async_reset()
+            compiled = self._fields[(key, field)] = self._compile(key, field, source)
+
+        if compiled.template is None:
+            return source
+        if compiled.result is not None:
+            return compiled.result
+
+        info = compiled.template.async_render_to_info(parse_result=False)
+        try:
+            result = str(info.result())
+        except TemplateError as err:
+            _LOGGER.warning("Could not render %s of template '%s': %s", field, key, err)
+            return source
+
+        if _cacheable(info, source):
+            compiled.result = result
+            if info.entities:
+                compiled.unsub = async_track_state_change_event(
+                    self.hass, list(info.entities), compiled.async_reset
+                )
+        return result
+
+    def _compile(self, key: str, field: str, source: str) -> _CompiledField:
+        """Compile a field once; invalid templates are remembered as such."""
+        template = Template(source, self.hass)
+        try:
+            template.ensure_valid()
+        except TemplateError as err:
+            _LOGGER.warning("Invalid %s in template '%s': %s", field, key, err)
+            return _CompiledField(source, None)
+        return _CompiledField(source, template)
+
+    @callback
+    def async_invalidate(self, diff: TemplateDiff) -> None:
+        """Forget the compiled fields of changed and removed templates."""
+        keys = {template_key(t) for t in diff.removed}
+        keys.update(template_key(old) for old, _new in diff.changed)
+        for field_key in [k for k in self._fields if k[0] in keys]:
+            self._fields.pop(field_key).async_reset()
+
+    @callback
+    def async_clear(self) -> None:
+        """Forget all compiled fields and stop watching entities."""
+        for compiled in self._fields.values():
+            compiled.async_reset()
+        self._fields.clear()
@@ -8,19 +8,55 @@ When a button is pressed, the entity updates to show which action was triggered.
 """
 from __future__ import annotations
 
+from bisect import bisect_left, insort
+from collections import OrderedDict
 import logging
 from typing import Any
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback, Event
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
+from .const import DOMAIN, CONF_COMPACT_ATTRIBUTES
+from .options import signal_options_updated
+from .registry import (
+    TemplateDiff,
+    signal_templates_updated,
+    template_action_ids,
+    template_key,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+OPTION_NONE = "Keine Auswahl"
+SEPARATOR_TEMPLATES = "── Vorlagen ──"
+SEPARATOR_ACTIONS = "── Action IDs ──"
+
+# Maximum number of action IDs from unknown notifications kept as options
+MAX_DYNAMIC_ACTIONS = 25
+
+# Option sections after OPTION_NONE, in display order
+SECTION_TEMPLATES = "templates"
+SECTION_ACTIONS = "actions"
+SECTION_DYNAMIC = "dynamic"
+SECTIONS = (SECTION_TEMPLATES, SECTION_ACTIONS, SECTION_DYNAMIC)
+
+
+def _remove_sorted(values: list[str], value: str) -> None:
+    """Remove one occurrence of value from a sorted list."""
+    index = bisect_left(values, value)
+    if index < len(values) and values[index] == value:
+        del values[index]
+
+
+def _in_sorted(values: list[str], value: str) -> bool:
+    """Return True if a sorted list contains value."""
+    index = bisect_left(values, value)
+    return index < len(values) and values[index] == value
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -44,10 +80,14 @@ class NotifyManagerSelect(SelectEntity):
     The entity automatically updates when:
     - A notification button is pressed → shows the Action ID
     - A notification is sent from template → shows the template name
-    - Templates are saved → refreshes options
+    - Templates are saved → applies the registry diff to the sorted options
+      and splices only the changed sections into the options list
     """
 
     _attr_has_entity_name = True
+    # Lists grow with the number of templates - not written to the recorder,
+    # full lists are available via the notify_manager/get_select_options command
+    _unrecorded_attributes = frozenset({"available_templates", "available_action_ids"})
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize the select entity."""
@@ -66,45 +106,81 @@ class NotifyManagerSelect(SelectEntity):
         # Option mappings
         self._templates = {}  # id -> name
         self._actions = {}    # action_id -> template_name
+        self._action_owners: dict[str, dict[str, str]] = {}  # action_id -> {template id: name}
+
+        # Sorted option sections (maintained with bisect)
+        self._template_names: list[str] = []
+        self._action_ids: list[str] = []
+        # Actions from other notifications, least recently used first
+        self._dynamic_actions: OrderedDict[str, None] = OrderedDict()
+        # Sections changed since the options were last updated, and the
+        # number of options each section currently takes
+        self._dirty_sections: set[str] = set()
+        self._section_sizes = dict.fromkeys(SECTIONS, 0)
 
         # Initial options
-        self._attr_options = ["Keine Auswahl"]
-        self._attr_current_option = "Keine Auswahl"
+        self._attr_options = [OPTION_NONE]
+        self._attr_current_option = OPTION_NONE
 
     async def async_added_to_hass(self) -> None:
         """Register event listeners when added to hass."""
         await super().async_added_to_hass()
 
         # Load initial options
-        await self._update_options()
+        for template in self._entry.runtime_data.template_registry.templates:
+            self._add_template(template)
+        self._update_options()
+        _LOGGER.debug("Loaded options: %d templates, %d actions",
+                      len(self._template_names), len(self._action_ids))
 
         @callback
-        def handle_templates_updated(event: Event) -> None:
-            """Refresh options when templates are saved."""
-            _LOGGER.debug("Templates updated, refreshing options")
-            self.hass.async_create_task(self._update_options())
-            self.async_write_ha_state()
+        def handle_templates_updated(diff: TemplateDiff) -> None:
+            """Apply template changes and write state if options changed."""
+            for template in diff.removed:
+                self._remove_template(template)
+            for old, new in diff.changed:
+                self._remove_template(old)
+                self._add_template(new)
+            for template in diff.added:
+                self._add_template(template)
+
+            if self._update_options():
+                _LOGGER.debug("Templates updated (version %d), options changed", diff.version)
+                self.async_write_ha_state()
 
-        self.hass.bus.async_listen(f"{DOMAIN}_templates_saved", handle_templates_updated)
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                signal_templates_updated(self._entry.entry_id),
+                handle_templates_updated,
+            )
+        )
+
+        # Option changes (e.g. compact attributes) are applied without reload
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                signal_options_updated(self._entry.entry_id),
+                self.async_write_ha_state,
+            )
+        )
 
         @callback
         def handle_notification_sent(event: Event) -> None:
             """Update when notification is sent from template."""
             template_name = event.data.get("template_name")
             if template_name:
-                # Find display name
-                display = template_name
-                for tid, tname in self._templates.items():
-                    if tid == template_name or tname == template_name:
-                        display = tname
-                        break
-
-                if display in self._attr_options:
+                # Find display name (id -> name, names map to themselves)
+                display = self._templates.get(template_name, template_name)
+
+                if display in self._template_names:
                     self._attr_current_option = display
                     self._last_template = template_name
                     self.async_write_ha_state()
 
-        self.hass.bus.async_listen(f"{DOMAIN}_notification_sent", handle_notification_sent)
+        self.async_on_remove(
+            self.hass.bus.async_listen(f"{DOMAIN}_notification_sent", handle_notification_sent)
+        )
 
         @callback
         def handle_action(event: Event) -> None:
@@ -121,57 +197,118 @@ class NotifyManagerSelect(SelectEntity):
             self._last_template = self._actions.get(action, "")
 
             # Update current option to the action ID
-            if action in self._attr_options:
-                self._attr_current_option = action
-                self.async_write_ha_state()
+            if action in self._action_owners:
                 _LOGGER.info("Button '%s' pressed (template: %s)", action, self._last_template)
+            elif action in self._dynamic_actions:
+                self._dynamic_actions.move_to_end(action)
+                self._dirty_sections.add(SECTION_DYNAMIC)
+                self._update_options()
             else:
-                # Action not in list - add it dynamically
+                # Action not in list - add it dynamically (bounded, LRU eviction)
                 _LOGGER.debug("Action '%s' not in options, adding", action)
-                self._attr_options.append(action)
-                self._attr_current_option = action
-                self.async_write_ha_state()
+                self._dynamic_actions[action] = None
+                while len(self._dynamic_actions) > MAX_DYNAMIC_ACTIONS:
+                    self._dynamic_actions.popitem(last=False)
+                self._dirty_sections.add(SECTION_DYNAMIC)
+                self._update_options()
 
-        self.hass.bus.async_listen("mobile_app_notification_action", handle_action)
-
-    async def _update_options(self) -> None:
-        """Build options list from templates and their action IDs."""
-        options = ["Keine Auswahl"]
-        self._templates = {}
-        self._actions = {}
-
-        # Get templates from storage
-        data = self.hass.data.get(DOMAIN, {}).get(self._entry.entry_id, {})
-        user_templates = data.get("user_templates", [])
-
-        # Collect templates
-        template_names = []
-        for template in user_templates:
-            name = template.get("name", "")
-            template_id = template.get("id", name)
-            if name:
-                self._templates[template_id] = name
-                template_names.append(name)
-
-                # Collect action IDs from buttons
-                for btn in template.get("buttons", []):
-                    action_id = btn.get("action", "")
-                    if action_id:
-                        self._actions[action_id] = name
-
-        # Build options list with sections
-        if template_names:
-            options.append("── Vorlagen ──")
-            options.extend(sorted(template_names))
-
-        action_ids = list(self._actions.keys())
-        if action_ids:
-            options.append("── Action IDs ──")
-            options.extend(sorted(action_ids))
+            self._attr_current_option = action
+            self.async_write_ha_state()
 
+        self.async_on_remove(
+            self.hass.bus.async_listen("mobile_app_notification_action", handle_action)
+        )
+
+    def _add_template(self, template: dict[str, Any]) -> None:
+        """Add a template and its action IDs to the sorted sections."""
+        name = template.get("name", "")
+        if not name:
+            return
+        key = template_key(template)
+        self._templates[key] = name
+        insort(self._template_names, name)
+        self._dirty_sections.add(SECTION_TEMPLATES)
+
+        for action_id in template_action_ids(template):
+            owners = self._action_owners.setdefault(action_id, {})
+            if not owners:
+                insort(self._action_ids, action_id)
+                self._dirty_sections.add(SECTION_ACTIONS)
+                if action_id in self._dynamic_actions:
+                    del self._dynamic_actions[action_id]
+                    self._dirty_sections.add(SECTION_DYNAMIC)
+            owners[key] = name
+            self._actions[action_id] = name
+
+    def _remove_template(self, template: dict[str, Any]) -> None:
+        """Remove a template and its no longer used action IDs."""
+        key = template_key(template)
+        name = self._templates.pop(key, None)
+        if name is None:
+            return
+        _remove_sorted(self._template_names, name)
+        self._dirty_sections.add(SECTION_TEMPLATES)
+
+        for action_id in template_action_ids(template):
+            owners = self._action_owners.get(action_id)
+            if not owners:
+                continue
+            owners.pop(key, None)
+            if owners:
+                self._actions[action_id] = next(reversed(owners.values()))
+            else:
+                del self._action_owners[action_id]
+                self._actions.pop(action_id, None)
+                _remove_sorted(self._action_ids, action_id)
+                self._dirty_sections.add(SECTION_ACTIONS)
+
+    def _section_options(self, section: str) -> list[str]:
+        """Return the options of one section, including its separator."""
+        if section == SECTION_TEMPLATES:
+            return [SEPARATOR_TEMPLATES, *self._template_names] if self._template_names else []
+        if section == SECTION_ACTIONS:
+            return [SEPARATOR_ACTIONS, *self._action_ids] if self._action_ids else []
+        return list(self._dynamic_actions)
+
+    def _update_options(self) -> bool:
+        """Splice the changed sections into the options list.
+
+        Returns True if the options changed; a renamed-back or re-saved
+        template leaves its section equal to the old slice.
+        """
+        if not self._dirty_sections:
+            return False
+
+        # New list object: the previous one may still be part of a state
+        options = self._attr_options[:]
+        changed = False
+        start = 1  # after OPTION_NONE
+        for section in SECTIONS:
+            size = self._section_sizes[section]
+            if section in self._dirty_sections:
+                section_options = self._section_options(section)
+                if options[start:start + size] != section_options:
+                    options[start:start + size] = section_options
+                    size = self._section_sizes[section] = len(section_options)
+                    changed = True
+            start += size
+        self._dirty_sections.clear()
+
+        if not changed:
+            return False
         self._attr_options = options
-        _LOGGER.debug("Updated options: %d templates, %d actions",
-                      len(template_names), len(action_ids))
+        if not self._is_option(self._attr_current_option):
+            self._attr_current_option = OPTION_NONE
+        return True
+
+    def _is_option(self, option: str | None) -> bool:
+        """Return True if option is one of the current options."""
+        return (
+            option == OPTION_NONE
+            or option in self._action_owners
+            or option in self._dynamic_actions
+            or (option is not None and _in_sorted(self._template_names, option))
+        )
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -187,14 +324,16 @@ class NotifyManagerSelect(SelectEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
-        return {
+        attributes = {
             "last_action": self._last_action,
             "last_action_time": self._last_action_time,
             "last_template": self._last_template,
             "reply_text": self._last_reply_text,
-            "available_templates": list(self._templates.values()),
-            "available_action_ids": list(self._actions.keys()),
         }
+        if not self._entry.data.get(CONF_COMPACT_ATTRIBUTES, False):
+            attributes["available_templates"] = list(self._templates.values())
+            attributes["available_action_ids"] = list(self._actions.keys())
+        return attributes
 
     async def async_select_option(self, option: str) -> None:
         """Handle manual option selection (for reset)."""
@@ -12,34 +12,23 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback, Event
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import DOMAIN, CONF_COMPACT_ATTRIBUTES, KNOWN_BUTTON_ACTIONS
+from .health import signal_health_updated
+from .options import signal_options_updated
 
 _LOGGER = logging.getLogger(__name__)
 
-# All known button actions for state options
-KNOWN_BUTTON_ACTIONS = [
-    "CONFIRM",
-    "DISMISS", 
-    "YES",
-    "NO",
-    "ALARM_CONFIRM",
-    "ALARM_SNOOZE",
-    "ALARM_EMERGENCY",
-    "DOOR_UNLOCK",
-    "DOOR_IGNORE",
-    "DOOR_SPEAK",
-    "REPLY",
-]
-
-
 class NotifyManagerLastActionSensor(SensorEntity):
     """Sensor tracking the last clicked button action."""
 
     _attr_has_entity_name = True
+    # Static list - not written to the recorder, full list via WebSocket
+    _unrecorded_attributes = frozenset({"known_actions"})
 
     def __init__(
         self,
@@ -74,20 +63,32 @@ class NotifyManagerLastActionSensor(SensorEntity):
             action = event.data.get("action", "")
             if action:
                 self._state = action
+                # Only keep what conditions and attributes need, not the whole event
                 self._last_data = {
                     "action": action,
                     "timestamp": datetime.now().isoformat(),
                     "reply_text": event.data.get("reply_text"),
-                    "event_data": dict(event.data),
+                    "tag": event.data.get("tag"),
+                    "source_device": event.data.get("sourceDeviceID"),
                 }
-                # Store in hass.data for conditions
-                data = self.hass.data.get(DOMAIN, {}).get(self._entry.entry_id, {})
-                data["last_action"] = self._last_data
+                # Store in the entry runtime data for conditions
+                self._entry.runtime_data.last_action = self._last_data
                 self.async_write_ha_state()
                 _LOGGER.debug("Button action received: %s", action)
         
         # Listen to mobile app notification actions
-        self.hass.bus.async_listen("mobile_app_notification_action", handle_action)
+        self.async_on_remove(
+            self.hass.bus.async_listen("mobile_app_notification_action", handle_action)
+        )
+
+        # Option changes (e.g. compact attributes) are applied without reload
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                signal_options_updated(self._entry.entry_id),
+                self.async_write_ha_state,
+            )
+        )
 
     @property
     def native_value(self) -> str:
@@ -97,11 +98,13 @@ class NotifyManagerLastActionSensor(SensorEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
-        return {
+        attributes = {
             "last_action_time": self._last_data.get("timestamp"),
             "reply_text": self._last_data.get("reply_text"),
-            "known_actions": KNOWN_BUTTON_ACTIONS,
         }
+        if not self._entry.data.get(CONF_COMPACT_ATTRIBUTES, False):
+            attributes["known_actions"] = KNOWN_BUTTON_ACTIONS
+        return attributes
 
 
 async def async_setup_entry(
@@ -115,6 +118,7 @@ async def async_setup_entry(
         NotifyManagerStatsSensor(hass, entry, "notifications_today", "Benachrichtigungen heute"),
         NotifyManagerCategorySensor(hass, entry),
         NotifyManagerLastActionSensor(hass, entry),
+        NotifyManagerDeviceHealthSensor(hass, entry),
     ]
     async_add_entities(sensors)
 
@@ -153,8 +157,7 @@ class NotifyManagerStatsSensor(SensorEntity):
     @property
     def native_value(self) -> int:
         """Return the state of the sensor."""
-        data = self.hass.data.get(DOMAIN, {}).get(self._entry.entry_id, {})
-        history = data.get("notification_history", [])
+        history = self._entry.runtime_data.notification_history
         
         if self._sensor_type == "notifications_sent":
             return len(history)
@@ -168,8 +171,8 @@ class NotifyManagerStatsSensor(SensorEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
-        data = self.hass.data.get(DOMAIN, {}).get(self._entry.entry_id, {})
-        history = data.get("notification_history", [])
+        data = self._entry.runtime_data
+        history = data.notification_history
         
         if not history:
             return {}
@@ -180,7 +183,7 @@ class NotifyManagerStatsSensor(SensorEntity):
         return {
             "last_notification_title": last.get("title") if last else None,
             "last_notification_time": last.get("timestamp") if last else None,
-            "configured_devices": len(data.get("devices", [])),
+            "configured_devices": len(data.devices),
         }
 
 
@@ -213,15 +216,13 @@ class NotifyManagerCategorySensor(SensorEntity):
     @property
     def native_value(self) -> int:
         """Return count of active categories."""
-        data = self.hass.data.get(DOMAIN, {}).get(self._entry.entry_id, {})
-        categories = data.get("config", {}).get("categories", {})
+        categories = self._entry.runtime_data.config.get("categories", {})
         return sum(1 for cat in categories.values() if cat.get("enabled", True))
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return category details."""
-        data = self.hass.data.get(DOMAIN, {}).get(self._entry.entry_id, {})
-        categories = data.get("config", {}).get("categories", {})
+        categories = self._entry.runtime_data.config.get("categories", {})
         
         enabled = []
         disabled = []
@@ -237,3 +238,66 @@ class NotifyManagerCategorySensor(SensorEntity):
             "disabled_categories": disabled,
             "total_categories": len(categories),
         }
+
+
+class NotifyManagerDeviceHealthSensor(SensorEntity):
+    """Sensor showing devices that are skipped by the circuit breaker."""
+
+    _attr_has_entity_name = True
+    # Per-device details change with every send - not written to the recorder
+    _unrecorded_attributes = frozenset({"devices"})
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+    ) -> None:
+        """Initialize the sensor."""
+        self.hass = hass
+        self._entry = entry
+        self._attr_name = "Gerätezustand"
+        self._attr_unique_id = f"{entry.entry_id}_device_health"
+        self._attr_icon = "mdi:cellphone-check"
+
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name="Notify Manager",
+            manufacturer="Custom Integration",
+            model="Notification Manager",
+            sw_version="1.2.5.0",
+            configuration_url="/notify-manager",
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Update the state when a circuit opens or closes."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                signal_health_updated(self._entry.entry_id),
+                self.async_write_ha_state,
+            )
+        )
+
+    def _unavailable(self) -> list[str]:
+        """Return the configured devices with an open circuit."""
+        data = self._entry.runtime_data
+        return [device for device in data.devices if not data.health.available(device)]
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of unavailable devices."""
+        return len(self._unavailable())
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the health per device."""
+        data = self._entry.runtime_data
+        unavailable = self._unavailable()
+        return {
+            "available_devices": [
+                device for device in data.devices if device not in unavailable
+            ],
+            "unavailable_devices": unavailable,
+            "devices": data.health.as_dict(),
+        }
@@ -0,0 +1,201 @@
+"""Camera snapshot cache for Notify Manager.
+
+Statt jedes Gerät über `/api/camera_proxy/<kamera>` ein eigenes Live-Bild holen
+zu lassen, wird pro Versand EIN Snapshot aufgenommen und unter einer
+inhaltsadressierten URL bereitgestellt:
+- nur ein Kamera-Zugriff pro Benachrichtigung
+- alle Empfänger sehen exakt dasselbe Bild
+- Einträge verfallen nach Alter (TTL) und bei Überschreiten der Gesamtgröße
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+import logging
+import time
+
+from aiohttp import hdrs, web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, SNAPSHOT_MAX_BYTES, SNAPSHOT_TTL
+
+_LOGGER = logging.getLogger(__name__)
+
+SNAPSHOT_URL_BASE = f"/api/{DOMAIN}/snapshot"
+CAMERA_PROXY_PREFIX = "/api/camera_proxy/"
+
+_EXTENSIONS = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/gif": ".gif",
+    "image/webp": ".webp",
+}
+
+
+def content_hash(content: bytes) -> str:
+    """Return the content hash of an image (blocking, use executor)."""
+    import hashlib
+
+    return hashlib.sha256(content).hexdigest()[:32]
+
+
+class Snapshot:
+    """One cached camera image."""
+
+    __slots__ = ("content_type", "content", "created")
+
+    def __init__(self, content_type: str, content: bytes) -> None:
+        """Initialize the snapshot."""
+        self.content_type = content_type
+        self.content = content
+        self.created = time.monotonic()
+
+
+class SnapshotCache:
+    """Content-addressed snapshot store, evicted by age and total bytes."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        ttl: float = SNAPSHOT_TTL,
+        max_bytes: int = SNAPSHOT_MAX_BYTES,
+    ) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        # snapshot id -> snapshot, oldest first
+        self._snapshots: OrderedDict[str, Snapshot] = OrderedDict()
+        self._bytes = 0
+
+    @property
+    def size(self) -> int:
+        """Return the number of cached bytes."""
+        return self._bytes
+
+    def __len__(self) -> int:
+        """Return the number of cached snapshots."""
+        return len(self._snapshots)
+
+    def get(self, snapshot_id: str) -> Snapshot | None:
+        """Return a snapshot if it exists and has not expired."""
+        self._evict()
+        return self._snapshots.get(snapshot_id)
+
+    async def async_put(self, content_type: str, content: bytes) -> str:
+        """Store an image and return its URL."""
+        digest = await self.hass.async_add_executor_job(content_hash, content)
+        snapshot_id = digest + _EXTENSIONS.get(content_type, ".jpg")
+
+        existing = self._snapshots.pop(snapshot_id, None)
+        if existing is not None:
+            self._bytes -= len(existing.content)
+        self._snapshots[snapshot_id] = Snapshot(content_type, content)
+        self._bytes += len(content)
+        self._evict()
+
+        return f"{SNAPSHOT_URL_BASE}/{snapshot_id}"
+
+    async def async_capture(self, camera_entity: str) -> str | None:
+        """Take one snapshot of a camera and return its URL (None on failure)."""
+        from homeassistant.components.camera import async_get_image
+
+        try:
+            image = await async_get_image(self.hass, camera_entity)
+        except Exception as err:
+            _LOGGER.warning("Could not capture snapshot of %s: %s", camera_entity, err)
+            return None
+
+        url = await self.async_put(image.content_type, image.content)
+        _LOGGER.debug(
+            "Captured snapshot of %s (%d bytes): %s",
+            camera_entity, len(image.content), url,
+        )
+        return url
+
+    def _evict(self) -> None:
+        """Drop expired snapshots, then the oldest ones until under the byte limit."""
+        deadline = time.monotonic() - self.ttl
+        while self._snapshots:
+            snapshot_id, snapshot = next(iter(self._snapshots.items()))
+            if snapshot.created > deadline and self._bytes <= self.max_bytes:
+                break
+            del self._snapshots[snapshot_id]
+            self._bytes -= len(snapshot.content)
+
+
+def _proxy_camera(url: object) -> str | None:
+    """Return the camera of a camera proxy URL."""
+    if isinstance(url, str) and url.startswith(CAMERA_PROXY_PREFIX):
+        return url[len(CAMERA_PROXY_PREFIX):].split("?", 1)[0]
+    return None
+
+
+def snapshot_camera(data: dict) -> str | None:
+    """Return the camera named by the image or attachment URL.
+
+    A bare `entity_id` is left alone - it is the live camera view of the
+    companion app, not an image to attach.
+    """
+    camera = _proxy_camera(data.get("image"))
+    if camera is None and isinstance(data.get("attachment"), dict):
+        camera = _proxy_camera(data["attachment"].get("url"))
+    return camera
+
+
+async def async_attach_snapshot(hass: HomeAssistant, data: dict) -> dict:
+    """Replace a live camera image by one shared snapshot.
+
+    Returns a copy of `data` with the image/attachment URL pointing to the
+    cached snapshot, or `data` unchanged if there is no camera or the capture
+    failed (then the phones fall back to the camera proxy).
+    """
+    camera_entity = snapshot_camera(data)
+    if camera_entity is None:
+        return data
+
+    url = await async_get_snapshot_cache(hass).async_capture(camera_entity)
+    if url is None:
+        return data
+
+    data = dict(data)
+    if _proxy_camera(data.get("image")) == camera_entity:
+        data["image"] = url
+    attachment = data.get("attachment")
+    if isinstance(attachment, dict) and _proxy_camera(attachment.get("url")) == camera_entity:
+        data["attachment"] = {**attachment, "url": url}
+    return data
+
+
+def async_get_snapshot_cache(hass: HomeAssistant) -> SnapshotCache:
+    """Return the shared snapshot cache, registering its view on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    cache = domain_data.get("_snapshots")
+    if cache is None:
+        cache = domain_data["_snapshots"] = SnapshotCache(hass)
+        hass.http.register_view(NotifyManagerSnapshotView(cache))
+    return cache
+
+
+class NotifyManagerSnapshotView(HomeAssistantView):
+    """Serve cached camera snapshots."""
+
+    url = SNAPSHOT_URL_BASE + "/{snapshot_id}"
+    name = f"api:{DOMAIN}:snapshot"
+
+    def __init__(self, cache: SnapshotCache) -> None:
+        """Initialize the view."""
+        self._cache = cache
+
+    async def get(self, request: web.Request, snapshot_id: str) -> web.Response:
+        """Return a snapshot; the content never changes for an id."""
+        snapshot = self._cache.get(snapshot_id)
+        if snapshot is None:
+            raise web.HTTPNotFound()
+
+        return web.Response(
+            body=snapshot.content,
+            content_type=snapshot.content_type,
+            headers={hdrs.CACHE_CONTROL: f"private, max-age={int(self._cache.ttl)}, immutable"},
+        )
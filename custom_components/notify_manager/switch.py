@@ -7,10 +7,12 @@ from typing import Any
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN, CONF_SHOW_SIDEBAR
+from .options import signal_options_updated
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -56,6 +58,17 @@ class NotifySidebarSwitch(SwitchEntity):
             configuration_url="/notify-manager",
         )
 
+    async def async_added_to_hass(self) -> None:
+        """Follow sidebar changes made in the options flow."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                signal_options_updated(self._entry.entry_id),
+                self.async_write_ha_state,
+            )
+        )
+
     @property
     def is_on(self) -> bool:
         """Return true if sidebar is enabled."""
@@ -71,14 +84,12 @@ class NotifySidebarSwitch(SwitchEntity):
 
     async def _set_sidebar_state(self, show: bool) -> None:
         """Set the sidebar visibility state."""
-        # Update config entry
+        # Update config entry - the update listener only re-registers the
+        # panel, no reload (history and pending actions are kept)
         new_data = {**self._entry.data}
         new_data[CONF_SHOW_SIDEBAR] = show
         self.hass.config_entries.async_update_entry(self._entry, data=new_data)
 
-        # Reload to apply sidebar change
-        await self.hass.config_entries.async_reload(self._entry.entry_id)
-
         self.async_write_ha_state()
         _LOGGER.info("Sidebar visibility set to %s", show)
 
@@ -0,0 +1,133 @@
+"""Per-notification traces for Notify Manager.
+
+Optional (Einstellung `trace_sample_rate`, Prozent der Sendungen): jede
+erfasste Benachrichtigung bekommt einen Trace mit monotonen Zeitstempeln
+ihrer Stationen:
+- `service_call`, `template_lookup`, `payload_build`, `resolution`
+- `queued` (Digest) bzw. `skipped`, `send` und `result` pro Gerät
+- `ack`, wenn ein Button derselben Benachrichtigung (`tag`) gedrückt wird
+Die letzten Traces liegen in einem begrenzten Ring und sind per WebSocket
+(`notify_manager/traces`) nach `tag` oder Korrelations-ID abrufbar.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+import random
+import time
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+MAX_TRACES = 200
+MAX_STAGES = 64
+
+
+class Trace:
+    """Stages of one notification."""
+
+    __slots__ = ("correlation_id", "source", "tag", "started", "created", "stages")
+
+    def __init__(self, correlation_id: str, source: str) -> None:
+        """Start the trace."""
+        self.correlation_id = correlation_id
+        self.source = source
+        self.tag: str | None = None
+        self.started = time.monotonic()
+        self.created = dt_util.utcnow().isoformat()
+        # (stage, ms since start, details)
+        self.stages: list[tuple[str, float, dict[str, Any]]] = []
+
+    def __bool__(self) -> bool:
+        """Return True, the trace is recorded."""
+        return True
+
+    def stage(self, name: str, **details: Any) -> None:
+        """Record a stage."""
+        if len(self.stages) < MAX_STAGES:
+            offset = round((time.monotonic() - self.started) * 1000, 3)
+            self.stages.append((name, offset, details))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the trace as JSON-serialisable dict."""
+        return {
+            "correlation_id": self.correlation_id,
+            "source": self.source,
+            "tag": self.tag,
+            "created": self.created,
+            "stages": [
+                {"stage": name, "t_ms": offset, **details}
+                for name, offset, details in self.stages
+            ],
+        }
+
+
+class _NoTrace:
+    """Stand-in for notifications that are not sampled."""
+
+    __slots__ = ()
+
+    correlation_id = None
+    tag = None
+
+    def __bool__(self) -> bool:
+        """Return False, nothing is recorded."""
+        return False
+
+    def stage(self, name: str, **details: Any) -> None:
+        """Ignore the stage."""
+
+
+NO_TRACE = _NoTrace()
+
+
+class TraceRecorder:
+    """Sample notifications and keep their traces in a bounded ring."""
+
+    def __init__(self, sample_rate: float = 0.0, max_traces: int = MAX_TRACES) -> None:
+        """Initialize the recorder. `sample_rate` is 0..1."""
+        self.sample_rate = sample_rate
+        self.max_traces = max_traces
+        self._traces: OrderedDict[str, Trace] = OrderedDict()
+
+    def start(self, correlation_id: str, source: str, **details: Any) -> Trace | _NoTrace:
+        """Start a trace if this notification is sampled."""
+        if self.sample_rate <= 0 or (
+            self.sample_rate < 1 and random.random() >= self.sample_rate
+        ):
+            return NO_TRACE
+
+        trace = Trace(correlation_id, source)
+        trace.stage("service_call", **details)
+        self._traces[correlation_id] = trace
+        if len(self._traces) > self.max_traces:
+            self._traces.popitem(last=False)
+        return trace
+
+    def record_ack(self, tag: str | None, **details: Any) -> None:
+        """Add an ack stage to the latest trace of a tag."""
+        if not tag or not self._traces:
+            return
+        for trace in reversed(self._traces.values()):
+            if trace.tag == tag:
+                trace.stage("ack", **details)
+                return
+
+    def find(
+        self,
+        tag: str | None = None,
+        correlation_id: str | None = None,
+        limit: int = 20,
+    ) -> list[dict[str, Any]]:
+        """Return the newest traces, filtered by tag or correlation id."""
+        if correlation_id:
+            trace = self._traces.get(correlation_id)
+            return [trace.as_dict()] if trace else []
+
+        found: list[dict[str, Any]] = []
+        for trace in reversed(self._traces.values()):
+            if tag and trace.tag != tag:
+                continue
+            found.append(trace.as_dict())
+            if len(found) >= limit:
+                break
+        return found
@@ -23,6 +23,7 @@ _LOGGER = logging.getLogger(__name__)
 TRIGGER_ACTION_RECEIVED = "action_received"
 TRIGGER_NOTIFICATION_SENT = "notification_sent"
 TRIGGER_NOTIFICATION_CLEARED = "notification_cleared"
+TRIGGER_NOTIFICATION_EXPIRED = "notification_expired"
 
 # Config keys
 CONF_ACTION = "action"
@@ -39,6 +40,7 @@ TRIGGER_ACTION_SCHEMA = vol.Schema(
             TRIGGER_ACTION_RECEIVED,
             TRIGGER_NOTIFICATION_SENT,
             TRIGGER_NOTIFICATION_CLEARED,
+            TRIGGER_NOTIFICATION_EXPIRED,
         ]),
         vol.Optional(CONF_ACTION): cv.string,
         vol.Optional(CONF_ACTIONS): vol.All(cv.ensure_list, [cv.string]),
@@ -77,6 +79,12 @@ async def async_get_triggers(hass: HomeAssistant) -> list[dict[str, Any]]:
             "name": "Benachrichtigung gelöscht",
             "description": "Wird ausgelöst wenn eine Benachrichtigung vom Benutzer gelöscht wurde",
         },
+        {
+            "platform": DOMAIN,
+            "type": TRIGGER_NOTIFICATION_EXPIRED,
+            "name": "Benachrichtigung abgelaufen",
+            "description": "Wird ausgelöst wenn eine Benachrichtigung mit Timeout unbeantwortet abgelaufen ist",
+        },
     ]
 
 
@@ -110,9 +118,14 @@ async def async_attach_trigger(
             if event_data.get("action") not in config[CONF_ACTIONS]:
                 return
         
-        # Filter by device if specified
+        # Filter by device if specified (cleared events name it `device`,
+        # expired events list all devices it was still shown on in `devices`)
         if CONF_DEVICE in config:
-            if event_data.get("device_id") != config[CONF_DEVICE]:
+            device = config[CONF_DEVICE]
+            if (
+                event_data.get("device_id", event_data.get("device")) != device
+                and device not in (event_data.get("devices") or ())
+            ):
                 return
         
         # Filter by category if specified
@@ -151,18 +164,24 @@ async def async_attach_trigger(
         event_type = f"{DOMAIN}_notification_sent"
     elif trigger_type == TRIGGER_NOTIFICATION_CLEARED:
         event_type = f"{DOMAIN}_notification_cleared"
+    elif trigger_type == TRIGGER_NOTIFICATION_EXPIRED:
+        event_type = f"{DOMAIN}_notification_expired"
     else:
         event_type = f"{DOMAIN}_action_received"
     
-    # Also listen to mobile_app events
-    unsub_custom = hass.bus.async_listen(event_type, handle_event)
-    unsub_mobile = hass.bus.async_listen("mobile_app_notification_action", handle_event)
+    unsubs = [hass.bus.async_listen(event_type, handle_event)]
+    # Button presses also come straight from the app; a press acknowledges
+    # the notification, so it must not reach the other trigger types
+    if trigger_type == TRIGGER_ACTION_RECEIVED:
+        unsubs.append(
+            hass.bus.async_listen("mobile_app_notification_action", handle_event)
+        )
     
     @callback
     def async_remove():
         """Remove trigger."""
-        unsub_custom()
-        unsub_mobile()
+        for unsub in unsubs:
+            unsub()
     
     return async_remove
 
@@ -176,6 +195,7 @@ TRIGGER_SCHEMA = vol.All(
                 TRIGGER_ACTION_RECEIVED,
                 TRIGGER_NOTIFICATION_SENT,
                 TRIGGER_NOTIFICATION_CLEARED,
+                TRIGGER_NOTIFICATION_EXPIRED,
             ]),
             vol.Optional(CONF_ACTION): cv.string,
             vol.Optional(CONF_ACTIONS): vol.All(cv.ensure_list, [cv.string]),